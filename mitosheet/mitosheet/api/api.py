@@ -15,6 +15,8 @@ from mitosheet.api.get_datafiles import get_datafiles
 from mitosheet.api.get_dataframe_as_csv import get_dataframe_as_csv
 from mitosheet.api.get_dataframe_as_excel import get_dataframe_as_excel
 from mitosheet.api.get_excel_file_metadata import get_excel_file_metadata
+from mitosheet.api.get_duplicate_counts import get_duplicate_counts
+from mitosheet.api.get_filter_preview import get_filter_preview
 from mitosheet.api.get_path_contents import get_path_contents
 from mitosheet.api.get_path_join import get_path_join
 from mitosheet.api.get_pivot_params import get_pivot_params
@@ -134,6 +136,10 @@ def handle_api_event(
         result = get_unique_value_counts(event, steps_manager)
     elif event["type"] == "get_search_matches":
         result = get_search_matches(event, steps_manager)
+    elif event["type"] == "get_filter_preview":
+        result = get_filter_preview(event, steps_manager)
+    elif event["type"] == "get_duplicate_counts":
+        result = get_duplicate_counts(event, steps_manager)
     elif event["type"] == "get_dataframe_as_excel":
         result = get_dataframe_as_excel(event, steps_manager)
     else:
@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict
+
+from mitosheet.row_fingerprint_utils import get_duplicated
+from mitosheet.steps_manager import StepsManager
+
+
+def get_duplicate_counts(event: Dict[str, Any], steps_manager: StepsManager) -> str:
+    """
+    Sends back a string that can be parsed to a JSON object that contains
+    the number of rows that dropping duplicates on the columns at column_ids
+    would keep and drop, without dropping them.
+
+    Params:
+    -   sheet_index: number - the sheet to drop duplicates from
+    -   column_ids: ColumnID[] - the columns that rows are duplicates in
+    -   keep: 'first' | 'last' | false - which of the duplicates to keep
+    """
+    sheet_index = event['sheet_index']
+    column_ids = event['column_ids']
+    keep = event['keep']
+
+    column_headers = [
+        steps_manager.curr_step.column_ids.get_column_header_by_id(sheet_index, column_id)
+        for column_id in column_ids
+    ]
+    df = steps_manager.dfs[sheet_index]
+
+    # Like the drop duplicates step, we do not drop anything on no columns
+    dropped_rows = 0
+    if len(column_headers) > 0:
+        duplicated = get_duplicated(df, column_headers, keep)
+        if duplicated is None:
+            duplicated = df.duplicated(subset=column_headers, keep=keep).to_numpy()
+        dropped_rows = int(duplicated.sum())
+
+    return json.dumps({
+        'numRows': len(df),
+        'keptRows': len(df) - dropped_rows,
+        'droppedRows': dropped_rows
+    })
@@ -0,0 +1,75 @@
+import json
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from mitosheet.step_performers.filter import (combine_filters,
+                                              get_cached_filter_indexes,
+                                              get_filter_base,
+                                              get_filter_indexes)
+from mitosheet.steps_manager import StepsManager
+
+
+def get_row_counts(num_rows: int, filter_indexes: Optional[pd.Series]) -> Dict[str, int]:
+    """
+    Returns the number of rows that the filter indexes keep and remove, of
+    the num_rows rows they are applied to.
+    """
+    kept_rows = num_rows if filter_indexes is None else int(filter_indexes.sum())
+    return {
+        'keptRows': kept_rows,
+        'removedRows': num_rows - kept_rows
+    }
+
+
+def get_filter_preview(event: Dict[str, Any], steps_manager: StepsManager) -> str:
+    """
+    Sends back a string that can be parsed to a JSON object that contains
+    the number of rows that the passed filters on the column at column_id
+    would keep and remove, without applying them.
+
+    The filters replace the filters currently on the column, like a filter
+    step would. They are counted on the rows that the filters on the other
+    columns keep, both each filter (or group) on its own, and all combined.
+
+    Params:
+    -   sheet_index: number - the sheet to filter
+    -   column_id: ColumnID - the column to filter
+    -   operator: 'And' | 'Or' - how to combine the filters
+    -   filters: the filters and filter groups, as passed to a filter step
+    """
+    sheet_index = event['sheet_index']
+    column_id = event['column_id']
+    operator = event['operator']
+    filters = event['filters']
+
+    column_header = steps_manager.curr_step.column_ids.get_column_header_by_id(sheet_index, column_id)
+
+    # We filter the dataframe that the sheet was filtered from, so we use the filter indexes cached
+    # by the filter steps. If the sheet was changed by another step since it was filtered, we count
+    # the rows of the sheet as it is
+    base_df, column_filters, _ = get_filter_base(steps_manager.curr_step.dfs.get_unmaterialized(sheet_index))
+    other_filter_indexes = [
+        get_cached_filter_indexes(base_df, filtered_column_id, *column_filter)
+        for filtered_column_id, column_filter in column_filters.items()
+        if filtered_column_id != column_id
+    ]
+    other_filter_indexes = [filter_indexes for filter_indexes in other_filter_indexes if filter_indexes is not None]
+    kept_by_other_filters = combine_filters('And', other_filter_indexes) if len(other_filter_indexes) > 0 else None
+    num_rows = len(base_df) if kept_by_other_filters is None else int(kept_by_other_filters.sum())
+
+    def get_kept_row_counts(filter_indexes: Optional[pd.Series]) -> Dict[str, int]:
+        if filter_indexes is not None and kept_by_other_filters is not None:
+            filter_indexes = filter_indexes & kept_by_other_filters
+        return get_row_counts(num_rows, filter_indexes)
+
+    # We cache the combined filters, so applying them after previewing them is fast
+    combined_filter_indexes = get_cached_filter_indexes(base_df, column_id, column_header, operator, filters)
+
+    return json.dumps({
+        'numRows': num_rows,
+        'filters': [
+            get_kept_row_counts(get_filter_indexes(base_df, column_header, 'And', [filter_or_group]))
+            for filter_or_group in filters
+        ],
+        'combined': get_kept_row_counts(combined_filter_indexes)
+    })
@@ -9,8 +9,7 @@ the representation {node: set(adj nodes)}. Note that all
 nodes must be in the graph, even if they have no adj nodes, and
 should just have an empty set in this case.
 """
-from copy import deepcopy
-from typing import Collection, Dict, List, Set
+from typing import Collection, Dict, Iterable, List, Set
 
 
 from mitosheet.errors import MitoError, make_circular_reference_error
@@ -23,6 +22,10 @@ def create_column_evaluation_graph(post_state: State, sheet_index: int) -> Dict[
     """
     Returns a dict from column id -> the other column ids that have formulas
     that depend on that column id.
+
+    NOTE: this reparses every formula in the sheet. The state keeps its own 
+    column_evaluation_graph up to date as the sheet changes, so use that instead
+    where possible.
     """
     column_spreadsheet_code = post_state.column_spreadsheet_code[sheet_index]
     column_headers = post_state.dfs[sheet_index].keys()
@@ -51,27 +54,33 @@ def create_column_evaluation_graph(post_state: State, sheet_index: int) -> Dict[
 
 def visit(column_evaluation_graph: Dict[ColumnID, Set[ColumnID]], node: ColumnID, visited: Dict[ColumnID, bool], finished_order: List[ColumnID], visited_loop: Set[ColumnID]) -> None:
     """
-    Recursive helper function for topological sort. Throws a
-    circular_reference_error if there is a loop.
+    Helper function for topological sort, that DFSs from the node, recording
+    the order nodes finish in. Throws a circular_reference_error if there is a loop.
+
+    NOTE: this uses an explicit stack rather than recursion, so that long chains
+    of formulas do not hit the recursion limit.
     """
-    # Mark the node as visited
+    # Mark the node as visited, and record we visited it during this DFS
     visited[node] = True
-
-    # And record we visited it during this tree of calls to visit
     visited_loop.add(node)
+    stack = [(node, iter(column_evaluation_graph[node]))]
 
-    for adj_node in column_evaluation_graph[node]:
-        if not visited[adj_node]:
-            visit(column_evaluation_graph, adj_node, visited, finished_order, visited_loop)
+    while len(stack) > 0:
+        curr_node, adj_nodes = stack[-1]
+        adj_node = next(adj_nodes, None)
+        if adj_node is None:
+            # Remove so we can visit again from elsewhere, and mark this node as finished
+            stack.pop()
+            visited_loop.remove(curr_node)
+            finished_order.append(curr_node)
+        elif not visited[adj_node]:
+            visited[adj_node] = True
+            visited_loop.add(adj_node)
+            stack.append((adj_node, iter(column_evaluation_graph[adj_node])))
         elif adj_node in visited_loop:
-            # If we have visited this node in this subtree, there is a loop
+            # If we have visited this node in this DFS, there is a loop
             raise make_circular_reference_error()
 
-    # Remove so we can visit again from elsewhere
-    visited_loop.remove(node)
-    # And mark this node as finished
-    finished_order.append(node)
-
 
 def topological_sort_columns(column_evaluation_graph: Dict[ColumnID, Set[ColumnID]]) -> List[ColumnID]:
     """
@@ -116,20 +125,226 @@ def subgraph_from_starting_column_id(column_evaluation_graph: Dict[ColumnID, Set
 
     return column_evaluation_subgraph
 
+def create_column_evaluation_order(column_evaluation_graph: Dict[ColumnID, Set[ColumnID]]) -> Dict[ColumnID, int]:
+    """
+    Returns a dict from column id -> the position of that column id in a topological
+    sort of the column_evaluation_graph. 
+
+    The state keeps this order up to date as the graph changes (see add_column_dependency), 
+    so that we never have to resort the entire graph. Note that the positions are not 
+    necessarily contiguous, we only guarantee that each column comes before its dependents.
+    """
+    return {column_id: index for index, column_id in enumerate(topological_sort_columns(column_evaluation_graph))}
+
+def sort_columns_by_evaluation_order(column_ids: Iterable[ColumnID], column_evaluation_order: Dict[ColumnID, int]) -> List[ColumnID]:
+    """
+    Returns the column_ids in topological order, using the evaluation order.
+    """
+    return sorted(column_ids, key=lambda column_id: column_evaluation_order[column_id])
+
 def topological_sort_dependent_columns(state: State, sheet_index: int, column_id: ColumnID) -> List[ColumnID]:
     """
     Returns a topological sort of all columns that are downstream of
     the passed column_id
     """
-    column_evaluation_graph = create_column_evaluation_graph(state, sheet_index)
+    column_evaluation_graph = state.column_evaluation_graph[sheet_index]
     subgraph = subgraph_from_starting_column_id(column_evaluation_graph, column_id)
-    return topological_sort_columns(subgraph)
+    return sort_columns_by_evaluation_order(subgraph.keys(), state.column_evaluation_order[sheet_index])
 
-def creates_circularity(
+def topological_levels_of_columns(column_evaluation_graph: Dict[ColumnID, Set[ColumnID]], column_evaluation_order: Dict[ColumnID, int]=None) -> List[List[ColumnID]]:
+    """
+    Groups the columns in the graph into levels, where each column is in the level
+    one after the deepest column it depends on. Thus, no columns in the same level
+    depend on each other, and each level only depends on the levels before it.
+
+    Within each level, columns are in topological sort order. If the evaluation order 
+    of the columns is passed, it is used rather than sorting the graph.
+    """
+    if column_evaluation_order is not None:
+        topological_sort = sort_columns_by_evaluation_order(column_evaluation_graph.keys(), column_evaluation_order)
+    else:
+        topological_sort = topological_sort_columns(column_evaluation_graph)
+
+    levels: List[List[ColumnID]] = []
+    column_levels: Dict[ColumnID, int] = {}
+    for column_id in topological_sort:
+        level = column_levels.get(column_id, 0)
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(column_id)
+
+        for adj_column_id in column_evaluation_graph[column_id]:
+            column_levels[adj_column_id] = max(column_levels.get(adj_column_id, 0), level + 1)
+
+    return levels
+
+def topological_levels_of_dependent_columns(state: State, sheet_index: int, column_id: ColumnID) -> List[List[ColumnID]]:
+    """
+    Returns the topological levels of all columns that are downstream of 
+    the passed column_id
+    """
+    column_evaluation_graph = state.column_evaluation_graph[sheet_index]
+    subgraph = subgraph_from_starting_column_id(column_evaluation_graph, column_id)
+    return topological_levels_of_columns(subgraph, state.column_evaluation_order[sheet_index])
+
+def get_column_dependencies(column_evaluation_graph: Dict[ColumnID, Set[ColumnID]], column_id: ColumnID) -> Set[ColumnID]:
+    """
+    Returns the column ids that the formula of the column_id references.
+    """
+    return set(
+        other_column_id for other_column_id, dependents in column_evaluation_graph.items()
+        if column_id in dependents
+    )
+
+def add_column_to_evaluation_graph(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
+        column_id: ColumnID
+    ) -> None:
+    """
+    Adds a column with no dependencies or dependents to the graph, at the end
+    of the evaluation order.
+    """
+    column_evaluation_graph[column_id] = set()
+    column_evaluation_order[column_id] = max(column_evaluation_order.values(), default=-1) + 1
+
+def delete_column_from_evaluation_graph(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
+        column_id: ColumnID
+    ) -> None:
+    """
+    Deletes a column with no dependents from the graph. Removing a column never
+    invalidates the evaluation order of the other columns.
+    """
+    del column_evaluation_graph[column_id]
+    del column_evaluation_order[column_id]
+    for dependents in column_evaluation_graph.values():
+        dependents.discard(column_id)
+
+def _get_reachable_columns_within_order(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
+        starting_column_id: ColumnID,
+        max_order: int
+    ) -> Set[ColumnID]:
+    """
+    Returns the columns that are reachable from the starting_column_id, only
+    going through columns with an evaluation order of at most max_order.
+    """
+    reachable_column_ids = set([starting_column_id])
+    stack = [starting_column_id]
+    while len(stack) > 0:
+        curr_column_id = stack.pop()
+        for adj_column_id in column_evaluation_graph[curr_column_id]:
+            if adj_column_id not in reachable_column_ids and column_evaluation_order[adj_column_id] <= max_order:
+                reachable_column_ids.add(adj_column_id)
+                stack.append(adj_column_id)
+    return reachable_column_ids
+
+def _get_reaching_columns_within_order(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
+        ending_column_id: ColumnID,
+        min_order: int
+    ) -> Set[ColumnID]:
+    """
+    Returns the columns that can reach the ending_column_id, only going 
+    through columns with an evaluation order of at least min_order.
+    """
+    # As the graph only stores dependents, we build the reverse edges of the
+    # columns within the order bounds, as these are the only columns we visit
+    max_order = column_evaluation_order[ending_column_id]
+    dependencies: Dict[ColumnID, List[ColumnID]] = {}
+    for column_id, order in column_evaluation_order.items():
+        if min_order <= order <= max_order:
+            for adj_column_id in column_evaluation_graph[column_id]:
+                dependencies.setdefault(adj_column_id, []).append(column_id)
+
+    reaching_column_ids = set([ending_column_id])
+    stack = [ending_column_id]
+    while len(stack) > 0:
+        curr_column_id = stack.pop()
+        for dependency_column_id in dependencies.get(curr_column_id, []):
+            if dependency_column_id not in reaching_column_ids:
+                reaching_column_ids.add(dependency_column_id)
+                stack.append(dependency_column_id)
+    return reaching_column_ids
+
+def add_column_dependency(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
+        column_id: ColumnID,
+        dependency: ColumnID
+    ) -> None:
+    """
+    Adds an edge to the graph for when the column_id starts to depend on the
+    dependency, and repairs the evaluation order if this edge breaks it. Throws 
+    a circular_reference_error, without changing the graph, if there is a loop.
+
+    This is the Pearce-Kelly algorithm for maintaining a dynamic topological 
+    order: only the columns that are between the two columns in the current order 
+    are ever visited or reordered, rather than the entire graph.
+    """
+    lower_bound = column_evaluation_order[column_id]
+    upper_bound = column_evaluation_order[dependency]
+
+    if dependency == column_id:
+        raise make_circular_reference_error()
+    if upper_bound < lower_bound:
+        # The dependency is already before the column, so the order is still valid
+        column_evaluation_graph[dependency].add(column_id)
+        return
+
+    # Find the columns after the column_id that must move after the dependency
+    forward_column_ids = _get_reachable_columns_within_order(
+        column_evaluation_graph, column_evaluation_order, column_id, upper_bound
+    )
+    if dependency in forward_column_ids:
+        raise make_circular_reference_error()
+    
+    # And the columns before the dependency that must move before the column_id
+    backward_column_ids = _get_reaching_columns_within_order(
+        column_evaluation_graph, column_evaluation_order, dependency, lower_bound
+    )
+
+    # Then, reassign the positions these columns take up, so that all the backward
+    # columns come before all the forward columns, keeping their relative order
+    reordered_column_ids = sort_columns_by_evaluation_order(backward_column_ids, column_evaluation_order) + \
+        sort_columns_by_evaluation_order(forward_column_ids, column_evaluation_order)
+    positions = sorted(column_evaluation_order[column_id] for column_id in reordered_column_ids)
+    for reordered_column_id, position in zip(reordered_column_ids, positions):
+        column_evaluation_order[reordered_column_id] = position
+
+    column_evaluation_graph[dependency].add(column_id)
+
+def set_column_dependencies(
         column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_evaluation_order: Dict[ColumnID, int],
         column_id: ColumnID,
         old_dependencies: Collection[ColumnID],
         new_dependencies: Collection[ColumnID]
+    ) -> None:
+    """
+    Updates the column_evaluation_graph and order in place, for when the formula of 
+    the column_id changes from referencing the old_dependencies to referencing
+    the new_dependencies.
+
+    Throws a circular_reference_error if the new dependencies create a loop. In
+    this case, the graph may be partially updated, so check creates_circularity first 
+    if the graph is still needed.
+    """
+    for old_dependency in old_dependencies:
+        column_evaluation_graph[old_dependency].discard(column_id)
+    for new_dependency in new_dependencies:
+        add_column_dependency(column_evaluation_graph, column_evaluation_order, column_id, new_dependency)
+
+def creates_circularity(
+        column_evaluation_graph: Dict[ColumnID, Set[ColumnID]],
+        column_id: ColumnID,
+        old_dependencies: Collection[ColumnID],
+        new_dependencies: Collection[ColumnID],
+        column_evaluation_order: Dict[ColumnID, int]=None
     ) -> bool:
     """
     Given a column_evaluation_graph, checks if removing the
@@ -138,23 +353,32 @@ def creates_circularity(
 
     Returns False if there is not a circular reference, and returns
     True if there is a circular reference.
-    """
-    # Copy, so we don't modify
-    _column_evaluation_graph = deepcopy(column_evaluation_graph)
 
-    for old_dependency in old_dependencies:
-        _column_evaluation_graph[old_dependency].remove(column_id)
-    for new_dependency in new_dependencies:
-        _column_evaluation_graph[new_dependency].add(column_id)
+    Does not modify the graph. If the evaluation order of the graph is
+    passed, only the columns between the column_id and its new dependencies
+    in this order are visited.
+    """
+    if column_id in new_dependencies:
+        return True
 
-    try:
-        # Errors if there is no toplogical sort possible
-        topological_sort_columns(_column_evaluation_graph)
+    if column_evaluation_order is None:
+        try:
+            # Errors if there is no toplogical sort possible
+            column_evaluation_order = create_column_evaluation_order(column_evaluation_graph)
+        except MitoError as e:
+            return True
 
+    # A loop is created iff the column_id reaches one of its new dependencies. Since 
+    # the old dependencies are edges into the column_id, a path from the column_id 
+    # only uses them if the graph already has a loop, so we don't need to remove them
+    new_dependencies_order = [
+        column_evaluation_order[new_dependency] for new_dependency in new_dependencies
+        if column_evaluation_order[new_dependency] > column_evaluation_order[column_id]
+    ]
+    if len(new_dependencies_order) == 0:
         return False
-    except MitoError as e:
-        # Reports this error
-        return True
-    except Exception as e:
-        # TODO: handle this case with a general error?
-        return True
+
+    reachable_column_ids = _get_reachable_columns_within_order(
+        column_evaluation_graph, column_evaluation_order, column_id, max(new_dependencies_order)
+    )
+    return any(new_dependency in reachable_column_ids for new_dependency in new_dependencies)
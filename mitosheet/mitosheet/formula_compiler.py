@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains helpers for compiling the Python code that a formula parses to
+before it is executed in the sheet.
+
+When a column changes, every formula column downstream of it is recomputed
+in a single pass (see refresh_dependant_columns). Often, many of these formulas
+share sub-expressions, like YEAR(OrderDate) or Price * Quantity. To avoid
+computing these sub-expressions over and over, the formulas in a single
+recompute pass share a SubexpressionCache, and each formula is compiled so
+that any sub-expression that reads a column is only computed once per pass.
+
+Furthermore, as we know the dtypes of the columns in the sheet when compiling
+a formula, we infer the series type of the arguments to each sheet function
+call, and call a version of the sheet function that skips the argument 
+conversions that are a no-op for these types.
+"""
+import ast
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+import pandas as pd
+
+from mitosheet.sheet_functions import FUNCTIONS, ROW_WISE_FUNCTIONS
+from mitosheet.sheet_functions.types.specialize import (
+    SERIES_TYPE_BOOL, SERIES_TYPE_NUMBER, get_series_conversion_targets,
+    get_series_type, specialize_sheet_function)
+
+# The names that the compiled code uses to read the subexpression cache, and
+# to assign the value of the formula. These are not valid function names or 
+# column references, so they cannot conflict with anything in a formula
+SUBEXPRESSION_GET_OR_COMPUTE_NAME = '__mito_subexpression_get_or_compute__'
+FORMULA_VALUE_NAME = '__mito_formula_value__'
+
+# The name of the dataframe that the parsed formula code references
+DF_NAME = 'df'
+
+# The nodes that, outside of sheet function calls and column references, can 
+# appear in a formula that is computed row by row
+ROW_WISE_NODE_TYPES = (
+    ast.Constant, ast.BinOp, ast.UnaryOp, ast.Compare, 
+    ast.operator, ast.unaryop, ast.cmpop, ast.expr_context
+)
+
+# Converting a string series to these series types infers a format from the entire
+# series, so the converted value of a row depends on the other rows in the series
+COLUMN_DEPENDENT_SERIES_CONVERSIONS = {'datetime', 'timedelta'}
+
+
+class SubexpressionCache():
+    """
+    Stores the values of the sub-expressions that have been computed during
+    a single recompute pass, keyed by a hash of the sub-expression itself.
+
+    As a later formula in the pass may overwrite a column, we also keep track
+    of which columns each sub-expression reads, so that when a column is
+    rewritten, any stale sub-expression that reads from it is invalidated.
+
+    As formulas may be evaluated concurrently, each sub-expression is computed
+    while holding a lock for its key, so that formulas that share a sub-expression
+    wait for it to be computed once, rather than all computing it.
+    """
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+        self.column_dependencies: Dict[str, Set[str]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @property
+    def namespace(self) -> Dict[str, Any]:
+        """
+        The global variables that compiled formula code needs to
+        be executed with.
+        """
+        return {
+            SUBEXPRESSION_GET_OR_COMPUTE_NAME: self.get_or_compute,
+        }
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the value of the sub-expression with the given key, computing
+        it with compute if it has not been computed before.
+
+        NOTE: a sub-expression only computes sub-expressions that are strictly
+        smaller than it while holding its lock, so locks are always taken in 
+        the same order, and this cannot deadlock.
+        """
+        if key in self.values:
+            return self.values[key]
+
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self.values:
+                self.values[key] = compute()
+            return self.values[key]
+
+    def invalidate_column(self, column_key: Optional[str]) -> None:
+        """
+        Removes all the cached sub-expressions that read from the
+        column with the given column_key.
+        """
+        if column_key is None:
+            return
+
+        for key, column_keys in list(self.column_dependencies.items()):
+            if column_key in column_keys:
+                self.values.pop(key, None)
+                del self.column_dependencies[key]
+
+
+class CompiledFormula():
+    """
+    The result of compiling the Python code of a formula. Evaluating a formula is 
+    split into two pieces of code, so that formulas can be evaluated concurrently 
+    while the dataframe is only ever written to from one thread:
+    1.  The value_code, an expression which computes the value of the formula.
+    2.  The assign_code, which assigns the value of the formula (stored in the
+        FORMULA_VALUE_NAME variable) to the column that the formula is in.
+
+    We also store the key of the column that the formula writes to, the specialized 
+    sheet functions that the value_code calls, and if the formula is row-wise, which
+    means each row of its value only depends on the same row of the df.
+    """
+
+    def __init__(self, value_code: Any, assign_code: Any, written_column_key: Optional[str], namespace: Dict[str, Callable], is_row_wise: bool) -> None:
+        self.value_code = value_code
+        self.assign_code = assign_code
+        self.written_column_key = written_column_key
+        self.namespace = namespace
+        self.is_row_wise = is_row_wise
+
+    def evaluate(self, df: pd.DataFrame, subexpression_cache: SubexpressionCache) -> Any:
+        """
+        Returns the value of the formula on the df, without modifying the df.
+
+        NOTE: the sheet functions are passed as globals rather than locals, as
+        otherwise they would not be visible from the cached sub-expressions. 
+        """
+        return eval(
+            self.value_code,
+            {**FUNCTIONS, DF_NAME: df, **subexpression_cache.namespace, **self.namespace}
+        )
+
+    def assign(self, df: pd.DataFrame, value: Any) -> None:
+        """
+        Writes the value of the formula to the formula's column in the df.
+        """
+        exec(self.assign_code, {DF_NAME: df, FORMULA_VALUE_NAME: value})
+
+
+def get_column_key(node: ast.AST) -> Optional[str]:
+    """
+    If the node is a reference to a column in the dataframe, returns a key
+    that uniquely identifies that column. Otherwise, returns None.
+    """
+    if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == DF_NAME:
+        return ast.dump(node.slice)
+    return None
+
+
+def get_column_header(node: ast.AST) -> Any:
+    """
+    Returns the column header that a reference to a column in the
+    dataframe refers to.
+    """
+    slice_node = node.slice # type: ignore
+    # Before Python 3.9, the slice is wrapped in an Index node
+    if hasattr(ast, 'Index') and isinstance(slice_node, ast.Index): # type: ignore
+        slice_node = slice_node.value # type: ignore
+    return ast.literal_eval(slice_node)
+
+
+def get_column_keys_in_node(node: ast.AST) -> Set[str]:
+    """
+    Returns the keys of all the columns that are read by the given node.
+    """
+    column_keys = set()
+    for child_node in ast.walk(node):
+        column_key = get_column_key(child_node)
+        if column_key is not None:
+            column_keys.add(column_key)
+    return column_keys
+
+
+class _SubexpressionRewriter(ast.NodeTransformer):
+    """
+    Rewrites every sub-expression that reads from a column into a cache lookup
+    that only computes the sub-expression if it has not been computed before,
+    namely, turning the sub-expression into:
+
+    get_or_compute(key, lambda: sub-expression)
+
+    Note that this is done bottom up, so if a sub-expression is not in the
+    cache, any of its own sub-expressions can still be read from the cache.
+    """
+
+    def __init__(self, subexpression_cache: SubexpressionCache):
+        self.subexpression_cache = subexpression_cache
+
+    def _rewrite_shareable_node(self, node: ast.AST) -> ast.AST:
+        # NOTE: we take the key and dependencies before rewriting the children,
+        # so the key is a hash of the original sub-expression
+        key = ast.dump(node)
+        column_keys = get_column_keys_in_node(node)
+        node = self.generic_visit(node)
+
+        # If the sub-expression does not read any column, it's just a constant, and
+        # so there is no real work to share
+        if len(column_keys) == 0:
+            return node
+
+        self.subexpression_cache.column_dependencies[key] = column_keys
+
+        return ast.Call(
+            func=ast.Name(id=SUBEXPRESSION_GET_OR_COMPUTE_NAME, ctx=ast.Load()),
+            args=[
+                ast.Constant(value=key), 
+                ast.Lambda(
+                    args=ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+                    body=node
+                )
+            ],
+            keywords=[]
+        )
+
+    visit_Call = _rewrite_shareable_node
+    visit_BinOp = _rewrite_shareable_node
+    visit_Compare = _rewrite_shareable_node
+    visit_UnaryOp = _rewrite_shareable_node
+
+
+class _SheetFunctionSpecializer():
+    """
+    Infers the series type of each expression in a formula from the dtypes of the 
+    columns in the dataframe, and replaces each call to a sheet function with a call 
+    to a version of that sheet function specialized to the series types of its arguments.
+
+    The specialized sheet functions are saved in the namespace, under the name that
+    the call is replaced with. We also record if the formula is row-wise, as this 
+    relies on the series types of the arguments to each sheet function.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.namespace: Dict[str, Callable] = {}
+        self.is_row_wise = True
+
+    def specialize(self, node: ast.AST) -> Optional[str]:
+        """
+        Specializes all the sheet function calls within the node, and returns the 
+        series type of the node. Returns None if the node is not known to be a series
+        of a specific series type.
+        """
+        if get_column_key(node) is not None:
+            return self._get_column_series_type(node)
+        elif isinstance(node, ast.Call):
+            return self._specialize_call(node)
+        elif not isinstance(node, ROW_WISE_NODE_TYPES):
+            self.is_row_wise = False
+        
+        child_series_types = [self.specialize(child_node) for child_node in ast.iter_child_nodes(node)]
+        
+        if isinstance(node, ast.Compare):
+            # Comparing a series to anything gives a boolean series
+            if len(node.ops) == 1 and any(series_type is not None for series_type in child_series_types):
+                return SERIES_TYPE_BOOL
+        elif isinstance(node, ast.BinOp):
+            left_series_type, _, right_series_type = child_series_types
+            if isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)):
+                if _is_series_or_constant_of_type(node.left, left_series_type, SERIES_TYPE_NUMBER) \
+                    and _is_series_or_constant_of_type(node.right, right_series_type, SERIES_TYPE_NUMBER) \
+                    and (left_series_type is not None or right_series_type is not None):
+                    return SERIES_TYPE_NUMBER
+            elif isinstance(node.op, (ast.BitAnd, ast.BitOr, ast.BitXor)):
+                if left_series_type == SERIES_TYPE_BOOL and right_series_type == SERIES_TYPE_BOOL:
+                    return SERIES_TYPE_BOOL
+        elif isinstance(node, ast.UnaryOp):
+            _, operand_series_type = child_series_types
+            if isinstance(node.op, (ast.USub, ast.UAdd)) and operand_series_type == SERIES_TYPE_NUMBER:
+                return SERIES_TYPE_NUMBER
+            elif isinstance(node.op, ast.Invert) and operand_series_type == SERIES_TYPE_BOOL:
+                return SERIES_TYPE_BOOL
+
+        return None
+
+    def _get_column_series_type(self, node: ast.AST) -> Optional[str]:
+        try:
+            column_header = get_column_header(node)
+            series = self.df[column_header]
+        except:
+            # If the column does not exist, executing the formula will report this
+            return None
+
+        # If there are multiple columns with this header, then this is not a series
+        if not isinstance(series, pd.Series):
+            return None
+        return get_series_type(str(series.dtype))
+
+    def _specialize_call(self, node: ast.Call) -> Optional[str]:
+        arg_series_types = [self.specialize(arg) for arg in node.args]
+        for keyword in node.keywords:
+            self.specialize(keyword.value)
+
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            self.is_row_wise = False
+            return None
+        if len(node.keywords) > 0 or any(isinstance(arg, ast.Starred) for arg in node.args):
+            self.is_row_wise = False
+            return None
+
+        sheet_function = FUNCTIONS[node.func.id]
+        specialized_sheet_function = specialize_sheet_function(sheet_function, arg_series_types)
+        if node.func.id not in ROW_WISE_FUNCTIONS or \
+            len(get_series_conversion_targets(specialized_sheet_function).intersection(COLUMN_DEPENDENT_SERIES_CONVERSIONS)) > 0:
+            self.is_row_wise = False
+
+        if specialized_sheet_function is not sheet_function:
+            specialized_name = f'__mito_{node.func.id}_{"_".join(str(series_type) for series_type in arg_series_types)}__'
+            self.namespace[specialized_name] = specialized_sheet_function
+            node.func = ast.Name(id=specialized_name, ctx=ast.Load())
+
+        # We don't know the output type of a sheet function, as it may fail to cast its output
+        return None
+
+
+def _is_series_or_constant_of_type(node: ast.AST, series_type: Optional[str], target_series_type: str) -> bool:
+    """
+    Returns True if the node is a series of the target_series_type, or if the
+    node is a constant that is of this type.
+    """
+    if series_type is not None:
+        return series_type == target_series_type
+    if isinstance(node, ast.Constant) and target_series_type == SERIES_TYPE_NUMBER:
+        return isinstance(node.value, (int, float)) and not isinstance(node.value, bool)
+    return False
+
+
+def compile_formula(
+        python_code: str,
+        df: pd.DataFrame,
+        subexpression_cache: SubexpressionCache
+    ) -> CompiledFormula:
+    """
+    Compiles the python_code that a formula parses to (e.g. df['C'] = YEAR(df['A']) + 1)
+    before it is executed on the df. Namely:
+    1.  Replaces all sheet function calls with versions of the sheet functions that are
+        specialized to the dtypes of the columns in the df that they are called on.
+    2.  Shares all of its sub-expressions that read from a column through the 
+        subexpression_cache with any other formulas compiled with the same cache.
+
+    The python_code must be a single assignment to a column in the df.
+
+    NOTE: as the specialization relies on the dtypes of the columns in the df, the 
+    compiled code must be executed before any of these columns change.
+    """
+    statement = ast.parse(python_code).body[0]
+    if not isinstance(statement, ast.Assign) or len(statement.targets) != 1:
+        raise ValueError(f'Formula code must assign to a single column, got {python_code}')
+
+    target = statement.targets[0]
+    written_column_key = get_column_key(target)
+    sheet_function_specializer = _SheetFunctionSpecializer(df)
+    sheet_function_specializer.specialize(statement.value)
+    value = _SubexpressionRewriter(subexpression_cache).visit(statement.value)
+
+    value_module = ast.fix_missing_locations(ast.Expression(body=value))
+    assign_module = ast.fix_missing_locations(ast.Module(
+        body=[ast.Assign(targets=[target], value=ast.Name(id=FORMULA_VALUE_NAME, ctx=ast.Load()))],
+        type_ignores=[]
+    ))
+    return CompiledFormula(
+        compile(value_module, '<formula>', 'eval'),
+        compile(assign_module, '<formula>', 'exec'),
+        written_column_key,
+        sheet_function_specializer.namespace,
+        sheet_function_specializer.is_row_wise
+    )
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains the codes of the columns of dataframes, which are combined into row
+fingerprints, so that the rows that are duplicates on any subset of columns
+can be found without hashing every value of every row again.
+
+The code of a value is the position of the value in the distinct values of its
+column, so two values have the same code exactly when pandas considers them
+duplicates. Combining the codes of a row gives a 64 bit fingerprint of the row
+that is different for every distinct row, rather than a hash that can collide.
+
+Like sorted indexes, column codes are cached by the id of the dataframe and
+the column header, as the dataframes in a state are never modified, and are
+removed when the dataframe is garbage collected.
+"""
+import weakref
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.types import ColumnHeader
+
+MAX_FINGERPRINT = np.iinfo(np.int64).max
+
+# For each dataframe, the codes of each column, and the number of distinct codes, 
+# or None if the column cannot be given codes
+_column_codes: Dict[int, Dict[ColumnHeader, Optional[Tuple[np.ndarray, int]]]] = {}
+
+
+def has_different_missing_values(series: pd.Series) -> bool:
+    """
+    Returns True if the column has more than one kind of missing value (e.g. None 
+    and NaN). pd.factorize gives all missing values the same code, but depending on
+    the version of pandas, df.duplicated considers them different values.
+    """
+    if series.dtype != object:
+        return False
+    missing_values = series.to_numpy()[pd.isna(series).to_numpy()]
+    # Every NaN is a float, and all NaNs are duplicates of each other
+    return len({float if isinstance(value, float) else type(value) for value in missing_values}) > 1
+
+
+def get_column_codes(df: pd.DataFrame, column_header: ColumnHeader) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Returns the code of each value in the given column of the dataframe, where
+    missing values have the code 0, and the number of distinct codes. Returns 
+    None if the values in the column cannot be hashed, or if the column has 
+    different kinds of missing values.
+    """
+    series = df[column_header]
+    if not isinstance(series, pd.Series):
+        return None
+
+    if id(df) not in _column_codes:
+        _column_codes[id(df)] = {}
+        weakref.finalize(df, _column_codes.pop, id(df), None)
+    column_codes = _column_codes[id(df)]
+
+    if column_header not in column_codes:
+        column_codes[column_header] = None
+        if not has_different_missing_values(series):
+            try:
+                codes, uniques = pd.factorize(series)
+                column_codes[column_header] = (codes.astype(np.int64) + 1, len(uniques) + 1)
+            except TypeError:
+                # Columns with unhashable values (e.g. lists) cannot be factorized
+                pass
+    return column_codes[column_header]
+
+
+def get_row_fingerprints(df: pd.DataFrame, column_headers: List[ColumnHeader]) -> Optional[np.ndarray]:
+    """
+    Returns a fingerprint of each row of the dataframe, made from the values in 
+    the given columns, or None if any of these columns cannot be given codes. Rows
+    have the same fingerprint exactly when df.duplicated considers them duplicates.
+    """
+    row_fingerprints = np.zeros(len(df), dtype=np.int64)
+    num_fingerprints = 1
+    for column_header in column_headers:
+        codes_and_num_codes = get_column_codes(df, column_header)
+        if codes_and_num_codes is None:
+            return None
+        codes, num_codes = codes_and_num_codes
+
+        # If combining the fingerprints with the codes could overflow, we first number
+        # the fingerprints that actually occur from 0, which there are at most len(df) of
+        if num_fingerprints * num_codes > MAX_FINGERPRINT:
+            row_fingerprints, unique_fingerprints = pd.factorize(row_fingerprints)
+            num_fingerprints = len(unique_fingerprints)
+
+        row_fingerprints = row_fingerprints * num_codes + codes
+        num_fingerprints *= num_codes
+    return row_fingerprints
+
+
+def get_duplicated(df: pd.DataFrame, column_headers: List[ColumnHeader], keep: Union[str, bool]) -> Optional[np.ndarray]:
+    """
+    Returns if each row of the dataframe is a duplicate in the given columns, exactly
+    like df.duplicated(subset=column_headers, keep=keep), or None if the columns cannot
+    be given codes, in which case the caller should use pandas.
+    """
+    row_fingerprints = get_row_fingerprints(df, column_headers)
+    if row_fingerprints is None:
+        return None
+    return pd.Series(row_fingerprints, copy=False).duplicated(keep=keep).to_numpy()
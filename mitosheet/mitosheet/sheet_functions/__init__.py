@@ -14,6 +14,28 @@ from mitosheet.sheet_functions.misc_functions import *
 
 FUNCTIONS = dict(NUMBER_FUNCTIONS, **STRING_FUNCTIONS, **DATE_FUNCTIONS, **CONTROL_FUNCTIONS, **MISC_FUNCTIONS)
 
+# Row-wise functions compute each row of their result from only that same row of 
+# their arguments, so a formula that only uses them can be recomputed for just one row.
+# Aggregate functions compute each row of their result from every row of their arguments.
+# NOTE: any function that is not tagged as row-wise is treated as an aggregate
+AGGREGATE_FUNCTIONS = {
+    'AVERAGEIF', 'CORR', 'COUNTIF', 'KURT', 'MAXIF', 'MINIF', 'SKEW', 'STDEV', 'SUMIF', 'VAR'
+}
+ROW_WISE_FUNCTIONS = {
+    # Number functions
+    'ABS', 'AVG', 'FLOAT', 'INT', 'EXP', 'MAX', 'MIN', 'MULTIPLY', 'POWER', 'ROUND', 'SUM', 'VALUE',
+    # String functions
+    'CLEAN', 'CONCAT', 'FIND', 'LEFT', 'LEN', 'LOWER', 'MID', 'PROPER', 'RIGHT', 'SUBSTITUTE', 'TEXT', 'TRIM', 'UPPER',
+    # Date functions
+    'DATEVALUE', 'DAY', 'ENDOFBUSINESSMONTH', 'ENDOFMONTH', 'HOUR', 'MINUTE', 'MONTH', 'QUARTER',
+    'STARTOFBUSINESSMONTH', 'STARTOFMONTH', 'STRIPTIMETOMINUTES', 'STRIPTIMETOHOURS', 'STRIPTIMETODAYS',
+    'STRIPTIMETOMONTHS', 'STRIPTIMETOYEARS', 'SECOND', 'WEEK', 'WEEKDAY', 'YEAR',
+    # Control functions
+    'AND', 'BOOL', 'IF', 'OR',
+    # Misc functions
+    'FILLNAN', 'TYPE'
+}
+
 # Overwrite __all__ so when you run from mitosheet.sheet_functions import *, it just imports the functions themselves!
 __all__ = [
     func for func in FUNCTIONS.keys()
@@ -14,10 +14,12 @@ in more detail in docs/README.md.
 NOTE: This file is alphabetical order!
 """
 import functools
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from mitosheet.sheet_functions.sheet_function_utils import (
-    fill_series_with_one_index, try_extend_series_to_index)
+    fill_series_with_one_index)
 from mitosheet.sheet_functions.types.decorators import (
     convert_arg_to_series_type, convert_args_to_series_type, fill_nans,
     filter_nans, handle_sheet_function_errors)
@@ -128,13 +130,45 @@ def IF(condition: pd.Series, true_series: pd.Series, false_series: pd.Series) ->
         ]
     }
     """
-    true_series = try_extend_series_to_index(true_series, condition.index)
-    false_series = try_extend_series_to_index(false_series, condition.index)
-
-    return pd.Series(
-        data=[true_series.loc[i] if c else false_series.loc[i] for i, c in condition.iteritems()],
-        index=condition.index
-    )
+    # If there are no rows, there is no dtype to keep
+    if len(condition) == 0:
+        return pd.Series(data=[], index=condition.index, dtype='float64')
+
+    mask = condition.to_numpy(dtype=bool)
+    true_value = _get_if_branch_value(true_series, condition.index)
+    false_value = _get_if_branch_value(false_series, condition.index)
+
+    # If both branches have the same dtype, then we keep this dtype
+    if true_series.dtype == false_series.dtype and true_series.dtype != 'object':
+        if isinstance(true_value, pd.Series):
+            return true_value.where(mask, false_value)
+        elif isinstance(false_value, pd.Series):
+            return false_value.mask(mask, true_value)
+        else:
+            return pd.Series(true_value, index=condition.index, dtype=true_series.dtype).where(mask, false_value)
+
+    # Otherwise, we pick the values into an object array, and then infer the dtype 
+    # from the values that are picked, as if the series was built from a list
+    result = np.empty(len(mask), dtype=object)
+    result[mask] = true_value[mask].to_numpy(dtype=object) if isinstance(true_value, pd.Series) else true_value
+    result[~mask] = false_value[~mask].to_numpy(dtype=object) if isinstance(false_value, pd.Series) else false_value
+    return pd.Series(data=result, index=condition.index).infer_objects()
+
+
+def _get_if_branch_value(branch_series: pd.Series, index: pd.Index) -> Any:
+    """
+    Helper for IF that returns the value of a branch with the rows in the
+    same order as the given index. If the branch is a constant, returns the 
+    constant itself, so that it is never extended to the length of the index.
+    """
+    if branch_series.size == 1 and len(index) != 1:
+        return branch_series.iloc[0]
+    if branch_series.index.equals(index):
+        return branch_series
+    # As we may be passed a constant with a single row, we take the rows in order
+    if branch_series.size == 1:
+        return pd.Series(branch_series.to_numpy(), index=index)
+    return branch_series.reindex(index)
 
 
 @handle_sheet_function_errors
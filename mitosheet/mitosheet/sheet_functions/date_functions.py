@@ -13,6 +13,9 @@ in more detail in docs/README.md.
 
 NOTE: This file is alphabetical order!
 """
+from typing import Callable
+
+import numpy as np
 import pandas as pd
 
 from mitosheet.sheet_functions.types.decorators import convert_arg_to_series_type, filter_nans, handle_sheet_function_errors
@@ -27,6 +30,47 @@ def to_start(t: pd.Timestamp, freq: pd.DateOffset) -> pd.Timestamp:
         return freq.rollback(t.floor("D"))
 
 
+def apply_to_days(
+        datetime_series: pd.Series, 
+        days_function: Callable[[np.ndarray], np.ndarray], 
+        tz_aware_function: Callable[[pd.Series], pd.Series]
+    ) -> pd.Series:
+    """
+    Calls the days_function on the days of the datetime_series, as a datetime64[D]
+    array, so that we can compute month and business day boundaries on the
+    entire array at once, rather than on each timestamp one by one. NaT days
+    stay NaT, as NumPy propagates them through all datetime arithmetic.
+
+    As datetime64 arrays are always timezone naive, for a timezone aware series
+    we instead return the tz_aware_function of the series.
+    """
+    if datetime_series.dt.tz is not None:
+        return tz_aware_function(datetime_series)
+
+    days = datetime_series.to_numpy().astype('datetime64[D]')
+    return pd.Series(
+        days_function(days).astype('datetime64[ns]'), 
+        index=datetime_series.index, 
+        name=datetime_series.name
+    )
+
+
+def get_start_of_month(days: np.ndarray) -> np.ndarray:
+    return days.astype('datetime64[M]').astype('datetime64[D]')
+
+
+def get_start_of_business_month(days: np.ndarray) -> np.ndarray:
+    """
+    Returns the most recent first business day of a month, on or before each day,
+    just like rolling back to a BMonthBegin offset does.
+    """
+    months = days.astype('datetime64[M]')
+    start_of_business_month = np.busday_offset(months.astype('datetime64[D]'), 0, roll='forward')
+    # Days before the first business day of their month roll back to the previous month
+    previous_start_of_business_month = np.busday_offset((months - 1).astype('datetime64[D]'), 0, roll='forward')
+    return np.where(days < start_of_business_month, previous_start_of_business_month, start_of_business_month)
+
+
 @handle_sheet_function_errors
 @filter_nans
 @convert_arg_to_series_type(
@@ -276,7 +320,11 @@ def STARTOFBUSINESSMONTH(datetime_series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return datetime_series.apply(lambda t: to_start(t, pd.tseries.offsets.BMonthBegin(n=1)))
+    return apply_to_days(
+        datetime_series, 
+        get_start_of_business_month, 
+        lambda series: series.apply(lambda t: to_start(t, pd.tseries.offsets.BMonthBegin(n=1)))
+    )
 
 
 @handle_sheet_function_errors
@@ -304,7 +352,11 @@ def STARTOFMONTH(datetime_series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return datetime_series.apply(lambda t: to_start(t, pd.tseries.offsets.MonthBegin(n=1)))
+    return apply_to_days(
+        datetime_series, 
+        get_start_of_month, 
+        lambda series: series.apply(lambda t: to_start(t, pd.tseries.offsets.MonthBegin(n=1)))
+    )
 
 
 
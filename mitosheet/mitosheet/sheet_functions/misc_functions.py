@@ -18,6 +18,7 @@ import datetime
 
 from mitosheet.sheet_functions.sheet_function_utils import try_extend_series_to_index
 from mitosheet.sheet_functions.types.decorators import filter_nans, convert_arg_to_series_type, handle_sheet_function_errors
+from mitosheet.sheet_functions.types.utils import is_category_dtype
 
 
 @handle_sheet_function_errors
@@ -108,6 +109,16 @@ def TYPE(series: pd.Series) -> pd.Series:
             return 'timedelta'
         return 'object'
 
+    if is_category_dtype(str(series.dtype)):
+        # We only get the type of each category once. Missing values have a code of -1,
+        # which takes the NaN type we add to the end
+        category_types = pd.Series(series.cat.categories, dtype='object').apply(get_element_type).tolist() + ['NaN']
+        return pd.Series(
+            np.array(category_types, dtype='object')[series.cat.codes.to_numpy()],
+            index=series.index,
+            name=series.name
+        )
+
     return series.apply(get_element_type).astype('str')
 
 
@@ -19,7 +19,9 @@ import pandas as pd
 import numpy as np
 
 from mitosheet.sheet_functions.types.decorators import fill_nans, filter_nans, convert_args_to_series_type, convert_arg_to_series_type, handle_sheet_function_errors
-from mitosheet.sheet_functions.sheet_function_utils import try_extend_series_to_index, fill_series_with_one_index, fill_series_with_one_index
+from mitosheet.sheet_functions.sheet_function_utils import try_extend_series_to_index, fill_series_with_one_index, get_conditional_aggregate, reduce_series_with_shared_index, round_to_decimals, vectorized
+from mitosheet.sheet_functions.types.to_float_series import to_float_series
+from mitosheet.sheet_functions.types.utils import is_int_dtype
 
 @handle_sheet_function_errors
 @convert_arg_to_series_type(
@@ -80,6 +82,58 @@ def AVG(*argv: pd.Series) -> pd.Series:
     return arg_sum / len(argv)
 
 
+@handle_sheet_function_errors
+@convert_arg_to_series_type(
+    0,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    1,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    2,
+    'float',
+    'error',
+    ('default', np.NaN),
+    optional=True
+)
+# We don't use the @filter_nans decorator because the aggregation ignores NaN values
+def AVERAGEIF(criteria_range: pd.Series, criteria: pd.Series, average_range: pd.Series=None) -> pd.Series:
+    """
+    {
+        "function": "AVERAGEIF",
+        "description": "Returns the average of the values in the rows where the range is equal to the criteria. If no rows match, returns NaN.",
+        "examples": [
+            "AVERAGEIF(Region, Region, Sales)",
+            "AVERAGEIF(Region, 'West', Sales)"
+        ],
+        "syntax": "AVERAGEIF(range, criteria, [average_range])",
+        "syntax_elements": [{
+                "element": "range",
+                "description": "The series to compare to the criteria."
+            },
+            {
+                "element": "criteria",
+                "description": "The value or series to compare the range to. A series is compared row by row."
+            },
+            {
+                "element": "average_range [OPTIONAL]",
+                "description": "The numbers to average. Defaults to the range itself."
+            }
+        ]
+    }
+    """
+    if average_range is None:
+        average_range = to_float_series(criteria_range)
+
+    return get_conditional_aggregate(criteria_range, criteria, average_range, 'mean', np.NaN)
+
+
 @handle_sheet_function_errors
 @convert_arg_to_series_type(
     0,
@@ -119,6 +173,45 @@ def CORR(s1: pd.Series, s2: pd.Series) -> pd.Series:
         index=s1.index
     )
 
+
+@handle_sheet_function_errors
+@convert_arg_to_series_type(
+    0,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    1,
+    'series',
+    'error',
+    'error'
+)
+# We don't use the @filter_nans decorator because the aggregation ignores NaN values
+def COUNTIF(criteria_range: pd.Series, criteria: pd.Series) -> pd.Series:
+    """
+    {
+        "function": "COUNTIF",
+        "description": "Returns the number of rows where the range is equal to the criteria.",
+        "examples": [
+            "COUNTIF(Region, Region)",
+            "COUNTIF(Region, 'West')"
+        ],
+        "syntax": "COUNTIF(range, criteria)",
+        "syntax_elements": [{
+                "element": "range",
+                "description": "The series to compare to the criteria."
+            },
+            {
+                "element": "criteria",
+                "description": "The value or series to compare the range to. A series is compared row by row."
+            }
+        ]
+    }
+    """
+    return get_conditional_aggregate(criteria_range, criteria, criteria_range, 'size', 0)
+
+
 @handle_sheet_function_errors
 @filter_nans
 @convert_arg_to_series_type(
@@ -231,11 +324,67 @@ def MAX(*argv: pd.Series) -> pd.Series:
         ]
     }
     """
-    # We make a dataframe out of the series, and take the max between all the columns
+    # We take the max between all the series, directly on their arrays if we can, and
+    # otherwise by making a dataframe out of the series
     argv = fill_series_with_one_index(argv)
+    result = reduce_series_with_shared_index(argv, np.fmax)
+    if result is not None:
+        return result
     return pd.DataFrame(argv).max()
 
 
+@handle_sheet_function_errors
+@convert_arg_to_series_type(
+    0,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    1,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    2,
+    'float',
+    'error',
+    ('default', np.NaN),
+    optional=True
+)
+# We don't use the @filter_nans decorator because the aggregation ignores NaN values
+def MAXIF(criteria_range: pd.Series, criteria: pd.Series, max_range: pd.Series=None) -> pd.Series:
+    """
+    {
+        "function": "MAXIF",
+        "description": "Returns the maximum of the values in the rows where the range is equal to the criteria. If no rows match, returns 0.",
+        "examples": [
+            "MAXIF(Region, Region, Sales)",
+            "MAXIF(Region, 'West', Sales)"
+        ],
+        "syntax": "MAXIF(range, criteria, [max_range])",
+        "syntax_elements": [{
+                "element": "range",
+                "description": "The series to compare to the criteria."
+            },
+            {
+                "element": "criteria",
+                "description": "The value or series to compare the range to. A series is compared row by row."
+            },
+            {
+                "element": "max_range [OPTIONAL]",
+                "description": "The numbers to take the maximum of. Defaults to the range itself."
+            }
+        ]
+    }
+    """
+    if max_range is None:
+        max_range = to_float_series(criteria_range)
+
+    return get_conditional_aggregate(criteria_range, criteria, max_range, 'max', 0)
+
+
 @handle_sheet_function_errors
 @filter_nans
 # NOTE: we set the default to inf, so that we ignore values that fail to convert
@@ -261,11 +410,67 @@ def MIN(*argv: pd.Series) -> pd.Series:
         ]
     }
     """
-    # We make a dataframe out of the series, and take the min between all the columns
+    # We take the min between all the series, directly on their arrays if we can, and
+    # otherwise by making a dataframe out of the series
     argv = fill_series_with_one_index(argv)
+    result = reduce_series_with_shared_index(argv, np.fmin)
+    if result is not None:
+        return result
     return pd.DataFrame(argv).min()
 
 
+@handle_sheet_function_errors
+@convert_arg_to_series_type(
+    0,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    1,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    2,
+    'float',
+    'error',
+    ('default', np.NaN),
+    optional=True
+)
+# We don't use the @filter_nans decorator because the aggregation ignores NaN values
+def MINIF(criteria_range: pd.Series, criteria: pd.Series, min_range: pd.Series=None) -> pd.Series:
+    """
+    {
+        "function": "MINIF",
+        "description": "Returns the minimum of the values in the rows where the range is equal to the criteria. If no rows match, returns 0.",
+        "examples": [
+            "MINIF(Region, Region, Sales)",
+            "MINIF(Region, 'West', Sales)"
+        ],
+        "syntax": "MINIF(range, criteria, [min_range])",
+        "syntax_elements": [{
+                "element": "range",
+                "description": "The series to compare to the criteria."
+            },
+            {
+                "element": "criteria",
+                "description": "The value or series to compare the range to. A series is compared row by row."
+            },
+            {
+                "element": "min_range [OPTIONAL]",
+                "description": "The numbers to take the minimum of. Defaults to the range itself."
+            }
+        ]
+    }
+    """
+    if min_range is None:
+        min_range = to_float_series(criteria_range)
+
+    return get_conditional_aggregate(criteria_range, criteria, min_range, 'min', 0)
+
+
 @handle_sheet_function_errors
 @filter_nans
 @convert_args_to_series_type('float', 'skip', ('default', 1))
@@ -335,6 +540,25 @@ def POWER(series, power):
     return series.pow(power)
 
 
+# Rounding to more decimals than this does the same as rounding to this many
+MAX_ROUND_DECIMALS = 2000
+
+
+def round_each_row(series: pd.Series, decimals: pd.Series=None) -> pd.Series:
+    """
+    Rounds each number to the decimals in its row with Python's round. ROUND
+    returns identical results to this.
+    """
+    if decimals is None:
+        return series.round()
+
+    decimals = try_extend_series_to_index(decimals, series.index)
+    return pd.Series(
+        [round(num, int(dec) if float(dec).is_integer() else dec) for num, dec in zip(series, decimals)],
+        index=series.index
+    )
+
+
 @handle_sheet_function_errors
 @filter_nans
 @convert_arg_to_series_type(
@@ -350,6 +574,7 @@ def POWER(series, power):
     ('default', 2),
     optional=True
 )
+@vectorized(round_each_row)
 def ROUND(series, decimals=None):
     """
     {
@@ -375,12 +600,21 @@ def ROUND(series, decimals=None):
     # If no decimals option is passed, round to no decimals
     if decimals is None:
         return series.round()
-    
-    # Otherwise, fill the decimals to length
-    decimals = try_extend_series_to_index(decimals, series.index)
+
+    # Otherwise, fill the decimals to length, which must all be integers
+    decimals = try_extend_series_to_index(decimals, series.index).to_numpy()[:len(series)]
+    if not (np.isfinite(decimals) & (np.trunc(decimals) == decimals)).all():
+        raise ValueError('Can only round to an integer number of decimals')
+    decimals = np.clip(decimals, -MAX_ROUND_DECIMALS, MAX_ROUND_DECIMALS).astype('int64')
+
+    if is_int_dtype(str(series.dtype)):
+        # Rounding an integer to a positive number of decimals does not change it
+        if (decimals >= 0).all():
+            return pd.Series(series.to_numpy().copy(), index=series.index)
+        return round_each_row(series, pd.Series(decimals, index=series.index))
 
     return pd.Series(
-        [round(num, dec) for num, dec in zip(series, decimals)],
+        round_to_decimals(series.to_numpy(dtype='float64'), decimals),
         index=series.index
     )
 
@@ -447,6 +681,58 @@ def SUM(*argv: pd.Series) -> pd.Series:
     return functools.reduce((lambda x, y: x + y), argv) 
 
 
+@handle_sheet_function_errors
+@convert_arg_to_series_type(
+    0,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    1,
+    'series',
+    'error',
+    'error'
+)
+@convert_arg_to_series_type(
+    2,
+    'float',
+    'error',
+    ('default', np.NaN),
+    optional=True
+)
+# We don't use the @filter_nans decorator because the aggregation ignores NaN values
+def SUMIF(criteria_range: pd.Series, criteria: pd.Series, sum_range: pd.Series=None) -> pd.Series:
+    """
+    {
+        "function": "SUMIF",
+        "description": "Returns the sum of the values in the rows where the range is equal to the criteria. If no rows match, returns 0.",
+        "examples": [
+            "SUMIF(Region, Region, Sales)",
+            "SUMIF(Region, 'West', Sales)"
+        ],
+        "syntax": "SUMIF(range, criteria, [sum_range])",
+        "syntax_elements": [{
+                "element": "range",
+                "description": "The series to compare to the criteria."
+            },
+            {
+                "element": "criteria",
+                "description": "The value or series to compare the range to. A series is compared row by row."
+            },
+            {
+                "element": "sum_range [OPTIONAL]",
+                "description": "The numbers to sum. Defaults to the range itself."
+            }
+        ]
+    }
+    """
+    if sum_range is None:
+        sum_range = to_float_series(criteria_range)
+
+    return get_conditional_aggregate(criteria_range, criteria, sum_range, 'sum', 0)
+
+
 @handle_sheet_function_errors
 @convert_arg_to_series_type(
     0,
@@ -571,18 +857,23 @@ def VAR(series: pd.Series) -> pd.Series:
 NUMBER_FUNCTIONS = {
     'ABS': ABS,
     'AVG': AVG,
+    'AVERAGEIF': AVERAGEIF,
     'CORR': CORR,
+    'COUNTIF': COUNTIF,
     'FLOAT': FLOAT,
     'INT': INT,
     'EXP': EXP,
     'KURT': KURT,
     'MAX': MAX,
+    'MAXIF': MAXIF,
     'MIN': MIN,
+    'MINIF': MINIF,
     'MULTIPLY': MULTIPLY,
     'POWER': POWER,
     'ROUND': ROUND,
     'SKEW': SKEW,
     'SUM': SUM,
+    'SUMIF': SUMIF,
     'STDEV': STDEV,
     'VALUE': VALUE,
     'VAR': VAR
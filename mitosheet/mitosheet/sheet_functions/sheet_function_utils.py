@@ -6,10 +6,33 @@
 """
 Contains utilities used in multiple sheet functions.
 """
-from typing import List, Tuple, Union
+import functools
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 
+# The sheet functions that have a vectorized kernel, by name, along with the
+# reference implementation that the kernel must return identical results to
+VECTORIZED_SHEET_FUNCTIONS: Dict[str, Tuple[Callable, Callable]] = {}
+
+
+def vectorized(reference_function: Callable) -> Callable:
+    """
+    Declares that the decorated sheet function is a vectorized kernel that returns
+    the same result as the reference_function, which is usually a much slower but
+    obviously correct implementation that operates on one row at a time.
+
+    This must be the innermost decorator on the sheet function, so the kernel and 
+    the reference_function are both called with the arguments already converted.
+    Every vectorized kernel is tested to be identical to its reference_function.
+    """
+    def wrap(kernel: Callable) -> Callable:
+        VECTORIZED_SHEET_FUNCTIONS[kernel.__name__] = (kernel, reference_function)
+        return kernel
+    return wrap
+
+
 def try_extend_series_to_index(series: pd.Series, index_to_fill: Union[pd.Index, pd.MultiIndex]) -> pd.Series:
     """
     Extends a given series to contain the entire index, filling the series
@@ -20,7 +43,181 @@ def try_extend_series_to_index(series: pd.Series, index_to_fill: Union[pd.Index,
     """
     if series.size > 1:
         return series
-    return pd.Series([series.iloc[0]] * len(index_to_fill), index=index_to_fill)
+
+    value = series.iloc[0]
+    if len(index_to_fill) > 1 and can_broadcast_series_of_constant(series, value):
+        # A zero-stride view repeats the value without storing it once per row
+        return pd.Series(np.broadcast_to(series.to_numpy()[:1], len(index_to_fill)), index=index_to_fill)
+    return pd.Series([value] * len(index_to_fill), index=index_to_fill)
+
+
+def can_broadcast_series_of_constant(series: pd.Series, value: Any) -> bool:
+    """
+    Returns True if repeating the array of the one element series gives the same 
+    dtype as building a series from the value repeated in a list does. 
+
+    This is the case for all NumPy dtypes, besides object series of non-strings,
+    which pandas infers a more specific dtype for (e.g. int64 for ints).
+    """
+    if not isinstance(series.dtype, np.dtype):
+        return False
+    if series.dtype.kind in 'iufbMm':
+        return True
+    return series.dtype == object and isinstance(value, str)
+
+
+def get_arg_values_by_row(
+        index: Union[pd.Index, pd.MultiIndex], 
+        args: Tuple[pd.Series, ...], 
+        transform: Callable[..., Any]
+    ) -> Iterable[Any]:
+    """
+    Returns the transform of the args at each row of the index, where the
+    args are extended to the index like try_extend_series_to_index does. 
+
+    As args are usually constants, or have only a few unique values, we group 
+    the rows by the values of the args, and call the transform only once for 
+    each group. The returned values can then be passed directly to map, to 
+    call a builtin string method on each row without any Python-level loop.
+    """
+    # NOTE: we take the first value as a Python object, exactly like iterating 
+    # over the extended series would give it to us
+    if all(arg.size <= 1 for arg in args):
+        return repeat(transform(*[arg.iloc[:1].tolist()[0] for arg in args]), len(index))
+
+    # Like zip, we only ever look at as many rows of the args as there are in the index
+    arg_values = [
+        np.array([arg.iloc[:1].tolist()[0]] * len(index), dtype='object') if arg.size <= 1 else arg.to_numpy()[:len(index)]
+        for arg in args
+    ]
+    num_rows = min(len(values) for values in arg_values)
+
+    try:
+        # We build up the groups one arg at a time, keeping the values of the args in each group
+        group_codes = np.zeros(num_rows, dtype='int64')
+        group_values: List[List[Any]] = [[]]
+        for values in arg_values:
+            codes, uniques = pd.factorize(values[:num_rows])
+            if (codes == -1).any():
+                raise TypeError('Cannot group NaN values')
+            
+            num_uniques = len(uniques)
+            uniques_list = uniques.tolist()
+            group_codes, group_keys = pd.factorize(group_codes * num_uniques + codes)
+            group_values = [
+                group_values[group_key // num_uniques] + [uniques_list[group_key % num_uniques]] 
+                for group_key in group_keys
+            ]
+    except TypeError:
+        # Values that are NaN or unhashable cannot be grouped, so we transform each row 
+        return map(transform, *[values.tolist() for values in arg_values])
+
+    transformed_groups = np.empty(len(group_values), dtype='object')
+    for group, values in enumerate(group_values):
+        transformed_groups[group] = transform(*values)
+    return transformed_groups[group_codes]
+
+
+def reduce_series_with_shared_index(series_list: Tuple[pd.Series, ...], ufunc: np.ufunc) -> Optional[pd.Series]:
+    """
+    Reduces the series elementwise with the NumPy ufunc (e.g. np.fmax), operating 
+    directly on their arrays rather than on a dataframe built from them.
+
+    Returns None unless the series all share one unique index and are all int64 
+    or float64, as only then is this identical to reducing across the rows of 
+    pd.DataFrame(series_list).
+    """
+    index = series_list[0].index
+    if index.has_duplicates or any(not (series.index is index or series.index.equals(index)) for series in series_list):
+        return None
+    if any(series.dtype not in (np.dtype('int64'), np.dtype('float64')) for series in series_list):
+        return None
+
+    values = functools.reduce(ufunc, [series.to_numpy() for series in series_list])
+    # NOTE: we copy a single array, so the result never shares memory with an argument
+    return pd.Series(np.array(values, copy=len(series_list) == 1), index=index)
+
+
+# Powers of ten above this are not exactly representable as floats
+MAX_EXACT_POWER_OF_TEN = 22
+
+
+def round_to_decimals(values: np.ndarray, decimals: np.ndarray) -> np.ndarray:
+    """
+    Rounds each of the float values to the number of decimals in the same row, 
+    with a result identical to Python's round. The decimals must be integers.
+
+    We round all the values with the same number of decimals at once, by scaling 
+    them by 10**decimals and rounding them to the nearest integer. As the scaling 
+    is exact to within an ulp, this is only wrong for values that are within a few
+    ulps of halfway between two results, or that are too large to scale exactly, 
+    and so we round these few values with Python's round instead.
+    """
+    rounded = np.full(len(values), np.NaN, dtype='float64')
+    if decimals.size == 1:
+        decimal_codes, unique_decimals = np.zeros(len(values), dtype='int64'), decimals[:1]
+    else:
+        decimal_codes, unique_decimals = pd.factorize(decimals)
+
+    with np.errstate(all='ignore'):
+        for decimal_code, decimal in enumerate(unique_decimals):
+            indexes = np.flatnonzero(decimal_codes == decimal_code) if len(unique_decimals) > 1 else np.arange(len(values))
+            group_values = values[indexes]
+            scale = 10.0 ** min(abs(int(decimal)), MAX_EXACT_POWER_OF_TEN + 1)
+
+            scaled = group_values * scale if decimal >= 0 else group_values / scale
+            scaled_rounded = np.rint(scaled)
+            rounded[indexes] = scaled_rounded / scale if decimal >= 0 else scaled_rounded * scale
+
+            needs_python_round = ~np.isfinite(scaled) | (np.abs(scaled) >= 2 ** 52) | (
+                np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 4 * np.spacing(np.abs(scaled))
+            )
+            if abs(decimal) > MAX_EXACT_POWER_OF_TEN:
+                needs_python_round[:] = True
+            needs_python_round &= ~np.isnan(group_values)
+
+            for index in indexes[needs_python_round]:
+                rounded[index] = round(float(values[index]), int(decimal))
+
+    return rounded
+
+
+def get_conditional_aggregate(
+        criteria_range: pd.Series, 
+        criteria: pd.Series, 
+        values: pd.Series, 
+        aggregation: str, 
+        default: Any
+    ) -> pd.Series:
+    """
+    For each criterion, aggregates the values in the rows where the criteria_range 
+    is equal to this criterion, or returns the default if there are no such rows.
+
+    We factorize the criteria_range and aggregate the values by its codes in a 
+    single pass, and then look up the aggregate for each criterion, so this takes 
+    linear time and does not make any intermediate dataframes. When the criteria
+    are the criteria_range itself, each row already has the code to look up. 
+
+    NOTE: rows where the criteria_range is NaN never match, and the aggregation 
+    ignores NaN values.
+    """
+    values = try_extend_series_to_index(values, criteria_range.index)
+    codes, uniques = pd.factorize(criteria_range.to_numpy())
+    # Missing values have a code of -1, and so are aggregated in a group we never look up
+    aggregates = values.groupby(codes).agg(aggregation).reindex(np.arange(len(uniques)))
+
+    if criteria is criteria_range:
+        criteria_codes = codes
+    else:
+        criteria_codes = pd.Index(uniques).get_indexer(criteria.to_numpy())
+
+    result = pd.Series(
+        pd.api.extensions.take(aggregates.to_numpy(), criteria_codes, allow_fill=True, fill_value=default),
+        index=criteria.index
+    ).fillna(default)
+
+    # A single criterion has the same aggregate for every row
+    return try_extend_series_to_index(result, criteria_range.index) if criteria.size == 1 else result
 
 
 def fill_series_with_one_index(series_list: Tuple[pd.Series, ...]) -> Tuple[pd.Series, ...]:
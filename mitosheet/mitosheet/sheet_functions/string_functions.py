@@ -12,13 +12,41 @@ in more detail in docs/README.md.
 NOTE: This file is alphabetical order!
 """
 import functools
+import operator
+import re
+from typing import Callable
 
 import pandas as pd
 from mitosheet.sheet_functions.sheet_function_utils import (
-    fill_series_with_one_index, try_extend_series_to_index)
+    fill_series_with_one_index, get_arg_values_by_row)
 from mitosheet.sheet_functions.types.decorators import (
     cast_output, convert_arg_to_series_type, convert_args_to_series_type,
     filter_nans, handle_sheet_function_errors)
+from mitosheet.sheet_functions.types.utils import (convert_categories,
+                                                   convert_unique_values,
+                                                   is_category_dtype)
+
+# The characters that CLEAN removes, which are all those not between 32 and 126
+NON_PRINTABLE_CHARACTERS_REGEX = re.compile('[^\x20-\x7d]')
+
+
+def apply_to_unique_strings(
+        series: pd.Series, 
+        string_function: Callable[[pd.Series], pd.Series], 
+        categorical_output: bool=False
+    ) -> pd.Series:
+    """
+    Returns the result of calling the string_function on the series, where the
+    string_function operates on each string independently of the others.
+
+    As string columns often only have a few distinct values, we call the 
+    string_function on the categories of a categorical series, or on the unique
+    values of a low cardinality series, rather than on every row. If 
+    categorical_output, then the result for a categorical series is categorical.
+    """
+    if is_category_dtype(str(series.dtype)):
+        return convert_categories(series, string_function, categorical_output=categorical_output)
+    return convert_unique_values(series, string_function)
 
 
 @handle_sheet_function_errors
@@ -48,7 +76,17 @@ def CLEAN(series: pd.Series) -> pd.Series:
     # TODO: this function is wacked out. It removes spaces (Excel's does not!)
     # Also, I'm not sure it makes any sense in the context of Python + pandas
     # reading in dataframes, given they handle all characters here.
-    return series.apply(lambda x:''.join([i if 32 <= ord(i) < 126 else "" for i in x]))
+    remove_non_printable_characters = functools.partial(NON_PRINTABLE_CHARACTERS_REGEX.sub, '')
+    return apply_to_unique_strings(
+        series,
+        lambda strings: pd.Series(
+            list(map(remove_non_printable_characters, strings.to_numpy())),
+            index=strings.index,
+            name=strings.name,
+            dtype='object'
+        ),
+        categorical_output=True
+    )
 
 
 @handle_sheet_function_errors
@@ -76,6 +114,9 @@ def CONCAT(*argv: pd.Series) -> pd.Series:
     }
     """
 
+    # Categorical series cannot be added together, so we add their strings instead
+    argv = [arg.astype('object') if is_category_dtype(str(arg.dtype)) else arg for arg in argv]
+
     # We make sure all the series are the max length, so the concat has something at every index
     argv = fill_series_with_one_index(argv)
 
@@ -119,13 +160,13 @@ def FIND(series: pd.Series, substrings: pd.Series) -> pd.Series:
     """
 
     # If there aren't enough substrings, we fill it to the end
-    substrings = try_extend_series_to_index(substrings, series.index)
+    substrings = get_arg_values_by_row(series.index, (substrings,), lambda substring: substring)
 
     # Then, we find each substring
     return pd.Series(
-        [string.find(substring) + 1 for string, substring in zip(series, substrings)], 
+        list(map(str.find, series.to_numpy(), substrings)), 
         index=series.index
-    )
+    ) + 1
 
 
 @handle_sheet_function_errors
@@ -165,16 +206,24 @@ def LEFT(series: pd.Series, num_chars: pd.Series=None) -> pd.Series:
         ]
     }
     """
+    def left(strings: pd.Series, num_chars: pd.Series) -> pd.Series:
+        # If there aren't enough char splits, we fill it to the end
+        slices = get_arg_values_by_row(strings.index, (num_chars,), lambda num_char: slice(None, int(num_char)))
+        # And then slice the string on the left
+        return pd.Series(
+            list(map(operator.getitem, strings.to_numpy(), slices)),
+            index=strings.index
+        )
+
+    # If every string is sliced the same way, we only slice each distinct string once
     if num_chars is None:
-        num_chars = pd.Series(data=[1] * series.size)
+        return apply_to_unique_strings(
+            series, lambda strings: left(strings, pd.Series(data=[1] * strings.size)), categorical_output=True
+        )
+    elif num_chars.size == 1:
+        return apply_to_unique_strings(series, lambda strings: left(strings, num_chars), categorical_output=True)
 
-    # If there aren't enough char splits, we fill it to the end
-    num_chars = try_extend_series_to_index(num_chars, series.index)
-    # And then slice the string on the left
-    return pd.Series(
-        [string[:int(num_char)] for string, num_char in zip(series, num_chars)],
-        index=series.index
-    )
+    return left(series, num_chars)
 
 
 @handle_sheet_function_errors
@@ -202,7 +251,7 @@ def LEN(series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return series.str.len()
+    return apply_to_unique_strings(series, lambda strings: strings.str.len())
 
 
 @handle_sheet_function_errors
@@ -232,7 +281,7 @@ def LOWER(series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return series.str.lower()
+    return apply_to_unique_strings(series, lambda strings: strings.str.lower(), categorical_output=True)
 
 
 @handle_sheet_function_errors
@@ -282,16 +331,16 @@ def MID(series: pd.Series, start_loc: pd.Series, num_chars: pd.Series) -> pd.Ser
     }
     """
     # If there aren't enough char splits, we fill it to the end
-    start_loc = try_extend_series_to_index(start_loc, series.index)
-    num_chars = try_extend_series_to_index(num_chars, series.index)
+    slices = get_arg_values_by_row(
+        series.index, 
+        (start_loc, num_chars), 
+        lambda start, num_char: slice(start - 1, start - 1 + int(num_char))
+    )
     # And then slice the string on the left
     return pd.Series(
-        [
-            string[start - 1: start - 1 + int(num_char)] for string, start, num_char 
-            in zip(series, start_loc, num_chars)
-        ],
+        list(map(operator.getitem, series.to_numpy(), slices)),
         index=series.index
-    ) 
+    )
 
 
 @handle_sheet_function_errors
@@ -320,7 +369,7 @@ def PROPER(series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return series.str.title()
+    return apply_to_unique_strings(series, lambda strings: strings.str.title(), categorical_output=True)
 
 
 @handle_sheet_function_errors
@@ -364,10 +413,14 @@ def RIGHT(series: pd.Series, num_chars: pd.Series=None) -> pd.Series:
         num_chars = pd.Series(data=[1] * series.size)
 
     # If there aren't enough char splits, we fill it to the end
-    num_chars = try_extend_series_to_index(num_chars, series.index)
-    # And then slice the string on the left
+    slices = get_arg_values_by_row(
+        series.index, 
+        (num_chars,), 
+        lambda num_char: slice(-int(num_char), None) if num_char > 0 else slice(0, 0)
+    )
+    # And then slice the string on the right
     return pd.Series(
-        [string[-int(num_char):] if num_char > 0 else '' for string, num_char in zip(series, num_chars)],
+        list(map(operator.getitem, series.to_numpy(), slices)),
         index=series.index
     )
 
@@ -429,13 +482,15 @@ def SUBSTITUTE(series: pd.Series, old_text: pd.Series, new_text: pd.Series, coun
         ]
     }
     """
-    old_text = try_extend_series_to_index(old_text, series.index)
-    new_text = try_extend_series_to_index(new_text, series.index)
     if count is None:
-        count = try_extend_series_to_index(pd.Series(data=[-1]), series.index)
+        count = pd.Series(data=[-1])
+
+    old_text = get_arg_values_by_row(series.index, (old_text,), lambda old: old)
+    new_text = get_arg_values_by_row(series.index, (new_text,), lambda new: new)
+    count = get_arg_values_by_row(series.index, (count,), lambda c: c)
 
     return pd.Series(
-        [string.replace(old, new, c) for string, old, new, c in zip(series, old_text, new_text, count)],
+        list(map(str.replace, series.to_numpy(), old_text, new_text, count)),
         index=series.index
     )
 
@@ -495,7 +550,16 @@ def TRIM(series: pd.Series) -> pd.Series:
         ]
     }
     """
-    return series.apply(lambda x: x.strip())
+    return apply_to_unique_strings(
+        series,
+        lambda strings: pd.Series(
+            list(map(str.strip, strings.to_numpy())),
+            index=strings.index,
+            name=strings.name,
+            dtype='object'
+        ),
+        categorical_output=True
+    )
 
 
 @handle_sheet_function_errors
@@ -526,7 +590,7 @@ def UPPER(series: pd.Series) -> pd.Series:
     }
     """
 
-    return series.str.upper()
+    return apply_to_unique_strings(series, lambda strings: strings.str.upper(), categorical_output=True)
 
 
 # TODO: we should see if we can list these automatically!
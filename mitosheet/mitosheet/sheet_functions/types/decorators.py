@@ -17,7 +17,29 @@ from mitosheet.sheet_functions.sheet_function_utils import \
     is_series_of_constant
 from mitosheet.sheet_functions.types import get_function_to_convert_to_series
 from mitosheet.sheet_functions.types.utils import (get_nan_indexes_metadata,
-                                                   put_nan_indexes_back)
+                                                   get_non_nan_mask_metadata,
+                                                   put_nan_indexes_back,
+                                                   put_non_nan_values_back)
+
+
+def save_decorator_metadata(
+        wrapped_sheet_function: Callable, 
+        decorator: Callable, 
+        decorator_type: str,
+        **decorator_params: Any
+    ) -> None:
+    """
+    Saves how a sheet function was wrapped onto the wrapped function itself, 
+    namely the decorator that can be used to reapply this wrapping as well as
+    the parameters it was applied with.
+
+    This allows us to read the signature of a sheet function from its decorators,
+    and to rebuild a sheet function without some of its decorators. See 
+    sheet_functions/types/specialize.py for where this is used.
+    """
+    wrapped_sheet_function.mito_decorator = decorator # type: ignore
+    wrapped_sheet_function.mito_decorator_type = decorator_type # type: ignore
+    wrapped_sheet_function.mito_decorator_params = decorator_params # type: ignore
 
 
 def handle_sheet_function_errors(sheet_function: Callable) -> Callable:
@@ -34,6 +56,7 @@ def handle_sheet_function_errors(sheet_function: Callable) -> Callable:
         except:
             raise make_function_error(sheet_function.__name__, error_modal=False)
     
+    save_decorator_metadata(wrapped_f, handle_sheet_function_errors, 'handle_sheet_function_errors')
     return wrapped_f
 
 
@@ -81,6 +104,15 @@ def convert_arg_to_series_type(
                     raise make_invalid_arguments_error(sheet_function.__name__)
                 args[arg_index] = new_arg
             return sheet_function(*args)  
+
+        save_decorator_metadata(
+            wrapped_sheet_function, 
+            wrap, 
+            'convert_arg_to_series_type', 
+            arg_index=arg_index, 
+            arg_target_series_type=arg_target_series_type, 
+            optional=optional
+        )
         return wrapped_sheet_function
     return wrap
 
@@ -114,6 +146,13 @@ def convert_args_to_series_type(
             # Filter out the None values, as we don't want to send them to the function
             new_args = list(filter(lambda arg: arg is not None, new_args)) 
             return sheet_function(*new_args)        
+
+        save_decorator_metadata(
+            wrapped_sheet_function, 
+            wrap, 
+            'convert_args_to_series_type', 
+            arg_target_series_type=arg_target_series_type
+        )
         return wrapped_sheet_function
     return wrap
 
@@ -127,6 +166,21 @@ def filter_nans(sheet_function: Callable) -> Callable:
     @wraps(sheet_function)
     def wrapped_f(*args):
 
+        non_nan_mask_metadata = get_non_nan_mask_metadata(*args)
+        if non_nan_mask_metadata is not None:
+            original_index, non_nan_mask = non_nan_mask_metadata
+            has_nans = not non_nan_mask.all()
+
+            # Filter out the nan rows from the full series arguments, by position
+            new_args = [
+                arg[non_nan_mask] if has_nans and isinstance(arg, pd.Series) and not is_series_of_constant(arg) else arg
+                for arg in args
+            ]
+
+            result = sheet_function(*new_args)
+
+            return put_non_nan_values_back(result, original_index, non_nan_mask)
+
         original_index, non_nan_index = get_nan_indexes_metadata(*args)
             
         # For each arg that is an instance of a pd.series, filter out the nan_indexes
@@ -146,6 +200,7 @@ def filter_nans(sheet_function: Callable) -> Callable:
 
         return put_nan_indexes_back(result, original_index)
     
+    save_decorator_metadata(wrapped_f, filter_nans, 'filter_nans')
     return wrapped_f
 
 def fill_nans(
@@ -181,6 +236,13 @@ def fill_nans(
                 args[arg_index] = arg.fillna(new_value)
             
             return sheet_function(*args)  
+
+        save_decorator_metadata(
+            wrapped_sheet_function, 
+            wrap, 
+            'fill_nans', 
+            arg_index=arg_index
+        )
         return wrapped_sheet_function
     return wrap
 
@@ -217,5 +279,11 @@ def cast_output(
             except:
                 return result
             
+        save_decorator_metadata(
+            wrapped_sheet_function, 
+            wrap, 
+            'cast_output', 
+            output_target_series_type=output_target_series_type
+        )
         return wrapped_sheet_function
     return wrap
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Utilities for specializing a sheet function to the types of the arguments
+it is called with.
+
+Every sheet function converts its arguments to the series type it wants
+through its decorators, on every call. However, if we know ahead of time
+that an argument is already of this type (e.g. a float64 column passed to
+a function that wants a float series), then this conversion does nothing
+at all.
+
+Since the decorators save the parameters they were applied with onto the
+sheet function (see save_decorator_metadata), we can read the signature of
+a sheet function from them, and rebuild the sheet function without the
+decorators that are provably a no-op for the types it is called with.
+"""
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from mitosheet.sheet_functions.types import get_function_to_convert_to_series
+from mitosheet.sheet_functions.types.to_boolean_series import to_boolean_series
+from mitosheet.sheet_functions.types.to_datetime_series import to_datetime_series
+from mitosheet.sheet_functions.types.to_float_series import to_float_series
+from mitosheet.sheet_functions.types.to_timedelta_series import to_timedelta_series
+from mitosheet.sheet_functions.types.utils import (is_bool_dtype,
+                                                   is_datetime_dtype,
+                                                   is_number_dtype,
+                                                   is_string_dtype,
+                                                   is_timedelta_dtype)
+
+# The series types we infer for formula expressions. Note that these are coarser
+# than dtypes, as the conversion functions treat many dtypes the same way
+SERIES_TYPE_BOOL = 'bool'
+SERIES_TYPE_DATETIME = 'datetime'
+SERIES_TYPE_TIMEDELTA = 'timedelta'
+SERIES_TYPE_NUMBER = 'number'
+SERIES_TYPE_STRING = 'string'
+
+# For each conversion function, the series type it returns unchanged
+CONVERSION_FUNCTION_NO_OP_SERIES_TYPE = {
+    to_boolean_series: SERIES_TYPE_BOOL,
+    to_datetime_series: SERIES_TYPE_DATETIME,
+    to_float_series: SERIES_TYPE_NUMBER,
+    to_timedelta_series: SERIES_TYPE_TIMEDELTA,
+}
+
+# Specializing a function requires rebuilding it, so we do so at most once
+# for each sheet function and argument types
+_specialized_sheet_functions: Dict[Tuple[Callable, Tuple[Optional[str], ...]], Callable] = {}
+
+
+def get_series_type(dtype: str) -> Optional[str]:
+    """
+    Returns the series type of a series with the given dtype.
+
+    NOTE: this checks the dtype in the same order as the conversion
+    functions, so it agrees with them on which branch a series takes.
+    """
+    if is_bool_dtype(dtype):
+        return SERIES_TYPE_BOOL
+    elif is_datetime_dtype(dtype):
+        return SERIES_TYPE_DATETIME
+    elif is_timedelta_dtype(dtype):
+        return SERIES_TYPE_TIMEDELTA
+    elif is_number_dtype(dtype):
+        return SERIES_TYPE_NUMBER
+    elif is_string_dtype(dtype):
+        return SERIES_TYPE_STRING
+    return None
+
+
+def is_no_op_series_conversion(series_type: Optional[str], arg_target_series_type: str) -> bool:
+    """
+    Returns True if converting a series of series_type to the arg_target_series_type
+    is guaranteed to return the series unchanged.
+
+    A series_type of None means we do not know that the argument is a series at
+    all (e.g. it is a constant), and so the conversion is never a no-op.
+    """
+    if series_type is None:
+        return False
+    if arg_target_series_type == 'series':
+        return True
+    conversion_function = get_function_to_convert_to_series(arg_target_series_type)
+    return CONVERSION_FUNCTION_NO_OP_SERIES_TYPE.get(conversion_function) == series_type
+
+
+def _is_no_op_decorator(decorator_type: str, decorator_params: Dict[str, Any], arg_series_types: Optional[List[Optional[str]]]) -> bool:
+    """
+    Returns True if the decorator does nothing when called with arguments of
+    the given series types.
+    """
+    if arg_series_types is None:
+        return False
+
+    if decorator_type == 'convert_arg_to_series_type':
+        arg_index = decorator_params['arg_index']
+        if arg_index >= len(arg_series_types):
+            # Optional arguments that are not passed are ignored
+            return decorator_params['optional']
+        return is_no_op_series_conversion(arg_series_types[arg_index], decorator_params['arg_target_series_type'])
+    elif decorator_type == 'convert_args_to_series_type':
+        return len(arg_series_types) > 0 and all(
+            is_no_op_series_conversion(series_type, decorator_params['arg_target_series_type'])
+            for series_type in arg_series_types
+        )
+
+    return False
+
+
+def _get_arg_series_types_after_decorator(decorator_type: str, decorator_params: Dict[str, Any], arg_series_types: Optional[List[Optional[str]]]) -> Optional[List[Optional[str]]]:
+    """
+    Returns what we know about the series types of the arguments once they have
+    passed through the given decorator. Returns None if we no longer know even
+    how many arguments there are.
+    """
+    if arg_series_types is None:
+        return None
+
+    if decorator_type == 'convert_args_to_series_type':
+        # Arguments that fail to convert may be removed entirely
+        return None
+    elif decorator_type in ('convert_arg_to_series_type', 'fill_nans'):
+        arg_index = decorator_params['arg_index']
+        new_arg_series_types = list(arg_series_types)
+        if arg_index < len(new_arg_series_types):
+            new_arg_series_types[arg_index] = None
+        return new_arg_series_types
+
+    return arg_series_types
+
+
+def get_series_conversion_targets(sheet_function: Callable) -> Set[str]:
+    """
+    Returns all the series types that the decorators of the sheet_function 
+    convert arguments to.
+    """
+    series_conversion_targets = set()
+    while hasattr(sheet_function, 'mito_decorator') and hasattr(sheet_function, '__wrapped__'):
+        decorator_type = sheet_function.mito_decorator_type # type: ignore
+        if decorator_type in ('convert_arg_to_series_type', 'convert_args_to_series_type'):
+            series_conversion_targets.add(sheet_function.mito_decorator_params['arg_target_series_type']) # type: ignore
+        sheet_function = sheet_function.__wrapped__ # type: ignore
+    return series_conversion_targets
+
+
+def specialize_sheet_function(sheet_function: Callable, arg_series_types: List[Optional[str]]) -> Callable:
+    """
+    Returns a version of the sheet_function that skips the decorators that are a
+    no-op when the function is called with arguments of the arg_series_types.
+    If no decorators can be skipped, returns the sheet_function itself.
+
+    The returned function returns the same result as the sheet_function for any
+    arguments of these series types.
+    """
+    key = (sheet_function, tuple(arg_series_types))
+    if key in _specialized_sheet_functions:
+        return _specialized_sheet_functions[key]
+
+    # Unwrap the decorators, from the outermost one to the innermost one
+    decorated_layers = []
+    inner_sheet_function = sheet_function
+    while hasattr(inner_sheet_function, 'mito_decorator') and hasattr(inner_sheet_function, '__wrapped__'):
+        decorated_layers.append(inner_sheet_function)
+        inner_sheet_function = inner_sheet_function.__wrapped__ # type: ignore
+
+    kept_layers = []
+    current_arg_series_types: Optional[List[Optional[str]]] = list(arg_series_types)
+    for decorated_layer in decorated_layers:
+        decorator_type = decorated_layer.mito_decorator_type # type: ignore
+        decorator_params = decorated_layer.mito_decorator_params # type: ignore
+        if _is_no_op_decorator(decorator_type, decorator_params, current_arg_series_types):
+            continue
+        kept_layers.append(decorated_layer)
+        current_arg_series_types = _get_arg_series_types_after_decorator(decorator_type, decorator_params, current_arg_series_types)
+
+    if len(kept_layers) == len(decorated_layers):
+        specialized_sheet_function = sheet_function
+    else:
+        # Reapply the decorators we kept, from the innermost one to the outermost one
+        specialized_sheet_function = inner_sheet_function
+        for decorated_layer in reversed(kept_layers):
+            specialized_sheet_function = decorated_layer.mito_decorator(specialized_sheet_function) # type: ignore
+
+    _specialized_sheet_functions[key] = specialized_sheet_function
+    return specialized_sheet_function
@@ -11,7 +11,8 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from mitosheet.sheet_functions.types.utils import (is_bool_dtype,
+from mitosheet.sheet_functions.types.utils import (convert_unique_values,
+                                                   is_bool_dtype,
                                                    is_datetime_dtype,
                                                    is_number_dtype,
                                                    is_string_dtype)
@@ -65,6 +66,9 @@ def to_boolean_series(
             'n': False
         }
         # Convert any NaN values to False
-        return unknown_object.map(string_to_bool_conversion_dict).fillna(False)
+        return convert_unique_values(
+            unknown_object,
+            lambda string_series: string_series.map(string_to_bool_conversion_dict).fillna(False)
+        )
     else:
         return None
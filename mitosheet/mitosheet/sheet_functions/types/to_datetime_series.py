@@ -10,13 +10,35 @@ For going to a datetime series.
 
 import numpy as np
 import pandas as pd
-from mitosheet.sheet_functions.types.utils import (get_datetime_format,
+from mitosheet.sheet_functions.types.utils import (convert_unique_values,
+                                                   get_datetime_format,
                                                    is_bool_dtype,
                                                    is_datetime_dtype,
                                                    is_number_dtype,
                                                    is_string_dtype)
 
 
+def to_datetime_series_from_string_series(string_series: pd.Series) -> pd.Series:
+    """
+    Converts a string series to a datetime series, guessing the format of 
+    the dates in it to the best of Pandas abilities.
+    """
+    # TODO: improve this to work element wise!
+    datetime_format = get_datetime_format(string_series)
+    if datetime_format is not None:
+        return pd.to_datetime(
+            string_series,
+            format=datetime_format,
+            errors='coerce'
+        )
+    else:
+        return pd.to_datetime(
+            string_series,
+            infer_datetime_format=True,
+            errors='coerce'
+        )
+
+
 def to_datetime_series(
         unknown_object,
         on_uncastable_arg_element=('default', np.NaN), # Union[Literal['error'], Tuple[Literal['default'], any]]
@@ -37,19 +59,6 @@ def to_datetime_series(
     if is_number_dtype(column_dtype):
         return None
     elif is_string_dtype(column_dtype):
-        # TODO: improve this to work element wise!
-        datetime_format = get_datetime_format(unknown_object)
-        if datetime_format is not None:
-            return pd.to_datetime(
-                unknown_object,
-                format=datetime_format,
-                errors='coerce'
-            )
-        else:
-            return pd.to_datetime(
-                unknown_object,
-                infer_datetime_format=True,
-                errors='coerce'
-            )
+        return convert_unique_values(unknown_object, to_datetime_series_from_string_series)
     else:
         return None
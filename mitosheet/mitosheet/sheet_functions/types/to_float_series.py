@@ -11,8 +11,9 @@ from typing import Any
 import numpy as np
 import pandas as pd
 from mitosheet.sheet_functions.types.utils import (
-    get_billion_identifier_in_string, get_million_identifier_in_string,
-    is_bool_dtype, is_datetime_dtype, is_number_dtype, is_string_dtype)
+    convert_unique_values, get_billion_identifier_in_string,
+    get_million_identifier_in_string, is_bool_dtype, is_datetime_dtype,
+    is_number_dtype, is_string_dtype)
 
 
 def convert_string_to_float(
@@ -91,17 +92,55 @@ def convert_string_to_float(
                 # Return the given default value in this case
                 return on_uncastable_arg_element[1]
 
+
 def to_float_series_from_string_series(
         string_series: pd.Series, 
         on_uncastable_arg_element: Any #: Union[Literal['error'], Tuple[Literal['default'], any]]
     ) -> pd.Series:
     """
-    Converts a string series to a number series, using a helper that
-    handles special formatting of strings. 
+    Converts a string series to a number series, handling special formatting of 
+    strings exactly as convert_string_to_float does.
+
+    To do so quickly, we first find the strings that pd.to_numeric is able to 
+    parse, and parse all of them at once. NOTE: we parse them with astype, rather 
+    than taking the result of pd.to_numeric, as astype calls float on each element 
+    exactly like convert_string_to_float does, whereas pd.to_numeric uses its own 
+    parser. Then, we convert the rest of the strings with convert_string_to_float, 
+    converting each unique string only once.
 
     Takes a default value, so the tranformation can occur elementwise
     """
-    return string_series.apply(convert_string_to_float, on_uncastable_arg_element=on_uncastable_arg_element).astype('float64')
+    values = string_series.to_numpy()
+    float_values = np.full(len(values), np.NaN, dtype='float64')
+
+    try:
+        is_numeric = pd.to_numeric(string_series, errors='coerce').notna().to_numpy()
+        float_values[is_numeric] = values[is_numeric].astype('float64')
+    except:
+        is_numeric = np.zeros(len(values), dtype=bool)
+
+    if is_numeric.all():
+        return pd.Series(float_values, index=string_series.index, name=string_series.name)
+
+    other_indexes = np.flatnonzero(~is_numeric)
+    try:
+        codes, uniques = pd.factorize(values[other_indexes])
+    except TypeError:
+        # Unhashable elements cannot be deduplicated, so we convert them all
+        codes, uniques = np.arange(len(other_indexes)), values[other_indexes]
+
+    unique_float_values = np.array([
+        convert_string_to_float(unique, on_uncastable_arg_element) for unique in uniques
+    ], dtype='float64')
+    float_values[other_indexes[codes != -1]] = unique_float_values[codes[codes != -1]]
+
+    # Missing values are not included in the uniques, so we convert them one by one, 
+    # making sure to handle them exactly how we always have
+    for index in other_indexes[codes == -1]:
+        float_values[index] = convert_string_to_float(values[index], on_uncastable_arg_element)
+
+    return pd.Series(float_values, index=string_series.index, name=string_series.name)
+
 
 def to_float_series_from_boolean_series(boolean_series: pd.Series) -> pd.Series:
     """
@@ -130,6 +169,9 @@ def to_float_series(
     elif is_number_dtype(column_dtype):
         return unknown_object
     elif is_string_dtype(column_dtype):
-        return to_float_series_from_string_series(unknown_object, on_uncastable_arg_element=on_uncastable_arg_element)
+        return convert_unique_values(
+            unknown_object, 
+            lambda string_series: to_float_series_from_string_series(string_series, on_uncastable_arg_element=on_uncastable_arg_element)
+        )
     else:
         return None
@@ -10,7 +10,7 @@ For going to a string series.
 import pandas as pd
 import numpy as np
 
-from mitosheet.sheet_functions.types.utils import is_bool_dtype, is_datetime_dtype, is_number_dtype, is_string_dtype, is_timedelta_dtype
+from mitosheet.sheet_functions.types.utils import convert_categories, is_bool_dtype, is_category_dtype, is_datetime_dtype, is_number_dtype, is_string_dtype, is_timedelta_dtype
 
 
 def to_string_series(
@@ -39,5 +39,8 @@ def to_string_series(
         # We need to cast here, because object series are treated
         # as string series, and may contain other types
         return unknown_object.astype('str')
+    elif is_category_dtype(column_dtype):
+        # We convert each category once, and keep the series categorical
+        return convert_categories(unknown_object, to_string_series, categorical_output=True)
     else:
         return None
\ No newline at end of file
@@ -11,7 +11,7 @@ from typing import Any, Tuple, Union
 import pandas as pd
 import numpy as np
 
-from mitosheet.sheet_functions.types.utils import is_bool_dtype, is_datetime_dtype, is_number_dtype, is_string_dtype, is_timedelta_dtype
+from mitosheet.sheet_functions.types.utils import convert_unique_values, is_bool_dtype, is_datetime_dtype, is_number_dtype, is_string_dtype, is_timedelta_dtype
 
 
 def to_timedelta_series(
@@ -41,10 +41,13 @@ def to_timedelta_series(
             errors='coerce'
         )
     elif is_string_dtype(column_dtype):
-        return pd.to_timedelta(
-            unknown_object, 
-            unit='s',
-            errors='coerce'
+        return convert_unique_values(
+            unknown_object,
+            lambda string_series: pd.to_timedelta(
+                string_series, 
+                unit='s',
+                errors='coerce'
+            )
         )
     else:
         return None
@@ -7,7 +7,7 @@
 Utilities to help with type functions
 """
 
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 
@@ -42,6 +42,9 @@ def is_timedelta_dtype(dtype: str) -> bool:
 def is_number_dtype(dtype: str) -> bool:
     return is_int_dtype(dtype) or is_float_dtype(dtype)
 
+def is_category_dtype(dtype: str) -> bool:
+    return 'category' == dtype
+
 def is_none_type(value: Union[str, None]) -> bool:
     """
     Helper function for determining if a value should be treated as None
@@ -106,6 +109,175 @@ def put_nan_indexes_back(series: pd.Series, original_index: pd.Index) -> pd.Seri
     return series.reindex(original_index)
 
 
+def get_non_nan_mask_metadata(*argv: Any) -> Optional[Tuple[pd.Index, np.ndarray]]:
+    """
+    Given a list of arguments, returns the index that the series in them 
+    share, as well as a boolean mask of the rows that are not NaN in any 
+    of these series. 
+    
+    As this mask is positional, it is much quicker to build and to filter
+    with than sets of index labels, and it works just as well for duplicate
+    index labels. 
+
+    Returns None if the series do not all share the same index, or if a 
+    series of a constant is NaN, as then a NaN has to be matched with the 
+    rows of the other series by label, with get_nan_indexes_metadata.
+    """
+    original_index = None
+    non_nan_mask = None
+
+    for arg in argv:
+        if not isinstance(arg, pd.Series):
+            continue
+
+        if is_series_of_constant(arg):
+            if arg.isnull().iloc[0]:
+                return None
+            continue
+
+        if original_index is None:
+            original_index = arg.index
+            non_nan_mask = arg.notnull().to_numpy()
+        elif arg.index is original_index or arg.index.equals(original_index):
+            non_nan_mask &= arg.notnull().to_numpy()
+        else:
+            return None
+
+    if original_index is None or non_nan_mask is None:
+        return None
+
+    return original_index, non_nan_mask
+
+
+def put_non_nan_values_back(series: pd.Series, original_index: pd.Index, non_nan_mask: np.ndarray) -> pd.Series:
+    """
+    This function takes a series of the values at the rows in the non_nan_mask, 
+    and scatters them back into a series with the original_index, with NaN 
+    values in all other rows. 
+    
+    The result is identical to reindexing the series to the original_index, 
+    but as it is positional, it also works for duplicate index labels.
+    """
+    if not isinstance(series, pd.Series):
+        return put_nan_indexes_back(series, original_index)
+
+    if non_nan_mask.all():
+        # There are no NaN values to put back
+        return series if series.index.equals(original_index) else put_nan_indexes_back(series, original_index)
+
+    if not series.index.equals(original_index[non_nan_mask]):
+        return put_nan_indexes_back(series, original_index)
+
+    # The position of each row in the series, or -1 for rows that are NaN
+    positions = np.full(len(original_index), -1, dtype='int64')
+    positions[non_nan_mask] = np.arange(len(series))
+    # NOTE: take upcasts the dtype to fit the NaN values exactly like reindex does
+    values = pd.api.extensions.take(series.array, positions, allow_fill=True)
+    return pd.Series(values, index=original_index, name=series.name)
+
+
+# Series shorter than this are converted row by row, as factorizing them does not pay off
+UNIQUE_VALUE_CONVERSION_MIN_LENGTH = 1000
+# The number of rows we look at to measure the cardinality of a series
+CARDINALITY_SAMPLE_SIZE = 10000
+# We only convert the unique values of a series if at most this fraction of the 
+# rows in the sample are distinct
+UNIQUE_VALUE_CONVERSION_MAX_CARDINALITY = 0.5
+
+
+def has_low_cardinality(series: pd.Series) -> bool:
+    """
+    Returns True if the series is long, and has few enough distinct values that
+    converting each distinct value once is quicker than converting every row.
+
+    As counting the distinct values of the entire series is as slow as factorizing
+    it, we measure the cardinality on an evenly spaced sample of its rows.
+    """
+    if len(series) < UNIQUE_VALUE_CONVERSION_MIN_LENGTH:
+        return False
+
+    sample = series.to_numpy()[::max(1, len(series) // CARDINALITY_SAMPLE_SIZE)]
+    try:
+        num_unique = len(pd.unique(sample))
+    except TypeError:
+        # Unhashable values cannot be deduplicated
+        return False
+
+    return num_unique <= len(sample) * UNIQUE_VALUE_CONVERSION_MAX_CARDINALITY
+
+
+def convert_unique_values(series: pd.Series, conversion_function: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Returns the result of calling the conversion_function on the series. The 
+    conversion_function must convert each element of the series independently
+    of the others, and return a series with an element for each of them.
+
+    If the series is made of strings and has low cardinality, we instead call the 
+    conversion_function on the unique values of the series only, and take the 
+    converted value for each row from them. NOTE: missing values are not 
+    deduplicated by factorize, so we convert each of them as is, in case the 
+    conversion_function handles different kinds of missing values differently.
+    """
+    if not has_low_cardinality(series):
+        return conversion_function(series)
+
+    values = series.to_numpy()
+    try:
+        codes, uniques = pd.factorize(values)
+    except TypeError:
+        return conversion_function(series)
+
+    # Values of different types that are equal (e.g. True, 1 and 1.0) are merged by 
+    # factorize, but may be converted differently, so we only do this for strings
+    if pd.api.types.infer_dtype(uniques, skipna=False) != 'string':
+        return conversion_function(series)
+
+    missing_value_indexes = np.flatnonzero(codes == -1)
+    codes[missing_value_indexes] = len(uniques) + np.arange(len(missing_value_indexes))
+    converted_uniques = conversion_function(
+        pd.Series(np.concatenate([uniques, values[missing_value_indexes]]), dtype=series.dtype, name=series.name)
+    )
+    if converted_uniques is None:
+        return None
+
+    return pd.Series(converted_uniques.array.take(codes), index=series.index, name=converted_uniques.name)
+
+
+def convert_categories(
+        categorical_series: pd.Series, 
+        conversion_function: Callable[[pd.Series], pd.Series], 
+        categorical_output: bool=False
+    ) -> pd.Series:
+    """
+    Returns the result of calling the conversion_function on the categorical_series,
+    which is computed by calling it on the categories of the series only, and taking
+    the converted category for each row with the codes of the series. Missing values
+    stay missing.
+
+    If categorical_output, then the result is a categorical series, with the converted
+    categories as its categories. Categories that convert to the same value are merged.
+    """
+    converted_categories = conversion_function(
+        pd.Series(categorical_series.cat.categories, name=categorical_series.name)
+    )
+    if converted_categories is None:
+        return None
+
+    codes = categorical_series.cat.codes.to_numpy()
+    if categorical_output:
+        category_codes, new_categories = pd.factorize(converted_categories.to_numpy())
+        if np.array_equal(category_codes, np.arange(len(categorical_series.cat.categories))):
+            # Every category converts to a distinct value, so we can keep the codes
+            values = categorical_series.array.rename_categories(new_categories)
+        else:
+            # Missing values have a code of -1, which takes the -1 we add to the end
+            values = pd.Categorical.from_codes(np.append(category_codes, -1)[codes], new_categories)
+    else:
+        values = pd.api.extensions.take(converted_categories.array, codes, allow_fill=True)
+
+    return pd.Series(values, index=categorical_series.index, name=converted_categories.name)
+
+
 def get_datetime_format(string_series: pd.Series) -> Optional[str]:
     """
     Given a series of datetime strings, detects if the format is MM-DD-YYYY,
@@ -114,6 +286,15 @@ def get_datetime_format(string_series: pd.Series) -> Optional[str]:
     In the future, we can extend this to detect other formats. Returns None
     if infer_datetime_format is good enough!
     """
+    if has_low_cardinality(string_series):
+        # The format only depends on the distinct values, in the order they first appear in
+        try:
+            uniques = pd.factorize(string_series.to_numpy())[1]
+            if pd.api.types.infer_dtype(uniques, skipna=False) == 'string':
+                string_series = pd.Series(uniques, dtype=string_series.dtype)
+        except TypeError:
+            pass
+
     try:
         # If we can convert all non null inputs, then we assume that pandas
         # is guessing the input correctly
@@ -131,16 +312,18 @@ def get_datetime_format(string_series: pd.Series) -> Optional[str]:
             return '%m-%d-%Y'
 
 
+# The identifiers for millions and billions in a number string, sorted so that 
+# we return the biggest matching identifier
+MILLION_IDENTIFIERS = list(sorted(["Million", 'Mil', 'M', 'million', 'mil', 'm'], key = len, reverse=True))
+BILLION_IDENTIFIERS = list(sorted(["Billion", 'Bil', 'B', 'billion', 'bil', 'b'], key = len, reverse=True))
+
+
 def get_million_identifier_in_string(string: str) -> Union[str, None]:
     """
     Given a string, returns the million identifier in it. 
     Returns '' if none exist. 
     """
-    million_identifiers = ["Million", 'Mil', 'M', 'million', 'mil', 'm']
-    # So that we return the biggest matching element
-    million_identifiers = list(sorted(million_identifiers, key = len, reverse=True))
-
-    for identifier in million_identifiers:
+    for identifier in MILLION_IDENTIFIERS:
         if identifier in string:
             return identifier
 
@@ -153,11 +336,7 @@ def get_billion_identifier_in_string(string: str) -> Union[str, None]:
     Returns '' if none exist. 
     """
 
-    billion_identifiers = ["Billion", 'Bil', 'B', 'billion', 'bil', 'b']
-    # So that we return the biggest matching element
-    billion_identifiers = list(sorted(billion_identifiers, key = len, reverse=True))
-
-    for identifier in billion_identifiers:
+    for identifier in BILLION_IDENTIFIERS:
         if identifier in string:
             return identifier
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains the sorted indexes of the columns of dataframes, which answer range
+queries on a column (e.g. all values greater than 5) with a binary search,
+rather than a scan of the whole column.
+
+Sorted indexes are cached by the id of the dataframe and the column header, as
+the dataframes in a state are never modified, and are removed when the dataframe
+is garbage collected.
+"""
+import weakref
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.types import ColumnHeader
+
+# The dtypes we build sorted indexes for, as searching them gives exactly the
+# same results as comparing the column to a value
+SORTED_INDEX_DTYPES = [np.dtype('int64'), np.dtype('float64'), np.dtype('datetime64[ns]')]
+
+# For each dataframe, the sorted index of each column, or None if it has been
+# asked for once but was not built yet
+_sorted_indexes: Dict[int, Dict[ColumnHeader, Optional['SortedIndex']]] = {}
+
+
+class SortedIndex():
+    """
+    The positions of the rows of a column, in the order of the values in these
+    rows. Missing values are not in the order, and their positions are stored
+    separately.
+    """
+
+    def __init__(self, series: pd.Series):
+        values = series.to_numpy()
+        is_missing = pd.isna(values)
+        not_missing_positions = np.flatnonzero(~is_missing)
+
+        # We use a stable sort, so that rows with equal values stay in order
+        order = np.argsort(values[not_missing_positions], kind='stable')
+        self.positions = not_missing_positions[order]
+        self.sorted_values = values[self.positions]
+        self.missing_positions = np.flatnonzero(is_missing)
+
+    def __len__(self) -> int:
+        return len(self.positions) + len(self.missing_positions)
+
+    def searchsorted(self, value: Any, side: str) -> int:
+        """
+        Returns the index in the sorted positions that the value would be
+        inserted at, before (left) or after (right) any equal values.
+        """
+        return int(np.searchsorted(self.sorted_values, value, side=side))
+
+
+def get_built_sorted_index(df: pd.DataFrame, column_header: ColumnHeader) -> Optional[SortedIndex]:
+    """
+    Returns the sorted index of the given column of the dataframe if it is 
+    already built, without building it or counting this as a use.
+    """
+    return _sorted_indexes.get(id(df), {}).get(column_header)
+
+
+def get_sorted_index(df: pd.DataFrame, column_header: ColumnHeader, build_on_first_use: bool=False) -> Optional[SortedIndex]:
+    """
+    Returns the sorted index of the given column of the dataframe, or None if
+    we do not build sorted indexes for the dtype of this column.
+
+    As building a sorted index takes much longer than scanning the column once,
+    by default it is only built the second time it is asked for on a column,
+    when it is likely to be used again. Until then, this returns None.
+    """
+    series = df[column_header]
+    if not isinstance(series, pd.Series) or series.dtype not in SORTED_INDEX_DTYPES:
+        return None
+
+    if id(df) not in _sorted_indexes:
+        _sorted_indexes[id(df)] = {}
+        weakref.finalize(df, _sorted_indexes.pop, id(df), None)
+    sorted_indexes = _sorted_indexes[id(df)]
+
+    if column_header not in sorted_indexes and not build_on_first_use:
+        sorted_indexes[column_header] = None
+        return None
+
+    sorted_index = sorted_indexes.get(column_header)
+    if sorted_index is None:
+        sorted_index = SortedIndex(series)
+        sorted_indexes[column_header] = sorted_index
+    return sorted_index
@@ -27,6 +27,62 @@ FORMAT_ROUND_DECIMALS = 'round decimals'
 FORMAT_K_M_B = 'k_m_b'
 FORMAT_SCIENTIFIC_NOTATION = 'scientific notation'
 
+
+class DataFrameList(list):
+    """
+    The list of dataframes in a state. 
+    
+    Besides dataframes, a step can store a view of a dataframe in this list, 
+    which is any object with a materialize function that returns the dataframe
+    it is a view of (e.g. a FilteredDataFrameView). A view is only materialized
+    when it is read from the list, and then replaces itself in the list, so that
+    steps that never read a dataframe never pay to create it.
+    """
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        entry = list.__getitem__(self, index)
+        if not isinstance(entry, pd.DataFrame):
+            entry = entry.materialize()
+            list.__setitem__(self, index, entry)
+        return entry
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def pop(self, index=-1):
+        df = self[index]
+        list.pop(self, index)
+        return df
+
+    def copy(self):
+        return list(self)
+
+    def get_unmaterialized(self, index: int) -> Any:
+        """
+        Returns the dataframe or the view of a dataframe at the given index, 
+        without materializing it.
+        """
+        return list.__getitem__(self, index)
+
+    def copy_dataframes(self, deep: bool) -> 'DataFrameList':
+        """
+        Returns a copy of the list with a copy of each dataframe. Views are 
+        never modified, and so are not copied until they are materialized.
+        """
+        return DataFrameList([
+            entry.copy(deep=deep) if isinstance(entry, pd.DataFrame) else entry 
+            for entry in list.__iter__(self)
+        ])
+
+
 class State():
     """
     State is a container that stores the current state of a Mito analysis,
@@ -45,11 +101,13 @@ class State():
             column_ids: ColumnIDMap=None,
             column_spreadsheet_code: List[Dict[ColumnID, str]]=None,
             column_filters: List[Dict[ColumnID, Any]]=None,
-            column_format_types: List[Dict[ColumnID, Dict[str, Any]]]=None
+            column_format_types: List[Dict[ColumnID, Dict[str, Any]]]=None,
+            column_evaluation_graph: List[Dict[ColumnID, Set[ColumnID]]]=None,
+            column_evaluation_order: List[Dict[ColumnID, int]]=None
         ):
 
         # The dataframes that are in the state
-        self.dfs = list(dfs)
+        self.dfs = dfs if isinstance(dfs, DataFrameList) else DataFrameList(dfs)
 
         # The df_names are composed of two parts:
         # 1. The names of the variables passed into the mitosheet.sheet call (which don't change over time).
@@ -61,13 +119,13 @@ class State():
         # how the dataframe was created. If not df sources passed, then this is in the
         # initialize state, and so these dataframes were passed to the mitosheet
         # call
-        self.df_sources = df_sources if df_sources is not None else [DATAFRAME_SOURCE_PASSED for _ in dfs]
+        self.df_sources = df_sources if df_sources is not None else [DATAFRAME_SOURCE_PASSED for _ in range(len(self.dfs))]
 
         # We then make a column id map if we do not already have one, so that we can identify each
         # of the columns from their static ids through the rest of the analysis. 
         # NOTE: every state variable below that is defined per column is access by _ids_ not
         # by column headers. The column headers _only_ index into the dataframe itself
-        self.column_ids = column_ids if column_ids else ColumnIDMap(dfs)
+        self.column_ids = column_ids if column_ids else ColumnIDMap(self.dfs)
 
         self.column_spreadsheet_code = column_spreadsheet_code if column_spreadsheet_code is not None else [
             {column_id: '' for column_id in self.column_ids.get_column_ids(sheet_index)} 
@@ -83,6 +141,34 @@ class State():
             {column_id: {'type': 'default'} for column_id in self.column_ids.get_column_ids(sheet_index)} 
             for sheet_index in range(len(dfs))
         ]
+
+        # The column evaluation graph is a map from column id -> the column ids with formulas
+        # that reference that column. We keep this up to date as formulas and columns change, 
+        # so that we don't have to reparse every formula in the sheet to build it
+        if column_evaluation_graph is not None:
+            self.column_evaluation_graph = column_evaluation_graph
+        elif column_spreadsheet_code is None:
+            self.column_evaluation_graph = [
+                {column_id: set() for column_id in self.column_ids.get_column_ids(sheet_index)} 
+                for sheet_index in range(len(dfs))
+            ]
+        else:
+            from mitosheet.evaluation_graph_utils import create_column_evaluation_graph
+            self.column_evaluation_graph = [
+                create_column_evaluation_graph(self, sheet_index)
+                for sheet_index in range(len(dfs))
+            ]
+
+        # We also keep a topological order of each column evaluation graph, as a map from 
+        # column id -> position in the order, which we repair as edges are added to the graph
+        if column_evaluation_order is not None:
+            self.column_evaluation_order = column_evaluation_order
+        else:
+            from mitosheet.evaluation_graph_utils import create_column_evaluation_order
+            self.column_evaluation_order = [
+                create_column_evaluation_order(column_evaluation_graph)
+                for column_evaluation_graph in self.column_evaluation_graph
+            ]
     
     def __copy__(self):
         """
@@ -90,13 +176,15 @@ class State():
         function is called, and returns a shallow copy of the state
         """
         return State(
-            [df.copy(deep=False) for df in self.dfs],
+            self.dfs.copy_dataframes(deep=False),
             df_names=deepcopy(self.df_names),
             df_sources=deepcopy(self.df_sources),
             column_ids=deepcopy(self.column_ids),
             column_spreadsheet_code=deepcopy(self.column_spreadsheet_code),
             column_filters=deepcopy(self.column_filters),
-            column_format_types=deepcopy(self.column_format_types)
+            column_format_types=deepcopy(self.column_format_types),
+            column_evaluation_graph=deepcopy(self.column_evaluation_graph),
+            column_evaluation_order=deepcopy(self.column_evaluation_order)
         )
 
 
@@ -106,13 +194,15 @@ class State():
         function is called, and returns a deep copy of the state
         """
         return State(
-            [df.copy(deep=True) for df in self.dfs],
+            self.dfs.copy_dataframes(deep=True),
             df_names=deepcopy(self.df_names),
             df_sources=deepcopy(self.df_sources),
             column_ids=deepcopy(self.column_ids),
             column_spreadsheet_code=deepcopy(self.column_spreadsheet_code),
             column_filters=deepcopy(self.column_filters),
-            column_format_types=deepcopy(self.column_format_types)
+            column_format_types=deepcopy(self.column_format_types),
+            column_evaluation_graph=deepcopy(self.column_evaluation_graph),
+            column_evaluation_order=deepcopy(self.column_evaluation_order)
         )
 
     def add_df_to_state(
@@ -151,6 +241,8 @@ class State():
             self.column_spreadsheet_code.append({column_id: '' for column_id in column_ids})
             self.column_filters.append({column_id: {'operator':'And', 'filters': []} for column_id in column_ids})
             self.column_format_types.append({column_id: {'type': FORMAT_DEFAULT} for column_id in column_ids} if format_types is None else format_types)
+            self.column_evaluation_graph.append({column_id: set() for column_id in column_ids})
+            self.column_evaluation_order.append({column_id: index for index, column_id in enumerate(column_ids)})
 
             # Return the index of this sheet
             return len(self.dfs) - 1
@@ -173,6 +265,8 @@ class State():
             self.column_spreadsheet_code[sheet_index] = {column_id: '' for column_id in column_ids}
             self.column_filters[sheet_index] = {column_id: {'operator':'And', 'filters': []} for column_id in column_ids}
             self.column_format_types[sheet_index] = {column_id: {'type': FORMAT_DEFAULT} for column_id in column_ids} if format_types is None else format_types
+            self.column_evaluation_graph[sheet_index] = {column_id: set() for column_id in column_ids}
+            self.column_evaluation_order[sheet_index] = {column_id: index for index, column_id in enumerate(column_ids)}
 
             # Return the index of this sheet
             return sheet_index
@@ -199,7 +293,16 @@ class State():
         # Loop over all the attributes of this object
         for key, value in self.__dict__.items():
             # And for anything defined on columns, update it to the new id schema
-            if key.startswith('column') and key != 'column_ids':
+            if key == 'column_evaluation_graph':
+                # The graph is also keyed by column ids in its values
+                new_value = [
+                    {
+                        make_valid_header(k): set(make_valid_header(v) for v in dependents) for k, dependents in column_map.items()
+                    } 
+                    for column_map in value
+                ]
+                self.__setattr__(key, new_value)
+            elif key.startswith('column') and key != 'column_ids':
                 new_value = [
                     {
                         make_valid_header(k): v for k, v in column_map.items()
@@ -7,6 +7,7 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from mitosheet.errors import make_column_exists_error, make_no_sheet_error
+from mitosheet.evaluation_graph_utils import add_column_to_evaluation_graph
 from mitosheet.state import FORMAT_DEFAULT, State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.transpiler.transpile_utils import column_header_to_transpiled_code
@@ -67,6 +68,7 @@ class AddColumnStepPerformer(StepPerformer):
         post_state.column_spreadsheet_code[sheet_index][column_id] = '=0'
         post_state.column_filters[sheet_index][column_id] = {'operator': 'And', 'filters': []}
         post_state.column_format_types[sheet_index][column_id] = {'type': FORMAT_DEFAULT}
+        add_column_to_evaluation_graph(post_state.column_evaluation_graph[sheet_index], post_state.column_evaluation_order[sheet_index], column_id)
             
         # Update the dataframe
         post_state.dfs[sheet_index].insert(column_header_index, column_header, 0)
@@ -10,6 +10,7 @@ import pandas as pd
 from mitosheet.errors import get_recent_traceback, make_invalid_column_type_change_error
 from mitosheet.sheet_functions.types import to_int_series
 from mitosheet.sheet_functions.types.to_boolean_series import to_boolean_series
+from mitosheet.sheet_functions.types.to_datetime_series import to_datetime_series
 from mitosheet.sheet_functions.types.to_float_series import to_float_series
 from mitosheet.sheet_functions.types.to_timedelta_series import \
     to_timedelta_series
@@ -146,20 +147,7 @@ class ChangeColumnDtypeStepPerformer(StepPerformer):
                     pass
                 elif is_datetime_dtype(new_dtype):
                     # Guess the datetime format to the best of Pandas abilities
-                    datetime_format = get_datetime_format(column)
-                    # If it's None, then infer_datetime_format is enough to figure it out
-                    if datetime_format is not None:
-                        new_column = pd.to_datetime(
-                            column,
-                            format=datetime_format,
-                            errors='coerce'
-                        )
-                    else:
-                        new_column = pd.to_datetime(
-                            column,
-                            infer_datetime_format=True,
-                            errors='coerce'
-                        )
+                    new_column = to_datetime_series(column)
                 elif is_timedelta_dtype(new_dtype):
                     new_column = to_timedelta_series(column)
             elif is_datetime_dtype(old_dtype):
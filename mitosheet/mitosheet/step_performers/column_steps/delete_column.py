@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from mitosheet.errors import make_invalid_column_delete_error
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
-from mitosheet.evaluation_graph_utils import create_column_evaluation_graph, topological_sort_columns
+from mitosheet.evaluation_graph_utils import delete_column_from_evaluation_graph, sort_columns_by_evaluation_order
 from mitosheet.transpiler.transpile_utils import column_header_list_to_transpiled_code
 from mitosheet.types import ColumnID
 
@@ -103,11 +103,11 @@ def delete_column_ids(
     column_ids: List[ColumnID],
 ) -> State:
 
-    column_evaluation_graph = create_column_evaluation_graph(state, sheet_index)
+    column_evaluation_graph = state.column_evaluation_graph[sheet_index]
 
     # Put the columns in a topological sorting so we delete columns that reference
     # other columns in column_ids first, in order to avoid make_invalid_column_delete_error
-    topologicaly_sorted_column_ids = topological_sort_columns(column_evaluation_graph)
+    topologicaly_sorted_column_ids = sort_columns_by_evaluation_order(column_evaluation_graph.keys(), state.column_evaluation_order[sheet_index])
     sorted_column_ids_to_delete = list(filter(lambda column_id: column_id in column_ids, topologicaly_sorted_column_ids))
     sorted_column_ids_to_delete.reverse()
 
@@ -136,7 +136,7 @@ def _delete_column_id(
     column_id: ColumnID
 ) -> Tuple[State, bool]:
     
-    column_evaluation_graph = create_column_evaluation_graph(state, sheet_index)
+    column_evaluation_graph = state.column_evaluation_graph[sheet_index]
     column_header = state.column_ids.get_column_header_by_id(sheet_index, column_id)
     
     # Return False if there are any columns that currently rely on this column, 
@@ -153,9 +153,7 @@ def _delete_column_id(
     del state.column_format_types[sheet_index][column_id]
 
     # We also have to delete the places in the graph where this node is 
-    for dependents in column_evaluation_graph.values():
-        if column_id in dependents:
-            dependents.remove(column_id)
+    delete_column_from_evaluation_graph(column_evaluation_graph, state.column_evaluation_order[sheet_index], column_id)
     # Clean up the IDs
     state.column_ids.delete_column_id(sheet_index, column_id)
     
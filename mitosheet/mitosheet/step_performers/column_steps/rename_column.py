@@ -8,7 +8,6 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from mitosheet.errors import make_column_exists_error
-from mitosheet.evaluation_graph_utils import create_column_evaluation_graph
 from mitosheet.parser import safe_replace
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
@@ -147,7 +146,7 @@ def rename_column_headers_in_state(
 
     # Save original column headers and eval graph, so we can use them below
     original_column_headers = list(post_state.dfs[sheet_index].keys())
-    column_evaluation_graph = create_column_evaluation_graph(post_state, sheet_index)
+    column_evaluation_graph = post_state.column_evaluation_graph[sheet_index]
 
     # If the level is not set, just do a simple rename
     post_state.dfs[sheet_index].rename(columns={old_column_header: new_column_header}, inplace=True)
@@ -3,6 +3,8 @@
 
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
+import os
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -15,9 +17,13 @@ from mitosheet.parser import parse_formula
 from mitosheet.sheet_functions import FUNCTIONS
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
-from mitosheet.evaluation_graph_utils import (create_column_evaluation_graph, creates_circularity, topological_sort_dependent_columns)
+from mitosheet.evaluation_graph_utils import (creates_circularity, get_column_dependencies, set_column_dependencies, topological_levels_of_dependent_columns, topological_sort_dependent_columns)
+from mitosheet.formula_compiler import CompiledFormula, SubexpressionCache, compile_formula
 from mitosheet.types import ColumnHeader, ColumnID
 
+# The most threads we use to evaluate independent formulas at once
+MAX_RECOMPUTE_THREADS = os.cpu_count() or 1
+
 
 class SetColumnFormulaStepPerformer(StepPerformer):
     """
@@ -100,12 +106,10 @@ class SetColumnFormulaStepPerformer(StepPerformer):
         if any(missing_functions):
             raise make_unsupported_function_error(missing_functions, error_modal=False)
 
-        # Then, we get the list of old column dependencies and new dependencies
-        # so that we can update the graph
-        _, _, old_dependencies_column_headers = parse_formula(old_formula, column_header, column_headers)
-        old_dependencies = set(prev_state.column_ids.get_column_ids(sheet_index, old_dependencies_column_headers))
-
-        column_evaluation_graph = create_column_evaluation_graph(prev_state, sheet_index)
+        # Then, we get the list of old column dependencies from the graph, so that we 
+        # can update the graph with the new dependencies
+        column_evaluation_graph = prev_state.column_evaluation_graph[sheet_index]
+        old_dependencies = get_column_dependencies(column_evaluation_graph, column_id)
 
         # Before changing any variables, we make sure this edit didn't
         # introduct any circularity
@@ -113,7 +117,8 @@ class SetColumnFormulaStepPerformer(StepPerformer):
             column_evaluation_graph, 
             column_id,
             old_dependencies,
-            new_dependencies
+            new_dependencies,
+            column_evaluation_order=prev_state.column_evaluation_order[sheet_index]
         )
         if circularity:
             raise make_circular_reference_error(error_modal=False)
@@ -124,6 +129,13 @@ class SetColumnFormulaStepPerformer(StepPerformer):
         # Update the column formula, and then execute the new formula graph
         try:
             post_state.column_spreadsheet_code[sheet_index][column_id] = new_formula
+            set_column_dependencies(
+                post_state.column_evaluation_graph[sheet_index], 
+                post_state.column_evaluation_order[sheet_index], 
+                column_id, 
+                old_dependencies, 
+                new_dependencies
+            )
             refresh_dependant_columns(post_state, post_state.dfs[sheet_index], sheet_index, column_id)
         except MitoError as e:
             # Catch the error and make sure that we don't set the error modal
@@ -266,13 +278,104 @@ def get_details_from_operator_type_error(error: TypeError) -> Optional[Tuple[str
     return None
 
 
+def evaluate_compiled_formula(compiled_formula: CompiledFormula, df: pd.DataFrame, subexpression_cache: SubexpressionCache) -> Any:
+    """
+    Helper function for evaluating a formula, and turning any errors that it 
+    throws into errors that tell the user how to fix their formula.
+    """
+    try:
+        return compiled_formula.evaluate(df, subexpression_cache)
+    except TypeError as e:
+        # We catch TypeErrors specificially, so that we can case on operator errors, to 
+        # give better error messages
+        operator_type_error_details = get_details_from_operator_type_error(e)
+        if operator_type_error_details is not None:
+            # If there is an operator error, we handle it specially, to give the user
+            # more information about how to recover
+            raise make_operator_type_error(*operator_type_error_details)
+        else:
+            # If it's not an operator error, we just propagate the error up
+            raise e
+    except NameError as e:
+        # If we have a column header that does not exist in the formula, we may
+        # throw a name error, in which case we alert the user
+        column_header = str(e).split('\'')[1]
+        raise make_no_column_error({column_header})
+
+
 def refresh_dependant_columns(post_state: State, df: pd.DataFrame, sheet_index: int, column_id: ColumnID) -> None:
     """
     Helper function for refreshing the columns that are dependant on the column we are changing. 
+
+    All the formulas refreshed in this pass share a cache of their sub-expressions, so that
+    any sub-expression that appears in multiple formulas is only computed once. Each formula
+    is also compiled against the current dtypes of the df, to skip no-op type conversions.
+
+    As columns in the same topological level do not depend on each other, we evaluate all 
+    the formulas in a level concurrently on a thread pool (as most of the work is done by
+    pandas and numpy, which release the GIL), and then assign them to the df in order.
     """
+    topological_levels = topological_levels_of_dependent_columns(post_state, sheet_index, column_id)
+    column_headers = post_state.dfs[sheet_index].keys()
+    subexpression_cache = SubexpressionCache()
+
+    executor: Optional[ThreadPoolExecutor] = None
+    try:
+        for topological_level in topological_levels:
+            compiled_formulas = []
+            for column_id in topological_level:
+                if post_state.column_spreadsheet_code[sheet_index][column_id] == '':
+                    continue
+
+                column_header = post_state.column_ids.get_column_header_by_id(sheet_index, column_id)
+                python_code, _, _ = parse_formula(
+                    post_state.column_spreadsheet_code[sheet_index][column_id], 
+                    column_header,
+                    column_headers
+                )
+                compiled_formulas.append(compile_formula(python_code, df, subexpression_cache))
+
+            if len(compiled_formulas) <= 1:
+                values = [evaluate_compiled_formula(compiled_formula, df, subexpression_cache) for compiled_formula in compiled_formulas]
+            else:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=MAX_RECOMPUTE_THREADS)
+                futures = [
+                    executor.submit(evaluate_compiled_formula, compiled_formula, df, subexpression_cache) 
+                    for compiled_formula in compiled_formulas
+                ]
+                # NOTE: we take the results in order, so that if multiple formulas
+                # error, we report the same error as if they were evaluated in order
+                values = [future.result() for future in futures]
+
+            for compiled_formula, value in zip(compiled_formulas, values):
+                compiled_formula.assign(df, value)
+                # Any cached sub-expressions that read this column are now stale
+                subexpression_cache.invalidate_column(compiled_formula.written_column_key)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def refresh_dependant_columns_in_row(post_state: State, df: pd.DataFrame, sheet_index: int, column_id: ColumnID, row_index: Any) -> bool:
+    """
+    Helper function for refreshing the columns that are dependant on the column we are changing, 
+    when only the row at row_index has changed in this column. 
+
+    If all the dependant formulas are row-wise, then only this row changes in each of the dependant 
+    columns, and so we only evaluate the formulas on this row, and write the results into the df 
+    in place. Returns True if this is possible and the df is refreshed, and otherwise returns False 
+    without modifying the df, in which case use refresh_dependant_columns instead.
+    """
+    # We need to be able to select the row and columns unambiguously
+    if not df.index.is_unique or not df.columns.is_unique:
+        return False
+
     topological_sort = topological_sort_dependent_columns(post_state, sheet_index, column_id)
     column_headers = post_state.dfs[sheet_index].keys()
+    row_df = df.loc[[row_index]].copy()
 
+    refreshed_column_headers = []
     for column_id in topological_sort:
         if post_state.column_spreadsheet_code[sheet_index][column_id] == '':
             continue
@@ -283,31 +386,28 @@ def refresh_dependant_columns(post_state: State, df: pd.DataFrame, sheet_index:
             column_header,
             column_headers
         )
+        compiled_formula = compile_formula(python_code, row_df, SubexpressionCache())
+        if not compiled_formula.is_row_wise:
+            return False
 
-        # Exec the code, where the df is the original dataframe
-        # See explination here: https://www.tutorialspoint.com/exec-in-python
         try:
-            exec(
-                python_code,
-                {'df': df}, 
-                FUNCTIONS
-            )
-        except TypeError as e:
-            # We catch TypeErrors specificially, so that we can case on operator errors, to 
-            # give better error messages
-            operator_type_error_details = get_details_from_operator_type_error(e)
-            if operator_type_error_details is not None:
-                # If there is an operator error, we handle it specially, to give the user
-                # more information about how to recover
-                raise make_operator_type_error(*operator_type_error_details)
-            else:
-                # If it's not an operator error, we just propagate the error up
-                raise e
-        except NameError as e:
-            # If we have a column header that does not exist in the formula, we may
-            # throw a name error, in which case we alert the user
-            column_header = str(e).split('\'')[1]
-            raise make_no_column_error({column_header})
+            value = compiled_formula.evaluate(row_df, SubexpressionCache())
+            compiled_formula.assign(row_df, value)
+        except:
+            # If there is an error, we let refreshing the entire columns report it
+            return False
+        refreshed_column_headers.append(column_header)
+
+    # If the refreshed row has a different dtype than the column, then refreshing 
+    # the entire column would change the dtype of the column, so we can't do it in place
+    for column_header in refreshed_column_headers:
+        if row_df[column_header].dtype != df[column_header].dtype:
+            return False
+
+    for column_header in refreshed_column_headers:
+        df.at[row_index, column_header] = row_df.at[row_index, column_header]
+    
+    return True
 
 
 def transpile_dependant_columns(
@@ -54,6 +54,8 @@ class DataframeDeleteStepPerformer(StepPerformer):
         post_state.column_spreadsheet_code.pop(sheet_index)
         post_state.column_filters.pop(sheet_index)
         post_state.column_format_types.pop(sheet_index)
+        post_state.column_evaluation_graph.pop(sheet_index)
+        post_state.column_evaluation_order.pop(sheet_index)
         post_state.dfs.pop(sheet_index)
         post_state.df_names.pop(sheet_index)
         post_state.df_sources.pop(sheet_index)
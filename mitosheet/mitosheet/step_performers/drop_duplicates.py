@@ -3,9 +3,10 @@
 
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Set, Union
 
+from mitosheet.row_fingerprint_utils import get_duplicated
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.errors import (
@@ -64,13 +65,21 @@ class DropDuplicatesStepPerformer(StepPerformer):
         if len(column_headers) == 0:
             return None
 
-        # We make a new state to modify it
-        post_state = deepcopy(prev_state)
-
-        post_state.dfs[sheet_index] = post_state.dfs[sheet_index].drop_duplicates(
-            subset=column_headers,
-            keep=keep
-        )
+        # We make a new state to modify it. As dropping duplicates does not modify 
+        # any dataframe, a shallow copy of the state is enough
+        post_state = copy(prev_state)
+
+        df = prev_state.dfs[sheet_index]
+        # We find the duplicates from the cached column codes, so changing the subset
+        # only factorizes the columns that were not in a subset before
+        duplicated = get_duplicated(df, column_headers, keep)
+        if duplicated is not None:
+            post_state.dfs[sheet_index] = df[~duplicated]
+        else:
+            post_state.dfs[sheet_index] = df.drop_duplicates(
+                subset=column_headers,
+                keep=keep
+            )
 
         return post_state, None
 
@@ -3,13 +3,19 @@
 
 # Copyright (c) Mito.
 
-from copy import deepcopy
+from copy import copy
 import functools
+import json
+import re
+import weakref
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import numpy as np
 import pandas as pd
 from datetime import date
 
 from mitosheet.sheet_functions.types.utils import is_datetime_dtype
+from mitosheet.sorted_index_utils import get_sorted_index
+from mitosheet.string_index_utils import get_string_index
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.state import State
 from mitosheet.transpiler.transpile_utils import (
@@ -74,95 +80,124 @@ FILTER_FORMAT_STRING_DICT = {
     FC_DATETIME_LESS_THAN_OR_EQUAL: "{df_name}[{transpiled_column_header}] <= pd.to_datetime('{value}')",
 }
 
-# Dict used when there a specific filter condition has multiple
-# filters that use it. Helps us write cleaner filter code!
+# Dict used when a specific filter condition has multiple filters that use
+# it, and they check if the value is (or is not) one of the filter values
 FILTER_FORMAT_STRING_MULTIPLE_VALUES_DICT = {
-    FC_EMPTY: {
-        "Or": "{df_name}[{transpiled_column_header}].isna()",
-        "And": "{df_name}[{transpiled_column_header}].isna()",
-    },
-    FC_NOT_EMPTY: {
-        "Or": "{df_name}[{transpiled_column_header}].notnull()",
-        "And": "{df_name}[{transpiled_column_header}].notnull()",
-    },
-    FC_BOOLEAN_IS_TRUE: {
-        "Or": "{df_name}[{transpiled_column_header}] == True",
-        "And": "{df_name}[{transpiled_column_header}] == True",
-    },
-    FC_BOOLEAN_IS_FALSE: {
-        "Or": "{df_name}[{transpiled_column_header}] == False",
-        "And": "{df_name}[{transpiled_column_header}] == False",
-    },
     FC_NUMBER_EXACTLY: {
         "Or": "{df_name}[{transpiled_column_header}].isin({values})",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val == n for n in {values}))",
     },
     FC_NUMBER_NOT_EXACTLY: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val != n for n in {values}))",
         "And": "~{df_name}[{transpiled_column_header}].isin({values})",
     },
-    FC_NUMBER_GREATER: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val > n for n in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val > n for n in {values}))",
-    },
-    FC_NUMBER_GREATER_THAN_OR_EQUAL: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val >= n for n in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val >= n for n in {values}))",
-    },
-    FC_NUMBER_LESS: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val < n for n in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val < n for n in {values}))",
-    },
-    FC_NUMBER_LESS_THAN_OR_EQUAL: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val <= n for n in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val <= n for n in {values}))",
-    },
-    FC_STRING_CONTAINS: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(s in str(val) for s in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(s in str(val) for s in {values}))",
-    },
-    FC_STRING_DOES_NOT_CONTAIN: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(s not in str(val) for s in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(s not in str(val) for s in {values}))",
-    },
     FC_STRING_EXACTLY: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val == s for s in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val == s for s in {values}))",
+        "Or": "{df_name}[{transpiled_column_header}].isin({values})",
     },
     FC_STRING_NOT_EXACTLY: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val != s for s in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val != s for s in {values}))",
+        "And": "~{df_name}[{transpiled_column_header}].isin({values})",
     },
     FC_DATETIME_EXACTLY: {
         "Or": "{df_name}[{transpiled_column_header}].isin({values})",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val == d for d in {values}))",
     },
     FC_DATETIME_NOT_EXACTLY: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val != d for d in {values}))",
         "And": "~{df_name}[{transpiled_column_header}].isin({values})",
     },
-    FC_DATETIME_GREATER: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val > d for d in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val > d for d in {values}))",
-    },
-    FC_DATETIME_GREATER_THAN_OR_EQUAL: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val >= d for d in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val >= d for d in {values}))",
-    },
-    FC_DATETIME_LESS: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val < d for d in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val < d for d in {values}))",
-    },
-    FC_DATETIME_LESS_THAN_OR_EQUAL: {
-        "Or": "{df_name}[{transpiled_column_header}].apply(lambda val: any(val <= d for d in {values}))",
-        "And": "{df_name}[{transpiled_column_header}].apply(lambda val: all(val <= d for d in {values}))",
-    },
 }
 
+# Filter conditions that pass values above (or below) the filter value. Multiple
+# filters with one of these conditions reduce to a single filter with either
+# the tightest value (for And) or the loosest value (for Or)
+LOWER_BOUND_FILTER_CONDITIONS = {
+    FC_NUMBER_GREATER,
+    FC_NUMBER_GREATER_THAN_OR_EQUAL,
+    FC_DATETIME_GREATER,
+    FC_DATETIME_GREATER_THAN_OR_EQUAL,
+}
+UPPER_BOUND_FILTER_CONDITIONS = {
+    FC_NUMBER_LESS,
+    FC_NUMBER_LESS_THAN_OR_EQUAL,
+    FC_DATETIME_LESS,
+    FC_DATETIME_LESS_THAN_OR_EQUAL,
+}
+
+DATETIME_FILTER_CONDITIONS = {
+    FC_DATETIME_EXACTLY,
+    FC_DATETIME_NOT_EXACTLY,
+    FC_DATETIME_GREATER,
+    FC_DATETIME_GREATER_THAN_OR_EQUAL,
+    FC_DATETIME_LESS,
+    FC_DATETIME_LESS_THAN_OR_EQUAL,
+}
+
+# For each range filter condition, the side of equal values that searching the sorted
+# index for the value returns, and if the rows that meet the condition are after it
+SORTED_INDEX_SEARCH_SIDES = {
+    FC_NUMBER_GREATER: ("right", True),
+    FC_NUMBER_GREATER_THAN_OR_EQUAL: ("left", True),
+    FC_NUMBER_LESS: ("left", False),
+    FC_NUMBER_LESS_THAN_OR_EQUAL: ("right", False),
+    FC_DATETIME_GREATER: ("right", True),
+    FC_DATETIME_GREATER_THAN_OR_EQUAL: ("left", True),
+    FC_DATETIME_LESS: ("left", False),
+    FC_DATETIME_LESS_THAN_OR_EQUAL: ("right", False),
+}
+
+# We only use the sorted index of a column for a range filter if it keeps (or removes)
+# at most this fraction of the rows, as otherwise scanning the column is faster
+MAX_SORTED_INDEX_FILTER_FRACTION = .1
+
+# The characters that have a special meaning in the regex of a contains filter, other
+# than |, which we use to combine contains filters
+REGEX_SPECIAL_CHARACTERS = set(".^$*+?{}[]\\()")
+
 # If there are multiple conditions, we combine them together, with the
 # given operator in the middle
 OPERATOR_SIGNS = {"Or": "|", "And": "&"}
 
+# To make editing a filter fast, we cache the filter indexes of each column against the
+# unfiltered dataframe they filter (the base dataframe), and remember which base dataframe
+# and filters each filtered dataframe was created from. Both are keyed by the id of the
+# dataframe, and are removed when this dataframe is garbage collected
+_base_dataframe_filter_indexes: Dict[int, Dict[ColumnID, List[Tuple[Any, Optional[pd.Series]]]]] = {}
+MAX_CACHED_FILTERS_PER_COLUMN = 3
+_filtered_dataframes: Dict[int, Tuple[Any, pd.DataFrame, Dict[ColumnID, Tuple[ColumnHeader, str, Any]], pd.Series]] = {}
+
+# If a filter keeps less than this fraction of the rows of the base dataframe, we 
+# copy these rows straight away, rather than storing a view of the base dataframe
+MIN_VIEW_SELECTED_ROWS_FRACTION = .1
+
+
+class FilteredDataFrameView():
+    """
+    A view of the rows of a base dataframe that meet the filters on its columns,
+    which the filter step stores in the state rather than a copy of these rows.
+
+    Each view only stores the positions of the rows it selects, so a chain of 
+    filter steps does not copy the dataframe at each step. The rows are only 
+    copied when the dataframe is read from the state, by the step after the 
+    filters, or to send the sheet to the frontend.
+    """
+
+    def __init__(
+        self,
+        base_df: pd.DataFrame,
+        column_filters: Dict[ColumnID, Tuple[ColumnHeader, str, Any]],
+        filter_indexes: pd.Series,
+    ):
+        self.base_df = base_df
+        self.column_filters = column_filters
+        self.filter_indexes = filter_indexes
+        self.row_positions = np.flatnonzero(filter_indexes.to_numpy(dtype=bool))
+
+    def __len__(self) -> int:
+        return len(self.row_positions)
+
+    def materialize(self) -> pd.DataFrame:
+        df = self.base_df.take(self.row_positions)
+        # We remember where the dataframe came from, so filtering it again uses the cache
+        _filtered_dataframes[id(df)] = (weakref.ref(df), self.base_df, self.column_filters, self.filter_indexes)
+        weakref.finalize(df, _filtered_dataframes.pop, id(df), None)
+        return df
+
 
 class FilterStepPerformer(StepPerformer):
     """
@@ -220,12 +255,13 @@ class FilterStepPerformer(StepPerformer):
             sheet_index, column_id
         )
 
-        # If no errors we create a new step for this filter
-        post_state = deepcopy(prev_state)
+        # If no errors we create a new step for this filter. As filtering does not
+        # modify any dataframe, a shallow copy of the state is enough
+        post_state = copy(prev_state)
 
         # Execute the filter
-        post_state.dfs[sheet_index] = _execute_filter(
-            prev_state.dfs[sheet_index], column_header, operator, filters
+        post_state.dfs[sheet_index] = execute_filter_on_base(
+            prev_state.dfs.get_unmaterialized(sheet_index), column_id, column_header, operator, filters
         )
 
         # Keep track of which columns are filtered
@@ -250,7 +286,10 @@ class FilterStepPerformer(StepPerformer):
         column_header = post_state.column_ids.get_column_header_by_id(
             sheet_index, column_id
         )
-        column_dtype = str(post_state.dfs[sheet_index][column_header].dtype)
+        # Filtering does not change the dtype of a column, so we read it from the
+        # base dataframe rather than materializing the filtered dataframe
+        base_df, _, _ = get_filter_base(post_state.dfs.get_unmaterialized(sheet_index))
+        column_dtype = str(base_df[column_header].dtype)
 
         filters_only = [
             filter_or_group
@@ -340,6 +379,155 @@ class FilterStepPerformer(StepPerformer):
         return {sheet_index}
 
 
+def get_filter_timestamp(value: Any) -> Any:
+    """
+    Returns the timestamp that a datetime filter compares to.
+    """
+    # Check that we were given something that can be understood as a date
+    try:
+        return pd.to_datetime(value)
+    except:
+        # If we hit an error, because we restrict the input datetime,
+        # this is probably occuring because the user has only partially input the date,
+        # and so in this case, we just default it to the minimum possible timestamp for now!
+        return date.min
+
+
+def is_combinable_contains_value(value: Any) -> bool:
+    """
+    Returns True if the value of a contains filter can be combined with others
+    into a single regex alternation, which is true for any regex that does not
+    use groups or flags (which would change meaning inside the alternation).
+    """
+    if not isinstance(value, str) or "(?" in value:
+        return False
+    try:
+        return re.compile(value).groups == 0
+    except re.error:
+        return False
+
+
+def reduce_filters_with_condition(
+    condition: str, operator: str, filters: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Given filters that all have the same condition, returns as few filters as 
+    possible that give the same result when combined with the operator.
+
+    Most of the time, this is a single filter: bounds reduce to the tightest (or 
+    loosest) bound, contains filters combine into one regex, and repeated values
+    are removed. Otherwise, the remaining filters must be combined one by one,
+    or with isin for the conditions in FILTER_FORMAT_STRING_MULTIPLE_VALUES_DICT.
+    """
+    unique_filters: List[Dict[str, Any]] = []
+    for filter_ in filters:
+        if all(filter_["value"] != unique_filter["value"] for unique_filter in unique_filters):
+            unique_filters.append(filter_)
+
+    if len(unique_filters) <= 1:
+        return unique_filters
+
+    if condition in LOWER_BOUND_FILTER_CONDITIONS or condition in UPPER_BOUND_FILTER_CONDITIONS:
+        # A value passes all lower bounds if it passes the highest one, and any lower
+        # bound if it passes the lowest one (and the opposite for upper bounds)
+        use_highest_value = (condition in LOWER_BOUND_FILTER_CONDITIONS) == (operator == "And")
+        sort_keys = [filter_["value"] for filter_ in unique_filters]
+        if condition in DATETIME_FILTER_CONDITIONS:
+            sort_keys = [get_filter_timestamp(value) for value in sort_keys]
+            # Invalid dates are not timestamps, and so we use each filter
+            if not all(isinstance(sort_key, pd.Timestamp) for sort_key in sort_keys):
+                return unique_filters
+
+        try:
+            sort_key_index = sort_keys.index(max(sort_keys) if use_highest_value else min(sort_keys))
+        except TypeError:
+            # If the values cannot be compared, we use each filter
+            return unique_filters
+        return [unique_filters[sort_key_index]]
+
+    if (condition == FC_STRING_CONTAINS and operator == "Or") or (
+        condition == FC_STRING_DOES_NOT_CONTAIN and operator == "And"
+    ):
+        # A value contains any of the regexes if it contains their alternation
+        if all(is_combinable_contains_value(filter_["value"]) for filter_ in unique_filters):
+            return [
+                {
+                    "condition": condition,
+                    "value": "|".join(filter_["value"] for filter_ in unique_filters),
+                }
+            ]
+
+    return unique_filters
+
+
+def get_applied_range_filter(
+    df: pd.DataFrame, column_header: ColumnHeader, condition: str, value: Any
+) -> Optional[pd.Series]:
+    """
+    Returns the filter indexes of a range filter, found by searching the sorted
+    index of the column for the value, which is much faster than scanning the
+    column when the filter keeps or removes only a few rows. 
+    
+    Returns None if the filter should scan the column instead.
+    """
+    if condition in DATETIME_FILTER_CONDITIONS:
+        value = get_filter_timestamp(value)
+        if not isinstance(value, pd.Timestamp) or value.tz is not None:
+            return None
+        value = value.to_datetime64()
+    elif isinstance(value, bool) or not isinstance(value, (int, float)) or np.isnan(value):
+        return None
+
+    sorted_index = get_sorted_index(df, column_header)
+    # We never compare numbers to dates, as comparing the column to the value errors
+    if sorted_index is None or (sorted_index.sorted_values.dtype.kind == "M") != (condition in DATETIME_FILTER_CONDITIONS):
+        return None
+
+    side, keeps_rows_after = SORTED_INDEX_SEARCH_SIDES[condition]
+    search_index = sorted_index.searchsorted(value, side)
+    if keeps_rows_after:
+        kept_positions, removed_positions = sorted_index.positions[search_index:], sorted_index.positions[:search_index]
+    else:
+        kept_positions, removed_positions = sorted_index.positions[:search_index], sorted_index.positions[search_index:]
+    num_kept = len(kept_positions)
+
+    if min(num_kept, len(df) - num_kept) > len(df) * MAX_SORTED_INDEX_FILTER_FRACTION:
+        return None
+
+    if num_kept <= len(df) - num_kept:
+        filter_indexes = np.zeros(len(df), dtype=bool)
+        filter_indexes[kept_positions] = True
+    else:
+        filter_indexes = np.ones(len(df), dtype=bool)
+        filter_indexes[removed_positions] = False
+        filter_indexes[sorted_index.missing_positions] = False
+    return pd.Series(filter_indexes, index=df.index, name=column_header)
+
+
+def get_applied_contains_filter(
+    df: pd.DataFrame, column_header: ColumnHeader, value: Any
+) -> Optional[pd.Series]:
+    """
+    Returns the filter indexes of the rows that contain the value, found with 
+    the string index of the column, if the value is a plain substring (or an
+    alternation of plain substrings) rather than a regex. 
+    
+    Returns None if the filter should check every row instead.
+    """
+    if not isinstance(value, str):
+        return None
+    substrings = value.split("|")
+    if any(character in REGEX_SPECIAL_CHARACTERS for substring in substrings for character in substring):
+        return None
+
+    string_index = get_string_index(df, column_header)
+    if string_index is None:
+        return None
+
+    filter_indexes = functools.reduce(np.logical_or, [string_index.contains(substring) for substring in substrings])
+    return pd.Series(filter_indexes, index=df.index, name=column_header)
+
+
 def get_applied_filter(
     df: pd.DataFrame, column_header: ColumnHeader, filter_: Dict[str, Any]
 ) -> pd.Series:
@@ -350,6 +538,13 @@ def get_applied_filter(
     condition = filter_["condition"]
     value = filter_["value"]
 
+    # Range filters are often changed back and forth on the same column, so we
+    # try to answer them from the sorted index of the column
+    if condition in SORTED_INDEX_SEARCH_SIDES:
+        filter_indexes = get_applied_range_filter(df, column_header, condition, value)
+        if filter_indexes is not None:
+            return filter_indexes
+
     # First, check shared filter conditions
     if condition == FC_EMPTY:
         return df[column_header].isna()
@@ -362,7 +557,13 @@ def get_applied_filter(
     elif condition == FC_BOOLEAN_IS_FALSE:
         return df[column_header] == False
 
-    # Then string
+    # Then string. As each keystroke in the filter changes a contains filter, 
+    # we try to answer them from the string index of the column
+    if condition in (FC_STRING_CONTAINS, FC_STRING_DOES_NOT_CONTAIN):
+        filter_indexes = get_applied_contains_filter(df, column_header, value)
+        if filter_indexes is not None:
+            return filter_indexes if condition == FC_STRING_CONTAINS else ~filter_indexes
+
     if condition == FC_STRING_CONTAINS:
         return df[column_header].str.contains(value, na=False)
     if condition == FC_STRING_DOES_NOT_CONTAIN:
@@ -386,14 +587,7 @@ def get_applied_filter(
     elif condition == FC_NUMBER_LESS_THAN_OR_EQUAL:
         return df[column_header] <= value
 
-    # Check that we were given something that can be understood as a date
-    try:
-        timestamp = pd.to_datetime(value)
-    except:
-        # If we hit an error, because we restrict the input datetime,
-        # this is probably occuring because the user has only partially input the date,
-        # and so in this case, we just default it to the minimum possible timestamp for now!
-        timestamp = date.min
+    timestamp = get_filter_timestamp(value)
 
     if condition == FC_DATETIME_EXACTLY:
         return df[column_header] == timestamp
@@ -425,45 +619,210 @@ def combine_filters(operator: str, filters: pd.Series) -> pd.Series:
     return functools.reduce(filter_reducer, filters)
 
 
-def _execute_filter(
+def get_applied_filters_with_condition(
     df: pd.DataFrame,
     column_header: ColumnHeader,
     operator: str,
+    condition: str,
     filters: List[Dict[str, Any]],
-) -> pd.DataFrame:
+) -> pd.Series:
     """
-    Executes a filter on the given column, filtering by removing any rows who
-    don't meet the condition.
+    Given filters that all have the same condition, returns the filter indexes 
+    of combining them with the operator, checking the column as few times as possible.
     """
+    filters = reduce_filters_with_condition(condition, operator, filters)
+    if len(filters) == 1:
+        return get_applied_filter(df, column_header, filters[0])
+
+    if operator in FILTER_FORMAT_STRING_MULTIPLE_VALUES_DICT.get(condition, {}):
+        values = [filter_["value"] for filter_ in filters]
+        if condition in DATETIME_FILTER_CONDITIONS:
+            values = [get_filter_timestamp(value) for value in values]
+        # Exactly filters combined with Or, and not exactly filters combined with And
+        if condition in (FC_NUMBER_EXACTLY, FC_STRING_EXACTLY, FC_DATETIME_EXACTLY):
+            return df[column_header].isin(values)
+        return ~df[column_header].isin(values)
+
+    return combine_filters(
+        operator,
+        [get_applied_filter(df, column_header, filter_) for filter_ in filters],
+    )
 
-    applied_filters = []
 
-    for filter_or_group in filters:
+def get_applied_filters(
+    df: pd.DataFrame,
+    column_header: ColumnHeader,
+    operator: str,
+    filters: List[Dict[str, Any]],
+) -> List[pd.Series]:
+    """
+    Returns the filter indexes of each condition in the filters, which must be
+    combined with the operator.
+    """
+    conditions: List[str] = []
+    for filter_ in filters:
+        if filter_["condition"] not in conditions:
+            conditions.append(filter_["condition"])
+
+    return [
+        get_applied_filters_with_condition(
+            df,
+            column_header,
+            operator,
+            condition,
+            [filter_ for filter_ in filters if filter_["condition"] == condition],
+        )
+        for condition in conditions
+    ]
+
+
+def get_filter_indexes(
+    df: pd.DataFrame,
+    column_header: ColumnHeader,
+    operator: str,
+    filters: List[Dict[str, Any]],
+) -> Optional[pd.Series]:
+    """
+    Returns the filter indexes of the rows that meet the filters on the given 
+    column, or None if there are no filters to apply.
+    """
+    # We apply all filters with the same condition at once
+    applied_filters = get_applied_filters(
+        df,
+        column_header,
+        operator,
+        [filter_or_group for filter_or_group in filters if "filters" not in filter_or_group],
+    )
 
+    for filter_or_group in filters:
         # If it's a group, then we build the filters for the group, combine them
         # and then add that to the applied filters
         if "filters" in filter_or_group:
-            group_filters = []
-            for filter_ in filter_or_group["filters"]:
-                group_filters.append(get_applied_filter(df, column_header, filter_))
+            group_filters = get_applied_filters(
+                df, column_header, filter_or_group["operator"], filter_or_group["filters"]
+            )
 
             if len(group_filters) > 0:
                 applied_filters.append(
                     combine_filters(filter_or_group["operator"], group_filters)
                 )
 
-        # Otherwise, we just get that specific filter, and append it
-        else:
-            applied_filters.append(
-                get_applied_filter(df, column_header, filter_or_group)
-            )
-
     if len(applied_filters) > 0:
-        return df[combine_filters(operator, applied_filters)]
+        return combine_filters(operator, applied_filters)
+    else:
+        return None
+
+
+def _execute_filter(
+    df: pd.DataFrame,
+    column_header: ColumnHeader,
+    operator: str,
+    filters: List[Dict[str, Any]],
+) -> pd.DataFrame:
+    """
+    Executes a filter on the given column, filtering by removing any rows who
+    don't meet the condition.
+    """
+    filter_indexes = get_filter_indexes(df, column_header, operator, filters)
+    if filter_indexes is not None:
+        return df[filter_indexes]
     else:
         return df
 
 
+def get_filter_base(df: Union[pd.DataFrame, FilteredDataFrameView]) -> Tuple[pd.DataFrame, Dict[ColumnID, Tuple[ColumnHeader, str, Any]], Optional[pd.Series]]:
+    """
+    Returns the unfiltered dataframe that the given dataframe (or view) was created
+    from by filter steps, the filters on each column that created it, and the filter
+    indexes of all these filters combined. 
+    
+    If the dataframe was not created by a filter step, it is its own base.
+    """
+    if isinstance(df, FilteredDataFrameView):
+        return df.base_df, df.column_filters, df.filter_indexes
+
+    filtered_dataframe = _filtered_dataframes.get(id(df))
+    if filtered_dataframe is not None and filtered_dataframe[0]() is df:
+        return filtered_dataframe[1], filtered_dataframe[2], filtered_dataframe[3]
+    return df, {}, None
+
+
+def get_cached_filter_indexes(
+    base_df: pd.DataFrame,
+    column_id: ColumnID,
+    column_header: ColumnHeader,
+    operator: str,
+    filters: List[Dict[str, Any]],
+) -> Optional[pd.Series]:
+    """
+    Returns the filter indexes of the filters on the given column of the base
+    dataframe, only computing them if the filters on this column changed.
+    """
+    if id(base_df) not in _base_dataframe_filter_indexes:
+        _base_dataframe_filter_indexes[id(base_df)] = {}
+        weakref.finalize(base_df, _base_dataframe_filter_indexes.pop, id(base_df), None)
+    cached_filter_indexes = _base_dataframe_filter_indexes[id(base_df)].setdefault(column_id, [])
+
+    filter_key = (column_header, operator, json.dumps(filters, sort_keys=True, default=str))
+    for cached_filter_key, filter_indexes in cached_filter_indexes:
+        if cached_filter_key == filter_key:
+            return filter_indexes
+
+    filter_indexes = get_filter_indexes(base_df, column_header, operator, filters)
+    # We only keep the latest few filters on each column, as the user is usually
+    # changing the filter on one column back and forth
+    cached_filter_indexes.insert(0, (filter_key, filter_indexes))
+    del cached_filter_indexes[MAX_CACHED_FILTERS_PER_COLUMN:]
+    return filter_indexes
+
+
+def execute_filter_on_base(
+    df: Union[pd.DataFrame, FilteredDataFrameView],
+    column_id: ColumnID,
+    column_header: ColumnHeader,
+    operator: str,
+    filters: List[Dict[str, Any]],
+) -> Union[pd.DataFrame, FilteredDataFrameView]:
+    """
+    Executes a filter on the given column, like _execute_filter, but by filtering
+    the base dataframe the df was filtered from with the cached filter indexes of 
+    each filtered column.
+
+    As editing a filter reexecutes every filter step after it, this means that 
+    changing the filter on one column only recomputes the filter on that column.
+
+    Returns a view of the filtered rows of the base dataframe, unless the filter
+    keeps so few rows that copying them is cheap.
+    """
+    base_df, column_filters, base_filter_indexes = get_filter_base(df)
+    new_column_filters = {**column_filters, column_id: (column_header, operator, filters)}
+    column_filter_indexes = get_cached_filter_indexes(base_df, column_id, column_header, operator, filters)
+
+    if column_id not in column_filters:
+        if column_filter_indexes is None:
+            # If there is nothing to filter on this column, the dataframe does not change
+            return df
+        # When filtering one more column, we only need to combine it with the existing filters
+        if base_filter_indexes is None:
+            filter_indexes = column_filter_indexes
+        else:
+            filter_indexes = base_filter_indexes & column_filter_indexes
+    else:
+        applied_filter_indexes = [
+            get_cached_filter_indexes(base_df, filtered_column_id, *column_filter)
+            for filtered_column_id, column_filter in new_column_filters.items()
+        ]
+        applied_filter_indexes = [indexes for indexes in applied_filter_indexes if indexes is not None]
+        if len(applied_filter_indexes) == 0:
+            return base_df
+        filter_indexes = combine_filters("And", applied_filter_indexes)
+
+    filtered_df = FilteredDataFrameView(base_df, new_column_filters, filter_indexes)
+    if len(filtered_df) < len(base_df) * MIN_VIEW_SELECTED_ROWS_FRACTION:
+        return filtered_df.materialize()
+    return filtered_df
+
+
 def get_single_filter_string(
     df_name: str, column_header: ColumnHeader, filter_: Dict[str, Any]
 ) -> str:
@@ -492,6 +851,15 @@ def get_multiple_filter_string(
     """
     Transpiles a list of filters with the same filter condition to a filter string.
     """
+    filters = reduce_filters_with_condition(condition, original_operator, filters)
+    if len(filters) == 1:
+        return get_single_filter_string(df_name, column_header, filters[0])
+
+    if original_operator not in FILTER_FORMAT_STRING_MULTIPLE_VALUES_DICT.get(condition, {}):
+        return combine_filter_strings(
+            original_operator,
+            [get_single_filter_string(df_name, column_header, filter_) for filter_ in filters],
+        )
 
     # Handle dates specially by wrapping the number in a string and adding the pd.to_datetime call
     values: Union[str, List[str]]
@@ -18,7 +18,8 @@ from mitosheet.sheet_functions.types.utils import (is_bool_dtype, is_int_dtype,
                                                    is_timedelta_dtype)
 from mitosheet.state import State
 from mitosheet.step_performers.column_steps.set_column_formula import (
-    refresh_dependant_columns, transpile_dependant_columns)
+    refresh_dependant_columns, refresh_dependant_columns_in_row,
+    transpile_dependant_columns)
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.transpiler.transpile_utils import \
     column_header_to_transpiled_code
@@ -98,8 +99,13 @@ class SetCellValueStepPerformer(StepPerformer):
         # Actually update the cell's value
         post_state.dfs[sheet_index].at[row_index, column_header] = type_corrected_new_value
 
-        # Update the column formula, and then execute the new formula graph
-        refresh_dependant_columns(post_state, post_state.dfs[sheet_index], sheet_index, column_id)
+        # Then refresh the dependant columns. If the edit did not change the dtype of the column, 
+        # then only the edited row changes, so we try and just recompute this row
+        refreshed_in_row = False
+        if prev_state.dfs[sheet_index][column_header].dtype == post_state.dfs[sheet_index][column_header].dtype:
+            refreshed_in_row = refresh_dependant_columns_in_row(post_state, post_state.dfs[sheet_index], sheet_index, column_id, row_index)
+        if not refreshed_in_row:
+            refresh_dependant_columns(post_state, post_state.dfs[sheet_index], sheet_index, column_id)
 
         return post_state, {
             'type_corrected_new_value': type_corrected_new_value
@@ -3,21 +3,32 @@
 
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
-from copy import deepcopy
+import weakref
+from copy import copy
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
+import pandas as pd
+
+from mitosheet.sorted_index_utils import get_built_sorted_index
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.errors import (
     make_invalid_sort_error
 )
 from mitosheet.transpiler.transpile_utils import column_header_to_transpiled_code
-from mitosheet.types import ColumnID
+from mitosheet.types import ColumnHeader, ColumnID
 
 # CONSTANTS USED IN THE SORT STEP ITSELF
 ASCENDING = 'ascending'
 DESCENDING = 'descending'
 
+# To make toggling a sort fast, we cache the permutation that sorts each dataframe by
+# each sort keys, and if the sort column has no ties, which means the permutation for 
+# the opposite direction is the reverse of it. Cached by the id of the dataframe, and
+# removed when this dataframe is garbage collected
+_sort_permutations: Dict[int, Dict[Tuple[Tuple[ColumnHeader, str], ...], Tuple[np.ndarray, bool]]] = {}
+
 class SortStepPerformer(StepPerformer):
     """
     Allows you to sort a df based on key column, in either
@@ -51,22 +62,26 @@ class SortStepPerformer(StepPerformer):
         sheet_index: int,
         column_id: ColumnID,
         sort_direction: str,
+        secondary_sort_keys: List[Dict[str, Any]]=None,
         **params
     ) -> Tuple[State, Optional[Dict[str, Any]]]:
         """
         Returns the new new post state after sorting the sheet
         at `sheet_index` by the passed `column_id` in the given
-        `sort_direction`
+        `sort_direction`, and then by each of the `secondary_sort_keys`
+        in order
         """
 
         column_header = prev_state.column_ids.get_column_header_by_id(sheet_index, column_id)
+        sort_keys = get_sort_keys(prev_state, sheet_index, column_id, sort_direction, secondary_sort_keys)
 
-        # We make a new state to modify it
-        post_state = deepcopy(prev_state)
+        # We make a new state to modify it. As sorting does not modify any dataframe, 
+        # a shallow copy of the state is enough
+        post_state = copy(prev_state)
 
         try: 
-            new_df = prev_state.dfs[sheet_index].sort_values(by=column_header, ascending=(sort_direction == ASCENDING), na_position=('first' if sort_direction == ASCENDING else 'last'))
-            post_state.dfs[sheet_index] = new_df
+            df = prev_state.dfs[sheet_index]
+            post_state.dfs[sheet_index] = df.take(get_sort_permutation(df, sort_keys))
         except TypeError as e:
             # A NameError occurs when you try to sort a column with incomparable 
             # dtypes (ie: a column with strings and floats)
@@ -84,16 +99,24 @@ class SortStepPerformer(StepPerformer):
         execution_data: Optional[Dict[str, Any]],
         sheet_index: int,
         column_id: ColumnID,
-        sort_direction: str
+        sort_direction: str,
+        secondary_sort_keys: List[Dict[str, Any]]=None
     ) -> List[str]:
         df_name = post_state.df_names[sheet_index]
-        column_header = post_state.column_ids.get_column_header_by_id(sheet_index, column_id)
-        transpiled_column_header = column_header_to_transpiled_code(column_header)
+        sort_keys = get_sort_keys(post_state, sheet_index, column_id, sort_direction, secondary_sort_keys)
         
         na_position_string = 'first' if sort_direction == ASCENDING else 'last'
-        
+
+        if len(sort_keys) == 1:
+            transpiled_column_header = column_header_to_transpiled_code(sort_keys[0][0])
+            return [
+                f'{df_name} = {df_name}.sort_values(by={transpiled_column_header}, ascending={sort_direction == ASCENDING}, na_position=\'{na_position_string}\')', 
+            ]
+
+        transpiled_column_headers = ', '.join(column_header_to_transpiled_code(column_header) for column_header, _ in sort_keys)
+        ascending = ', '.join(str(key_sort_direction == ASCENDING) for _, key_sort_direction in sort_keys)
         return [
-            f'{df_name} = {df_name}.sort_values(by={transpiled_column_header}, ascending={sort_direction == ASCENDING}, na_position=\'{na_position_string}\')', 
+            f'{df_name} = {df_name}.sort_values(by=[{transpiled_column_headers}], ascending=[{ascending}], na_position=\'{na_position_string}\')', 
         ]
 
     @classmethod
@@ -102,13 +125,18 @@ class SortStepPerformer(StepPerformer):
         sheet_index: int,
         column_id: ColumnID,
         sort_direction: str,
+        secondary_sort_keys: List[Dict[str, Any]]=None,
         df_names=None,
         **params
     ) -> str:
+        then_by = ''.join(
+            f', then {sort_key["column_id"]} in {sort_key["sort_direction"]} order' 
+            for sort_key in (secondary_sort_keys or [])
+        )
         if df_names is not None:
             df_name = df_names[sheet_index]
-            return f'Sorted {column_id} in {df_name} in {sort_direction} order'
-        return f'Sorted {column_id} in {sort_direction} order'
+            return f'Sorted {column_id} in {df_name} in {sort_direction} order{then_by}'
+        return f'Sorted {column_id} in {sort_direction} order{then_by}'
 
     @classmethod
     def get_modified_dataframe_indexes( # type: ignore
@@ -118,4 +146,118 @@ class SortStepPerformer(StepPerformer):
         sort_direction: str,
         **params
     ) -> Set[int]:
-        return {sheet_index}
\ No newline at end of file
+        return {sheet_index}
+
+
+def get_sort_keys(
+    state: State,
+    sheet_index: int,
+    column_id: ColumnID,
+    sort_direction: str,
+    secondary_sort_keys: Optional[List[Dict[str, Any]]]
+) -> List[Tuple[ColumnHeader, str]]:
+    """
+    Returns the column header and sort direction of each column to sort by, in order.
+    """
+    sort_keys = [(column_id, sort_direction)] + [
+        (sort_key['column_id'], sort_key['sort_direction']) for sort_key in (secondary_sort_keys or [])
+    ]
+    return [
+        (state.column_ids.get_column_header_by_id(sheet_index, key_column_id), key_sort_direction)
+        for key_column_id, key_sort_direction in sort_keys
+    ]
+
+
+def has_ties(sorted_values: np.ndarray) -> bool:
+    """
+    Returns True if any two of the sorted values are equal.
+    """
+    return bool((sorted_values[1:] == sorted_values[:-1]).any())
+
+
+def get_single_key_sort_permutation(df: pd.DataFrame, column_header: ColumnHeader, sort_direction: str) -> Optional[np.ndarray]:
+    """
+    Returns the permutation that sorts the dataframe by a single column without
+    sorting it, or None if this is not possible. 
+    
+    If the column has no ties, any permutation that sorts it is the permutation
+    that sort_values finds, so we can use the sorted index of the column, or, if 
+    the column is already sorted in either direction, its current order.
+    """
+    series = df[column_header]
+    # Extension dtypes (e.g. ordered categoricals) do not sort in the order of their values
+    if not isinstance(series, pd.Series) or not isinstance(series.dtype, np.dtype):
+        return None
+
+    sorted_index = get_built_sorted_index(df, column_header)
+    if sorted_index is not None and not has_ties(sorted_index.sorted_values):
+        positions, missing_positions = sorted_index.positions, sorted_index.missing_positions
+    else:
+        values = series.to_numpy()
+        is_missing = pd.isna(values)
+        positions, missing_positions = np.flatnonzero(~is_missing), np.flatnonzero(is_missing)
+        not_missing_values = values[positions]
+        try:
+            if (not_missing_values[1:] < not_missing_values[:-1]).all():
+                positions = positions[::-1]
+            elif not (not_missing_values[1:] > not_missing_values[:-1]).all():
+                return None
+        except TypeError:
+            return None
+
+    # Missing values are always first in ascending order and last in descending order
+    if sort_direction == ASCENDING:
+        return np.concatenate([missing_positions, positions])
+    return np.concatenate([positions[::-1], missing_positions])
+
+
+def get_sort_permutation(df: pd.DataFrame, sort_keys: List[Tuple[ColumnHeader, str]]) -> np.ndarray:
+    """
+    Returns the positions of the rows of the dataframe in the order that sorting
+    it by the sort keys puts them, exactly like the transpiled sort_values call.
+    """
+    if id(df) not in _sort_permutations:
+        _sort_permutations[id(df)] = {}
+        weakref.finalize(df, _sort_permutations.pop, id(df), None)
+    sort_permutations = _sort_permutations[id(df)]
+
+    sort_keys_key = tuple(sort_keys)
+    if sort_keys_key in sort_permutations:
+        return sort_permutations[sort_keys_key][0]
+
+    if len(sort_keys) == 1:
+        column_header, sort_direction = sort_keys[0]
+        opposite_sort_keys_key = ((column_header, DESCENDING if sort_direction == ASCENDING else ASCENDING),)
+        if opposite_sort_keys_key in sort_permutations and not sort_permutations[opposite_sort_keys_key][1]:
+            # Without ties, the opposite order is the reverse order, with missing values still first or last
+            opposite_permutation = sort_permutations[opposite_sort_keys_key][0]
+            num_missing = int(df[column_header].isna().sum())
+            if sort_direction == ASCENDING:
+                sort_permutation = np.concatenate([opposite_permutation[len(df) - num_missing:], opposite_permutation[:len(df) - num_missing][::-1]])
+            else:
+                sort_permutation = np.concatenate([opposite_permutation[num_missing:][::-1], opposite_permutation[:num_missing]])
+            sort_permutations[sort_keys_key] = (sort_permutation, False)
+            return sort_permutation
+
+        presorted_permutation = get_single_key_sort_permutation(df, column_header, sort_direction)
+        if presorted_permutation is not None:
+            sort_permutations[sort_keys_key] = (presorted_permutation, False)
+            return presorted_permutation
+
+    # We only sort the columns we sort by, with the same call as the transpiled code,
+    # so that rows with equal values end up in the same order
+    column_headers = [column_header for column_header, _ in sort_keys]
+    sort_df = df[column_headers]
+    sort_df = sort_df.set_axis(pd.RangeIndex(len(sort_df)), axis=0)
+    primary_sort_direction = sort_keys[0][1]
+    sort_permutation = sort_df.sort_values(
+        by=column_headers if len(sort_keys) > 1 else column_headers[0], 
+        ascending=[sort_direction == ASCENDING for _, sort_direction in sort_keys] if len(sort_keys) > 1 else primary_sort_direction == ASCENDING, 
+        na_position=('first' if primary_sort_direction == ASCENDING else 'last')
+    ).index.to_numpy()
+
+    column_has_ties = True
+    if len(sort_keys) == 1:
+        column_has_ties = has_ties(df[column_headers[0]].to_numpy()[sort_permutation])
+    sort_permutations[sort_keys_key] = (sort_permutation, column_has_ties)
+    return sort_permutation
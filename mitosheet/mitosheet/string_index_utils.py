@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains the string indexes of the columns of dataframes, which find the rows
+of a string column that contain a substring without checking every row.
+
+A string index stores each distinct value in the column once, and an inverted
+index from each trigram (three character substring) to the values that contain
+it. To find the values that contain a substring, we only check the values that
+contain every trigram of the substring.
+
+As building a string index takes much longer than checking every row once, it
+is built in a background thread the first time it is asked for on a column.
+Like sorted indexes, string indexes are cached by the id of the dataframe and
+the column header, and are removed when the dataframe is garbage collected.
+"""
+import weakref
+from threading import Thread
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.types import ColumnHeader
+
+# NOTE: set this to False to build string indexes in the main thread, for testing
+THREADED = True
+
+# Trigram indexes take a lot of memory for columns with many distinct values, so
+# above this many distinct values, we check every distinct value instead
+MAX_TRIGRAM_INDEX_VALUES = 10 ** 6
+
+TRIGRAM_LENGTH = 3
+
+# The inferred types of the columns that the .str accessor works on
+STRING_INDEX_INFERRED_TYPES = ['string', 'mixed', 'mixed-integer', 'empty']
+
+# For each dataframe, the string index of each column, or None if it is still
+# being built, or if the column is not a string column
+_string_indexes: Dict[int, Dict[ColumnHeader, Optional['StringIndex']]] = {}
+
+
+def get_trigrams(string: str) -> List[str]:
+    return [string[index:index + TRIGRAM_LENGTH] for index in range(len(string) - TRIGRAM_LENGTH + 1)]
+
+
+class StringIndex():
+    """
+    The distinct values of a column, the code of the value in each row (or -1 if
+    the row is missing), and an inverted index from each trigram to the codes of
+    the values that contain it.
+    """
+
+    def __init__(self, series: pd.Series):
+        self.codes, self.values = pd.factorize(series)
+        self.is_string = np.array([isinstance(value, str) for value in self.values], dtype=bool)
+
+        self.trigram_codes: Optional[Dict[str, np.ndarray]] = None
+        if len(self.values) <= MAX_TRIGRAM_INDEX_VALUES:
+            trigram_codes: Dict[str, List[int]] = {}
+            for code in np.flatnonzero(self.is_string):
+                for trigram in set(get_trigrams(self.values[code])):
+                    trigram_codes.setdefault(trigram, []).append(code)
+            self.trigram_codes = {
+                trigram: np.array(codes, dtype=np.int64) for trigram, codes in trigram_codes.items()
+            }
+
+    def get_candidate_codes(self, substring: str) -> np.ndarray:
+        """
+        Returns the codes of the values that might contain the substring, which
+        are the values that contain every trigram in the substring.
+        """
+        trigrams = set(get_trigrams(substring))
+        if self.trigram_codes is None or len(trigrams) == 0:
+            return np.flatnonzero(self.is_string)
+
+        trigram_codes = sorted(
+            [self.trigram_codes.get(trigram, np.array([], dtype=np.int64)) for trigram in trigrams],
+            key=len
+        )
+        candidate_codes = trigram_codes[0]
+        for codes in trigram_codes[1:]:
+            candidate_codes = np.intersect1d(candidate_codes, codes, assume_unique=True)
+        return candidate_codes
+
+    def contains(self, substring: str) -> np.ndarray:
+        """
+        Returns if each row of the column contains the substring, where missing
+        values and values that are not strings do not contain it.
+        """
+        candidate_codes = self.get_candidate_codes(substring)
+        value_contains = np.zeros(len(self.values) + 1, dtype=bool)
+        value_contains[candidate_codes] = [substring in value for value in self.values[candidate_codes]]
+        # Missing rows have a code of -1, which is the extra False at the end
+        return value_contains[self.codes]
+
+
+def _build_string_index(df: pd.DataFrame, column_header: ColumnHeader, string_indexes: Dict[ColumnHeader, Optional[StringIndex]]) -> None:
+    series = df[column_header]
+    if pd.api.types.infer_dtype(series, skipna=True) in STRING_INDEX_INFERRED_TYPES:
+        try:
+            string_indexes[column_header] = StringIndex(series)
+        except TypeError:
+            # Columns with unhashable values (e.g. lists) cannot be indexed
+            pass
+
+
+def get_string_index(df: pd.DataFrame, column_header: ColumnHeader) -> Optional[StringIndex]:
+    """
+    Returns the string index of the given column of the dataframe, or None if the
+    column is not a string column, or if its string index is not built yet.
+
+    The first time this is called on a column, it starts building the string index.
+    """
+    series = df[column_header]
+    if not isinstance(series, pd.Series) or series.dtype != object:
+        return None
+
+    if id(df) not in _string_indexes:
+        _string_indexes[id(df)] = {}
+        weakref.finalize(df, _string_indexes.pop, id(df), None)
+    string_indexes = _string_indexes[id(df)]
+
+    if column_header not in string_indexes:
+        string_indexes[column_header] = None
+        if THREADED:
+            # A daemon thread does not stop the process from exiting while it runs
+            Thread(target=_build_string_index, args=(df, column_header, string_indexes), daemon=True).start()
+        else:
+            _build_string_index(df, column_header, string_indexes)
+
+    return string_indexes[column_header]
@@ -0,0 +1,65 @@
+import json
+
+import pandas as pd
+import pytest
+from mitosheet.api.get_duplicate_counts import get_duplicate_counts
+from mitosheet.tests.test_utils import create_mito_wrapper_dfs
+
+DF = pd.DataFrame({
+    'A': [1, 2, 1, 1, None, None],
+    'B': ['a', 'b', 'a', 'c', 'd', 'd'],
+})
+
+
+def _get_duplicate_counts(mito, sheet_index, column_headers, keep):
+    return json.loads(get_duplicate_counts({
+        'sheet_index': sheet_index,
+        'column_ids': [
+            mito.mito_widget.steps_manager.curr_step.column_ids.get_column_id_by_header(sheet_index, column_header)
+            for column_header in column_headers
+        ],
+        'keep': keep
+    }, mito.mito_widget.steps_manager))
+
+
+@pytest.mark.parametrize("column_headers, keep, dropped_rows", [
+    (['A'], 'first', 3),
+    (['A'], 'last', 3),
+    (['A'], False, 5),
+    (['B'], 'first', 2),
+    (['A', 'B'], 'first', 2),
+    (['B', 'A'], False, 4),
+    ([], 'first', 0),
+])
+def test_duplicate_counts(column_headers, keep, dropped_rows):
+    mito = create_mito_wrapper_dfs(DF)
+    assert _get_duplicate_counts(mito, 0, column_headers, keep) == {
+        'numRows': 6,
+        'keptRows': 6 - dropped_rows,
+        'droppedRows': dropped_rows
+    }
+
+
+def test_duplicate_counts_match_drop_duplicates():
+    mito = create_mito_wrapper_dfs(DF)
+    duplicate_counts = _get_duplicate_counts(mito, 0, ['A', 'B'], 'last')
+    mito.drop_duplicates(0, ['A', 'B'], 'last')
+    assert duplicate_counts['keptRows'] == len(mito.dfs[0])
+
+
+def _can_find_duplicate_lists():
+    try:
+        pd.DataFrame({'A': [[1], [1]]}).duplicated()
+        return True
+    except TypeError:
+        return False
+
+
+@pytest.mark.skipif(not _can_find_duplicate_lists(), reason='this version of pandas cannot find duplicate lists')
+def test_duplicate_counts_of_unhashable_column():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [[1], [1], [2]]}))
+    assert _get_duplicate_counts(mito, 0, ['A'], 'first') == {
+        'numRows': 3,
+        'keptRows': 2,
+        'droppedRows': 1
+    }
@@ -0,0 +1,99 @@
+import json
+
+import pandas as pd
+import pytest
+from mitosheet.api.get_filter_preview import get_filter_preview
+from mitosheet.step_performers.filter import (FC_NUMBER_EXACTLY,
+                                              FC_NUMBER_GREATER,
+                                              FC_NUMBER_LESS,
+                                              FC_STRING_CONTAINS)
+from mitosheet.tests.test_utils import create_mito_wrapper_dfs
+
+DF = pd.DataFrame({
+    'A': [1, 2, 3, 4, 5, 6],
+    'B': ['a', 'b', 'ab', 'a', 'b', 'ab'],
+})
+
+
+def _get_filter_preview(mito, sheet_index, column_header, operator, filters):
+    return json.loads(get_filter_preview({
+        'sheet_index': sheet_index,
+        'column_id': mito.mito_widget.steps_manager.curr_step.column_ids.get_column_id_by_header(sheet_index, column_header),
+        'operator': operator,
+        'filters': filters
+    }, mito.mito_widget.steps_manager))
+
+
+def test_filter_preview_counts_each_filter_and_combined():
+    mito = create_mito_wrapper_dfs(DF)
+    filter_preview = _get_filter_preview(mito, 0, 'A', 'And', [
+        {'condition': FC_NUMBER_GREATER, 'value': 1},
+        {'condition': FC_NUMBER_LESS, 'value': 5},
+    ])
+
+    assert filter_preview == {
+        'numRows': 6,
+        'filters': [{'keptRows': 5, 'removedRows': 1}, {'keptRows': 4, 'removedRows': 2}],
+        'combined': {'keptRows': 3, 'removedRows': 3}
+    }
+    # Previewing does not create a step
+    assert len(mito.mito_widget.steps_manager.steps) == 1
+
+
+def test_filter_preview_of_groups():
+    mito = create_mito_wrapper_dfs(DF)
+    filter_preview = _get_filter_preview(mito, 0, 'A', 'Or', [
+        {'condition': FC_NUMBER_EXACTLY, 'value': 1},
+        {'operator': 'And', 'filters': [
+            {'condition': FC_NUMBER_GREATER, 'value': 2},
+            {'condition': FC_NUMBER_LESS, 'value': 5},
+        ]},
+    ])
+
+    assert filter_preview['filters'] == [{'keptRows': 1, 'removedRows': 5}, {'keptRows': 2, 'removedRows': 4}]
+    assert filter_preview['combined'] == {'keptRows': 3, 'removedRows': 3}
+
+
+def test_filter_preview_counts_rows_kept_by_other_columns():
+    mito = create_mito_wrapper_dfs(DF)
+    mito.filter(0, 'B', 'And', FC_STRING_CONTAINS, 'a')
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 5)
+
+    # The preview replaces the filter on A, but keeps the filter on B
+    filter_preview = _get_filter_preview(mito, 0, 'A', 'And', [{'condition': FC_NUMBER_GREATER, 'value': 2}])
+    assert filter_preview == {
+        'numRows': 4,
+        'filters': [{'keptRows': 3, 'removedRows': 1}],
+        'combined': {'keptRows': 3, 'removedRows': 1}
+    }
+
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+    assert len(mito.dfs[0]) == filter_preview['combined']['keptRows']
+
+
+def test_filter_preview_with_no_filters_keeps_all_rows():
+    mito = create_mito_wrapper_dfs(DF)
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+
+    filter_preview = _get_filter_preview(mito, 0, 'A', 'And', [])
+    assert filter_preview == {
+        'numRows': 6,
+        'filters': [],
+        'combined': {'keptRows': 6, 'removedRows': 0}
+    }
+
+
+def test_filter_preview_after_other_step_counts_sheet_as_it_is():
+    mito = create_mito_wrapper_dfs(DF)
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+    mito.set_formula('=A', 0, 'C', add_column=True)
+
+    filter_preview = _get_filter_preview(mito, 0, 'B', 'And', [{'condition': FC_STRING_CONTAINS, 'value': 'b'}])
+    assert filter_preview['numRows'] == 4
+    assert filter_preview['combined'] == {'keptRows': 3, 'removedRows': 1}
+
+
+def test_filter_preview_of_invalid_filter_errors():
+    mito = create_mito_wrapper_dfs(DF)
+    with pytest.raises(Exception):
+        _get_filter_preview(mito, 0, 'B', 'And', [{'condition': FC_NUMBER_GREATER, 'value': 2}])
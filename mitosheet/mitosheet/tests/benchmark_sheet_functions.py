@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Benchmarks every sheet function in FUNCTIONS, so that changes that slow down
+the decorators or the type conversions are caught before a release.
+
+Each sheet function is called through all of its decorators, exactly as a
+formula calls it, with a first argument of every dtype, with and without NaNs.
+Sheet functions that take more than one argument are called both with series
+and with constants as their other arguments.
+
+For each of these cases, we measure the throughput (rows per second) and the
+peak memory allocated during the call. As throughput depends on the machine, we
+divide it by the throughput of a reference operation (adding two float series)
+measured in the same process, and compare this relative throughput and the peak
+memory to the baselines stored in sheet_function_benchmark_baselines.json. Run 
+it with:
+
+    python -m mitosheet.tests.benchmark_sheet_functions --sizes 1000 100000
+
+which exits with a non-zero status if any case regressed by more than the tolerance.
+Pass --update-baselines to store the measured results as the new baselines.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.tests.data_generator import (DTYPE_BOOL, DTYPE_DATETIME,
+                                            DTYPE_FLOAT, DTYPE_INT,
+                                            DTYPE_STRING, DTYPE_TIMEDELTA,
+                                            DTYPES, get_constant, get_series)
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sheet_function_benchmark_baselines.json')
+
+# Every default size has baselines. Other sizes can be passed with --sizes, but 
+# are only compared once their baselines are stored with --update-baselines
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# The fraction a measurement can be worse than its baseline before it is a regression
+DEFAULT_TOLERANCE = .5
+
+# We time each case until we have called it on at least this many rows in total
+# (or called it MAX_REPEATS times), and keep the fastest time, to reduce noise
+MIN_TOTAL_ROWS = 10 ** 6
+MAX_REPEATS = 5
+
+# Every case at a size is divided by the reference throughput, so we time the
+# reference more times to reduce its noise
+REFERENCE_REPEATS = 20
+
+ARG_KIND_SERIES = 'series'
+ARG_KIND_CONSTANT = 'constant'
+
+# The dtype of the data we pass to an argument that is converted to a series type.
+# Arguments that take any series take the same dtype as the first argument
+SERIES_TYPE_ARG_DTYPE = {
+    'float': DTYPE_FLOAT,
+    'int': DTYPE_INT,
+    'bool': DTYPE_BOOL,
+    'string': DTYPE_STRING,
+    'datetime': DTYPE_DATETIME,
+    'timedelta': DTYPE_TIMEDELTA,
+}
+
+
+def get_arg_series_types(sheet_function: Callable) -> List[str]:
+    """
+    Returns the series type that each required argument of the sheet function is
+    converted to, read from its decorators. Sheet functions that take any number
+    of arguments are given two arguments.
+    """
+    arg_series_types: Dict[int, str] = {}
+    while hasattr(sheet_function, 'mito_decorator') and hasattr(sheet_function, '__wrapped__'):
+        decorator_type = sheet_function.mito_decorator_type # type: ignore
+        decorator_params = sheet_function.mito_decorator_params # type: ignore
+        if decorator_type == 'convert_arg_to_series_type' and not decorator_params['optional']:
+            arg_series_types[decorator_params['arg_index']] = decorator_params['arg_target_series_type']
+        elif decorator_type == 'convert_args_to_series_type':
+            return [decorator_params['arg_target_series_type']] * 2
+        sheet_function = sheet_function.__wrapped__ # type: ignore
+
+    return [arg_series_types[arg_index] for arg_index in sorted(arg_series_types)]
+
+
+def get_benchmark_cases(function_names: List[str]) -> List[Tuple[str, str, bool, str]]:
+    """
+    Returns each case to benchmark, as the function name, the dtype of the first
+    argument, if there are NaNs, and the kind of the other arguments.
+    """
+    cases = []
+    for function_name in function_names:
+        num_args = len(get_arg_series_types(FUNCTIONS[function_name]))
+        arg_kinds = [ARG_KIND_SERIES, ARG_KIND_CONSTANT] if num_args > 1 else [ARG_KIND_SERIES]
+        for dtype in DTYPES:
+            for with_nans in [False, True]:
+                for arg_kind in arg_kinds:
+                    cases.append((function_name, dtype, with_nans, arg_kind))
+    return cases
+
+
+def get_case_key(function_name: str, dtype: str, with_nans: bool, arg_kind: str, num_rows: int) -> str:
+    """
+    Returns the key the results of a case are stored under in the baselines.
+    """
+    return f'{function_name}({dtype}{", nan" if with_nans else ""}, {arg_kind}) x {num_rows}'
+
+
+def get_case_args(
+        function_name: str, 
+        dtype: str, 
+        with_nans: bool, 
+        arg_kind: str, 
+        num_rows: int, 
+        series_cache: Optional[Dict[Tuple[str, int, bool, int], pd.Series]]=None
+    ) -> List[Any]:
+    """
+    Returns the arguments to call the sheet function with in the given case.
+
+    As generating data is slow, series are reused between cases through the 
+    series_cache if it is passed. Sheet functions never modify their arguments,
+    so this does not change the results.
+    """
+    if series_cache is None:
+        series_cache = {}
+
+    args: List[Any] = []
+    for arg_index, arg_series_type in enumerate(get_arg_series_types(FUNCTIONS[function_name])):
+        arg_dtype = dtype if arg_index == 0 else SERIES_TYPE_ARG_DTYPE.get(arg_series_type, dtype)
+        if arg_index == 0 or arg_kind == ARG_KIND_SERIES:
+            series_key = (arg_dtype, num_rows, with_nans, arg_index)
+            if series_key not in series_cache:
+                series_cache[series_key] = get_series(arg_dtype, num_rows, with_nans=with_nans, seed=arg_index)
+            args.append(series_cache[series_key])
+        else:
+            args.append(get_constant(arg_dtype))
+    return args
+
+
+def reference_function(series: pd.Series, other_series: pd.Series) -> pd.Series:
+    return series + other_series
+
+
+def benchmark_reference(num_rows: int) -> float:
+    """
+    Returns the throughput of the reference operation on num_rows rows, which 
+    the throughput of every case at this size is divided by.
+    """
+    args = [get_series(DTYPE_FLOAT, num_rows, with_nans=True, seed=arg_index) for arg_index in range(2)]
+    result = benchmark_sheet_function(reference_function, args, num_rows, num_repeats=REFERENCE_REPEATS)
+    assert result is not None
+    return result['rows_per_second']
+
+
+def benchmark_sheet_function(
+        sheet_function: Callable, 
+        args: List[Any], 
+        num_rows: int, 
+        num_repeats: Optional[int]=None
+    ) -> Optional[Dict[str, float]]:
+    """
+    Returns the throughput and peak memory of calling the sheet function on the
+    args, or None if the sheet function errors on them.
+    """
+    if num_repeats is None:
+        num_repeats = max(1, min(MAX_REPEATS, MIN_TOTAL_ROWS // num_rows))
+    best_time = float('inf')
+    for _ in range(num_repeats):
+        start = time.perf_counter()
+        try:
+            sheet_function(*args)
+        except Exception:
+            return None
+        best_time = min(best_time, time.perf_counter() - start)
+
+    # We trace memory in a separate call, as tracing slows down the call
+    tracemalloc.start()
+    try:
+        sheet_function(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'rows_per_second': round(num_rows / max(best_time, 1e-9)),
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def run_benchmarks(function_names: List[str], sizes: List[int], verbose: bool=False) -> Dict[str, Optional[Dict[str, float]]]:
+    """
+    Benchmarks the given sheet functions at each size, and returns the results of
+    each case by its key. Cases where the sheet function errors have no results.
+    """
+    results: Dict[str, Optional[Dict[str, float]]] = {}
+    for num_rows in sizes:
+        reference_rows_per_second = benchmark_reference(num_rows)
+        # We only keep the data for one size at once, as the largest sizes take a lot of memory
+        series_cache: Dict[Tuple[str, int, bool, int], pd.Series] = {}
+        for function_name, dtype, with_nans, arg_kind in get_benchmark_cases(function_names):
+            case_key = get_case_key(function_name, dtype, with_nans, arg_kind, num_rows)
+            args = get_case_args(function_name, dtype, with_nans, arg_kind, num_rows, series_cache)
+            result = benchmark_sheet_function(FUNCTIONS[function_name], args, num_rows)
+            if result is not None:
+                result['relative_throughput'] = float(f'{result["rows_per_second"] / reference_rows_per_second:.4g}')
+            results[case_key] = result
+            if verbose:
+                print(format_result(case_key, results[case_key]))
+    return results
+
+
+def compare_to_baselines(
+        results: Dict[str, Optional[Dict[str, float]]],
+        baselines: Dict[str, Optional[Dict[str, float]]],
+        tolerance: float
+    ) -> List[str]:
+    """
+    Returns a description of each result that is more than tolerance worse than
+    its baseline. Cases without a baseline are not compared.
+
+    We compare the relative throughput rather than the rows per second, so that
+    baselines stored on one machine can be compared to results from another.
+    """
+    regressions = []
+    for case_key, result in results.items():
+        if case_key not in baselines:
+            continue
+        baseline = baselines[case_key]
+        if result is None or baseline is None:
+            if result is None and baseline is not None:
+                regressions.append(f'{case_key}: errors, but did not error in the baseline')
+            continue
+
+        if result['relative_throughput'] < baseline['relative_throughput'] * (1 - tolerance):
+            regressions.append(
+                f'{case_key}: {result["relative_throughput"]:.3g}x the reference throughput, down from {baseline["relative_throughput"]:.3g}x'
+            )
+        if result['peak_memory_bytes'] > baseline['peak_memory_bytes'] * (1 + tolerance):
+            regressions.append(
+                f'{case_key}: {result["peak_memory_bytes"]:,} bytes peak memory, up from {baseline["peak_memory_bytes"]:,} bytes'
+            )
+    return regressions
+
+
+def format_result(case_key: str, result: Optional[Dict[str, float]]) -> str:
+    if result is None:
+        return f'{case_key}: errors'
+    return f'{case_key}: {result["rows_per_second"]:,.0f} rows/s ({result["relative_throughput"]:.3g}x the reference), {result["peak_memory_bytes"]:,} bytes peak memory'
+
+
+def read_baselines(path: str=BASELINES_PATH) -> Dict[str, Optional[Dict[str, float]]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_baselines(baselines: Dict[str, Optional[Dict[str, float]]], path: str=BASELINES_PATH) -> None:
+    with open(path, 'w') as f:
+        json.dump(baselines, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the Mito sheet functions.')
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS.keys()), help='the sheet functions to benchmark')
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='the numbers of rows to benchmark with')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='the fraction a result can be worse than its baseline')
+    parser.add_argument('--baselines', default=BASELINES_PATH, help='the file the baselines are stored in')
+    parser.add_argument('--update-baselines', action='store_true', help='store the results as the new baselines')
+    parser.add_argument('--verbose', action='store_true', help='print the results of every case')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.functions, args.sizes, verbose=args.verbose)
+    baselines = read_baselines(args.baselines)
+
+    if args.update_baselines:
+        # Keep the baselines of any cases we did not run this time
+        write_baselines({**baselines, **results}, args.baselines)
+        print(f'Updated the baselines of {len(results)} cases in {args.baselines}')
+        return 0
+
+    regressions = compare_to_baselines(results, baselines, args.tolerance)
+    num_compared = len([case_key for case_key in results if case_key in baselines])
+    print(f'Compared {num_compared} of {len(results)} cases to their baselines, with a tolerance of {args.tolerance:.0%}')
+    for regression in regressions:
+        print(regression)
+
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
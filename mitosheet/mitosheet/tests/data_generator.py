@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Generates synthetic data of every dtype that a Mito sheet can contain,
+for tests and benchmarks that need large inputs.
+
+All data is generated from a seed, so the same call always returns the
+same data.
+"""
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DTYPE_FLOAT = 'float'
+DTYPE_INT = 'int'
+DTYPE_BOOL = 'bool'
+DTYPE_STRING = 'string'
+DTYPE_DATETIME = 'datetime'
+DTYPE_TIMEDELTA = 'timedelta'
+
+DTYPES = [DTYPE_FLOAT, DTYPE_INT, DTYPE_BOOL, DTYPE_STRING, DTYPE_DATETIME, DTYPE_TIMEDELTA]
+
+# The fraction of the values that are missing, in data with NaNs
+NAN_FRACTION = .1
+
+# The number of distinct strings in a string series, as real string columns
+# usually have many repeated values
+NUM_DISTINCT_STRINGS = 10000
+
+# A constant value of each dtype, as it is passed to a sheet function
+CONSTANTS = {
+    DTYPE_FLOAT: 2.5,
+    DTYPE_INT: 2,
+    DTYPE_BOOL: True,
+    DTYPE_STRING: 'a',
+    DTYPE_DATETIME: pd.Timestamp('2021-01-01'),
+    DTYPE_TIMEDELTA: pd.Timedelta(days=1),
+}
+
+
+def _get_strings(random: np.random.Generator, num_strings: int) -> np.ndarray:
+    """
+    Returns a mix of words and numbers formatted as strings, so that both
+    the string functions and the string conversions have realistic inputs.
+    """
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz  '))
+    words = [
+        ''.join(random.choice(letters, random.integers(1, 12))).strip() or 'a'
+        for _ in range(num_strings // 2)
+    ]
+    numbers = [
+        f'{number:,.2f}' if number % 2 == 0 else str(number)
+        for number in random.integers(-10 ** 6, 10 ** 6, num_strings - len(words))
+    ]
+    return np.array(words + numbers, dtype='object')
+
+
+def get_series(dtype: str, num_rows: int, with_nans: bool=False, seed: int=0) -> pd.Series:
+    """
+    Returns a series of num_rows values of the given dtype. If with_nans is
+    True, a random NAN_FRACTION of these values are missing.
+    """
+    random = np.random.default_rng(seed)
+
+    if dtype == DTYPE_FLOAT:
+        series = pd.Series(random.normal(0, 1000, num_rows))
+    elif dtype == DTYPE_INT:
+        series = pd.Series(random.integers(0, 100, num_rows))
+    elif dtype == DTYPE_BOOL:
+        series = pd.Series(random.random(num_rows) < .5)
+    elif dtype == DTYPE_STRING:
+        strings = _get_strings(random, min(num_rows, NUM_DISTINCT_STRINGS))
+        series = pd.Series(strings[random.integers(0, len(strings), num_rows)])
+    elif dtype == DTYPE_DATETIME:
+        series = pd.Series(pd.to_datetime(random.integers(946684800, 1893456000, num_rows), unit='s'))
+    elif dtype == DTYPE_TIMEDELTA:
+        series = pd.Series(pd.to_timedelta(random.integers(0, 30 * 24 * 60 * 60, num_rows), unit='s'))
+    else:
+        raise ValueError(f'Cannot generate a series of dtype {dtype}')
+
+    if with_nans:
+        # Like in a real dataframe, this turns ints into floats and bools into objects
+        series = series.where(random.random(num_rows) >= NAN_FRACTION)
+    return series
+
+
+def get_constant(dtype: str) -> Any:
+    """
+    Returns a constant of the given dtype, as a constant is passed to a
+    sheet function in a formula.
+    """
+    return CONSTANTS[dtype]
@@ -7,10 +7,15 @@
 Contains tests for the IF function.
 """
 
+
+import numpy as np
 import pytest
 import pandas as pd
 
 from mitosheet.sheet_functions.control_functions import IF
+from mitosheet.sheet_functions.sheet_function_utils import try_extend_series_to_index
+from mitosheet.sheet_functions.types.decorators import (
+    convert_arg_to_series_type, filter_nans, handle_sheet_function_errors)
 from mitosheet.tests.test_utils import create_mito_wrapper_dfs
 
 # Raw function tests
@@ -119,4 +124,63 @@ def test_if_with_and_or(A, formula, result):
         'A': A,
     }))
     mito.set_formula(f'{formula}', 0, 'B', add_column=True)
-    assert mito.get_column(0, 'B', as_list=False).equals(result)
\ No newline at end of file
+    assert mito.get_column(0, 'B', as_list=False).equals(result)
+
+# The implementation of IF before it was vectorized, which we check the 
+# vectorized IF against
+@handle_sheet_function_errors
+@filter_nans
+@convert_arg_to_series_type(0, 'bool', 'error', 'error')
+@convert_arg_to_series_type(1, 'series', 'error', 'error')
+@convert_arg_to_series_type(2, 'series', 'error', 'error')
+def LIST_IF(condition, true_series, false_series):
+    true_series = try_extend_series_to_index(true_series, condition.index)
+    false_series = try_extend_series_to_index(false_series, condition.index)
+
+    return pd.Series(
+        data=[true_series.loc[i] if c else false_series.loc[i] for i, c in condition.iteritems()],
+        index=condition.index
+    )
+
+
+IF_BRANCHES = [
+    pd.Series([1, 2, 3, 4, 5]),
+    pd.Series([1.5, 2.5, np.NaN, 4.5, 5.5]),
+    pd.Series([True, False, True, False, True]),
+    pd.Series(['a', 'b', None, 'd', 'e']),
+    pd.Series(pd.to_datetime(['2020-01-01', '2020-01-02', None, '2020-01-04', '2020-01-05'])),
+    pd.Series(pd.to_timedelta([1, 2, 3, 4, 5], unit='D')),
+    10,
+    2.5,
+    'constant',
+    True,
+]
+IF_CONDITIONS = [
+    pd.Series([True, False, True, True, False]),
+    pd.Series([True, True, True, True, True]),
+    pd.Series([False, False, False, False, False]),
+    pd.Series([True, None, False, True, None]),
+]
+@pytest.mark.parametrize("condition", IF_CONDITIONS)
+@pytest.mark.parametrize("true_series", IF_BRANCHES)
+@pytest.mark.parametrize("false_series", IF_BRANCHES)
+def test_if_equivalent_to_list_if(condition, true_series, false_series):
+    assert IF(condition, true_series, false_series).equals(LIST_IF(condition, true_series, false_series))
+
+
+def test_nested_if_equivalent_to_list_if():
+    condition = pd.Series(np.arange(1000) % 3 == 0)
+    nested_condition = pd.Series(np.arange(1000) % 2 == 0)
+    values = pd.Series(np.arange(1000))
+
+    assert IF(condition, IF(nested_condition, values, 'odd'), 1.5).equals(
+        LIST_IF(condition, LIST_IF(nested_condition, values, 'odd'), 1.5)
+    )
+
+
+def test_if_with_non_default_index_equivalent_to_list_if():
+    index = [5, 3, 1, 7]
+    condition = pd.Series([True, False, None, True], index=index)
+    true_series = pd.Series([1, 2, 3, 4], index=index)
+
+    assert IF(condition, true_series, 'no').equals(LIST_IF(condition, true_series, 'no'))
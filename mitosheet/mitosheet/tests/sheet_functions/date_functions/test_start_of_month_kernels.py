@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests that the start of month functions are identical to rolling
+back to pandas offsets, one timestamp at a time.
+"""
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions.date_functions import (STARTOFBUSINESSMONTH,
+                                                      STARTOFMONTH, to_start)
+
+
+def OFFSET_STARTOFBUSINESSMONTH(series):
+    return series.apply(lambda t: to_start(t, pd.tseries.offsets.BMonthBegin(n=1)))
+
+def OFFSET_STARTOFMONTH(series):
+    return series.apply(lambda t: to_start(t, pd.tseries.offsets.MonthBegin(n=1)))
+
+
+START_OF_MONTH_FUNCTIONS = [
+    (STARTOFBUSINESSMONTH, OFFSET_STARTOFBUSINESSMONTH),
+    (STARTOFMONTH, OFFSET_STARTOFMONTH),
+]
+
+
+def _get_datetime_series(num_rows, seed=0):
+    random = np.random.default_rng(seed)
+    days = pd.to_datetime('1965-01-01') + pd.to_timedelta(random.integers(0, 80 * 365, num_rows), unit='D')
+    # Half of the timestamps are at midnight, so we test dates that are exactly on a boundary
+    times = pd.to_timedelta(random.integers(0, 86400, num_rows) * random.integers(0, 2, num_rows), unit='s')
+    return pd.Series(days + times, index=random.permutation(num_rows), name='A')
+
+
+@pytest.mark.parametrize("sheet_function,offset_sheet_function", START_OF_MONTH_FUNCTIONS)
+def test_start_of_month_identical_to_offsets(sheet_function, offset_sheet_function):
+    series = _get_datetime_series(5000)
+    # Every day of a few years, including every month boundary and weekend
+    every_day = pd.Series(pd.date_range('2019-12-01', '2023-02-01', freq='D'))
+    kernel = inspect.unwrap(sheet_function)
+
+    pd.testing.assert_series_equal(kernel(series), offset_sheet_function(series))
+    pd.testing.assert_series_equal(kernel(every_day), offset_sheet_function(every_day))
+
+
+@pytest.mark.parametrize("sheet_function,offset_sheet_function", START_OF_MONTH_FUNCTIONS)
+def test_start_of_month_keeps_nat(sheet_function, offset_sheet_function):
+    series = pd.Series([pd.Timestamp('2021-05-01 10:00'), pd.NaT, pd.Timestamp('2021-05-31')])
+    result = inspect.unwrap(sheet_function)(series)
+    assert pd.isna(result[1])
+    assert result[[0, 2]].equals(offset_sheet_function(series[[0, 2]]))
+
+
+@pytest.mark.parametrize("sheet_function,offset_sheet_function", START_OF_MONTH_FUNCTIONS)
+def test_start_of_month_timezone_aware(sheet_function, offset_sheet_function):
+    series = pd.Series(pd.date_range('2021-01-01 10:00', periods=100, freq='5D', tz='US/Eastern'))
+    pd.testing.assert_series_equal(inspect.unwrap(sheet_function)(series), offset_sheet_function(series))
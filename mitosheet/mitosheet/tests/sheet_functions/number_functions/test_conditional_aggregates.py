@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the AVERAGEIF, COUNTIF, MAXIF, MINIF and SUMIF functions.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from mitosheet.sheet_functions.number_functions import AVERAGEIF, COUNTIF, MAXIF, MINIF, SUMIF
+from mitosheet.tests.test_utils import create_mito_wrapper_dfs
+
+REGIONS = pd.Series(['West', 'East', np.NaN, 'West', 'North', 'East'])
+SALES = pd.Series([1.0, 2.0, 3.0, np.NaN, 5.0, 6.0])
+
+# Raw function tests
+CONDITIONAL_AGGREGATE_TESTS = [
+    (SUMIF, [REGIONS, REGIONS, SALES], [1.0, 8.0, 0.0, 1.0, 5.0, 8.0]),
+    (SUMIF, [REGIONS, 'East', SALES], [8.0] * 6),
+    (SUMIF, [REGIONS, 'South', SALES], [0.0] * 6),
+    (SUMIF, [REGIONS, pd.Series(['East', 'East', 'West', 'South', np.NaN, 'North']), SALES], [8.0, 8.0, 1.0, 0.0, 0.0, 5.0]),
+    (SUMIF, [pd.Series([1, 2, 2, 3]), 2], [4.0] * 4),
+    (SUMIF, [pd.Series([1, 2, 2, 3]), pd.Series([1, 2, 3, 4]), pd.Series(['1', '$2', 'abc', '4'])], [1.0, 2.0, 4.0, 0.0]),
+    (COUNTIF, [REGIONS, REGIONS], [2, 2, 0, 2, 1, 2]),
+    (COUNTIF, [REGIONS, 'West'], [2] * 6),
+    (COUNTIF, [pd.Series([True, False, True]), True], [2] * 3),
+    (AVERAGEIF, [REGIONS, REGIONS, SALES], [1.0, 4.0, np.NaN, 1.0, 5.0, 4.0]),
+    (AVERAGEIF, [REGIONS, 'South', SALES], [np.NaN] * 6),
+    (AVERAGEIF, [pd.Series([1, 2, 2, 3]), pd.Series([1, 2, 2, 3])], [1.0, 2.0, 2.0, 3.0]),
+    (MAXIF, [REGIONS, REGIONS, SALES], [1.0, 6.0, 0.0, 1.0, 5.0, 6.0]),
+    (MAXIF, [REGIONS, 'South', SALES], [0.0] * 6),
+    (MINIF, [REGIONS, REGIONS, SALES], [1.0, 2.0, 0.0, 1.0, 5.0, 2.0]),
+    (MINIF, [REGIONS, 'North', SALES], [5.0] * 6),
+]
+
+@pytest.mark.parametrize("sheet_function,args,expected", CONDITIONAL_AGGREGATE_TESTS)
+def test_conditional_aggregate_direct(sheet_function, args, expected):
+    pd.testing.assert_series_equal(sheet_function(*args), pd.Series(expected), check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize("aggregation,sheet_function", [('sum', SUMIF), ('mean', AVERAGEIF), ('max', MAXIF), ('min', MINIF)])
+def test_conditional_aggregate_same_as_pivot_and_merge(aggregation, sheet_function):
+    random = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Region': random.choice(['West', 'East', 'North', 'South'], 1000),
+        'Sales': random.random(1000)
+    }, index=random.permutation(1000))
+
+    pivot = df.pivot_table(index='Region', values='Sales', aggfunc=aggregation).reset_index()
+    merged = df.merge(pivot, on='Region', how='left', suffixes=('', '_aggregate'))
+
+    result = sheet_function(df['Region'], df['Region'], df['Sales'])
+    assert result.index.equals(df.index)
+    assert np.allclose(result.to_numpy(), merged['Sales_aggregate'].to_numpy())
+
+
+def test_conditional_aggregate_keeps_index():
+    regions = pd.Series(['a', 'b', 'a'], index=[10, 5, 0])
+    assert SUMIF(regions, regions, pd.Series([1, 2, 3], index=[10, 5, 0])).to_dict() == {10: 4, 5: 2, 0: 4}
+    assert COUNTIF(regions, 'a').to_dict() == {10: 2, 5: 2, 0: 2}
+
+
+# Tests of function in Mito
+CONDITIONAL_AGGREGATE_FORMULA_TESTS = [
+    ('=SUMIF(Region, Region, Sales)', [4, 2, 4]),
+    ("=SUMIF(Region, 'a', Sales)", [4, 4, 4]),
+    ('=COUNTIF(Region, Region)', [2, 1, 2]),
+    ('=AVERAGEIF(Region, Region, Sales)', [2, 2, 2]),
+    ('=MAXIF(Region, Region, Sales)', [3, 2, 3]),
+    ('=MINIF(Region, Region, Sales) + 1', [2, 3, 2]),
+]
+
+@pytest.mark.parametrize("formula,result", CONDITIONAL_AGGREGATE_FORMULA_TESTS)
+def test_conditional_aggregate_formula(formula, result):
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'Region': ['a', 'b', 'a'], 'Sales': [1, 2, 3]}))
+    mito.set_formula(formula, 0, 'C', add_column=True)
+    assert mito.get_column(0, 'C', as_list=True) == result
+
+
+def test_conditional_aggregate_formula_updates_when_column_changes():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'Region': ['a', 'b', 'a'], 'Sales': [1, 2, 3]}))
+    mito.set_formula('=SUMIF(Region, Region, Sales)', 0, 'C', add_column=True)
+    mito.set_formula('=10', 0, 'Sales')
+    assert mito.get_column(0, 'C', as_list=True) == [20, 10, 20]
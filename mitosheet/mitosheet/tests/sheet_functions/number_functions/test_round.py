@@ -42,6 +42,11 @@ def test_ROUND_valid_input_direct_default():
 ROUND_SERIES_TESTS = [
     ([.1111], pd.Series([2]), [.11]),
     ([.11], pd.Series([0]), [0]),
+    ([1.234, 1.234, 1.234], pd.Series([0, 1, 2]), [1, 1.2, 1.23]),
+    ([1.234, 1.234], pd.Series([1.0, -0.0]), [1.2, 1]),
+    ([1234.5, 1250, 2.5], pd.Series([-2, -2, 0]), [1200, 1200, 2]),
+    ([0.125, 0.375, 2.675], pd.Series([2, 2, 2]), [0.12, 0.38, 2.67]),
+    ([1234, 1234], pd.Series([1, -2]), [1234, 1200]),
 ]
 
 @pytest.mark.parametrize("data,decimals,rounded", ROUND_SERIES_TESTS)
@@ -49,6 +54,10 @@ def test_ROUND_valid_input_direct_series(data, decimals, rounded):
     series = pd.Series(data=data)
     assert ROUND(series, decimals).tolist() == rounded
 
+def test_ROUND_keeps_nans():
+    rounded = ROUND(pd.Series([1.25, None, 3.5]), pd.Series([1, 1, 0]))
+    assert rounded[0] == 1.2 and pd.isna(rounded[1]) and rounded[2] == 4
+
 
 @pytest.mark.parametrize("data,decimals,rounded", ROUND_VALID_TESTS)
 def test_ROUND_valid_input_sheet_formula_defaults_to_one(data, decimals, rounded):
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests that string functions on categorical series are identical to
+string functions on the same strings in an object series.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.sheet_functions.types import utils
+from mitosheet.sheet_functions.types.utils import convert_categories
+
+
+STRINGS = pd.Series(['abc', ' Def ', np.NaN, 'abc', 'x\x07y', 'Def', np.NaN, 'def'], index=[7, 6, 5, 4, 3, 2, 1, 0], name='A')
+CATEGORICAL_STRINGS = STRINGS.astype(pd.CategoricalDtype(['unused', 'abc', ' Def ', 'x\x07y', 'Def', 'def']))
+
+CATEGORICAL_TESTS = [
+    ('CLEAN', [], True),
+    ('LEFT', [], True),
+    ('LEFT', [2], True),
+    ('LEFT', [pd.Series([1, 2, 3, 4, 5, 6, 7, 8], index=STRINGS.index)], False),
+    ('LEN', [], False),
+    ('LOWER', [], True),
+    ('PROPER', [], True),
+    ('TRIM', [], True),
+    ('UPPER', [], True),
+    ('RIGHT', [2], False),
+    ('MID', [2, 2], False),
+    ('FIND', ['e'], False),
+    ('SUBSTITUTE', ['e', 'E'], False),
+    ('CONCAT', ['!'], False),
+    ('TYPE', [], False),
+]
+
+
+@pytest.mark.parametrize("function_name,args,categorical_output", CATEGORICAL_TESTS)
+def test_string_function_on_categorical_same_as_object(function_name, args, categorical_output):
+    result = FUNCTIONS[function_name](CATEGORICAL_STRINGS, *args)
+    object_result = FUNCTIONS[function_name](STRINGS, *args)
+
+    if categorical_output:
+        # NOTE: missing values stay missing in a categorical output
+        assert str(result.dtype) == 'category'
+        assert result[STRINGS.isna()].isna().all()
+        result = result.astype('object')[STRINGS.notna()]
+        object_result = object_result[STRINGS.notna()]
+    pd.testing.assert_series_equal(result, object_result, check_names=False)
+
+
+def test_lower_merges_categories_that_become_equal():
+    result = FUNCTIONS['LOWER'](CATEGORICAL_STRINGS)
+    assert list(result.cat.categories) == ['unused', 'abc', ' def ', 'x\x07y', 'def']
+
+
+@pytest.mark.parametrize("function_name", ['LOWER', 'LEN', 'TRIM', 'LEFT', 'TYPE'])
+def test_low_cardinality_string_function_same_as_every_row(monkeypatch, function_name):
+    strings = pd.Series(np.random.default_rng(0).choice(np.array(['abc', ' Def ', 'x', 'ghi '], dtype='object'), 5000))
+    result = FUNCTIONS[function_name](strings)
+    # Turn off calling the string function on the unique values only
+    monkeypatch.setattr(utils, 'UNIQUE_VALUE_CONVERSION_MIN_LENGTH', len(strings) + 1)
+    pd.testing.assert_series_equal(result, FUNCTIONS[function_name](strings))
+
+
+def test_convert_categories_converts_each_category_once():
+    converted_lengths = []
+    def conversion_function(series):
+        converted_lengths.append(len(series))
+        return series.str.upper()
+
+    result = convert_categories(CATEGORICAL_STRINGS, conversion_function, categorical_output=True)
+    assert converted_lengths == [len(CATEGORICAL_STRINGS.cat.categories)]
+    assert result.index.equals(STRINGS.index)
+    pd.testing.assert_series_equal(result.astype('object'), STRINGS.str.upper())
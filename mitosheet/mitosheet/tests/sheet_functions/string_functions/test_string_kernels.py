@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests that the string functions are identical to operating on
+each row of their (already converted) arguments one by one.
+"""
+import inspect
+
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions.sheet_function_utils import try_extend_series_to_index
+from mitosheet.sheet_functions.string_functions import (CLEAN, FIND, LEFT, MID,
+                                                        RIGHT, SUBSTITUTE, TRIM)
+
+
+def LIST_CLEAN(series):
+    return series.apply(lambda x:''.join([i if 32 <= ord(i) < 126 else "" for i in x]))
+
+def LIST_FIND(series, substrings):
+    substrings = try_extend_series_to_index(substrings, series.index)
+    return pd.Series([string.find(substring) + 1 for string, substring in zip(series, substrings)], index=series.index)
+
+def LIST_LEFT(series, num_chars=None):
+    if num_chars is None:
+        num_chars = pd.Series(data=[1] * series.size)
+    num_chars = try_extend_series_to_index(num_chars, series.index)
+    return pd.Series([string[:int(num_char)] for string, num_char in zip(series, num_chars)], index=series.index)
+
+def LIST_MID(series, start_loc, num_chars):
+    start_loc = try_extend_series_to_index(start_loc, series.index)
+    num_chars = try_extend_series_to_index(num_chars, series.index)
+    return pd.Series(
+        [string[start - 1: start - 1 + int(num_char)] for string, start, num_char in zip(series, start_loc, num_chars)],
+        index=series.index
+    )
+
+def LIST_RIGHT(series, num_chars=None):
+    if num_chars is None:
+        num_chars = pd.Series(data=[1] * series.size)
+    num_chars = try_extend_series_to_index(num_chars, series.index)
+    return pd.Series([string[-int(num_char):] if num_char > 0 else '' for string, num_char in zip(series, num_chars)], index=series.index)
+
+def LIST_SUBSTITUTE(series, old_text, new_text, count=None):
+    old_text = try_extend_series_to_index(old_text, series.index)
+    new_text = try_extend_series_to_index(new_text, series.index)
+    if count is None:
+        count = pd.Series(data=[-1])
+    # NOTE: a constant count is extended to every row, like all other arguments
+    count = try_extend_series_to_index(count, series.index)
+    return pd.Series(
+        [string.replace(old, new, c) for string, old, new, c in zip(series, old_text, new_text, count)],
+        index=series.index
+    )
+
+def LIST_TRIM(series):
+    return series.apply(lambda x: x.strip())
+
+
+STRINGS = pd.Series(['abcdef', '  a b  ', '', 'x\tyz\n', 'héllo wörld', 'aaaa', 'ab'], index=[10, 3, 5, 0, 1, 2, 8])
+
+# Each test is the sheet function, the reference sheet function, and the arguments to call them
+# with (after they have been converted to the right types by the decorators)
+STRING_KERNEL_TESTS = [
+    (CLEAN, LIST_CLEAN, [STRINGS]),
+    (CLEAN, LIST_CLEAN, [pd.Series(['a\x00b\x7fc\x7dd\x7ee', '\x1f \x20'], name='A')]),
+    (TRIM, LIST_TRIM, [STRINGS]),
+    (TRIM, LIST_TRIM, [pd.Series(['  a  '], name='A')]),
+    (FIND, LIST_FIND, [STRINGS, pd.Series(['a'])]),
+    (FIND, LIST_FIND, [STRINGS, pd.Series(['a', ' ', '', 'y', 'ö', 'aa', 'z'], index=STRINGS.index)]),
+    (FIND, LIST_FIND, [pd.Series(['abc']), pd.Series(['b', 'c'])]),
+    (FIND, LIST_FIND, [pd.Series(['a', 'b']), pd.Series(['a', 'b', 'c'])]),
+    (LEFT, LIST_LEFT, [STRINGS]),
+    (LEFT, LIST_LEFT, [STRINGS, pd.Series(['2'])]),
+    (LEFT, LIST_LEFT, [STRINGS, pd.Series(['0', '1', '2', '3', '-1', '1', '2'], index=STRINGS.index)]),
+    (LEFT, LIST_LEFT, [pd.Series(['abc']), pd.Series(['2', 'x'])]),
+    (RIGHT, LIST_RIGHT, [STRINGS]),
+    (RIGHT, LIST_RIGHT, [STRINGS, pd.Series([2])]),
+    (RIGHT, LIST_RIGHT, [STRINGS, pd.Series([0, 1, 2, 3, -1, 1, 100], index=STRINGS.index)]),
+    (RIGHT, LIST_RIGHT, [STRINGS, pd.Series([0.5, 1.5, 2.0, 3, -1, 1, 100], index=STRINGS.index)]),
+    (MID, LIST_MID, [STRINGS, pd.Series([2]), pd.Series([3])]),
+    (MID, LIST_MID, [STRINGS, pd.Series([0, 1, 2, 3, 1, 2, 1], index=STRINGS.index), pd.Series([3])]),
+    (MID, LIST_MID, [STRINGS, pd.Series([1, 1, 2, 2, 1, 2, 1], index=STRINGS.index), pd.Series([1, 2, 1, 2, 0, 2, 1], index=STRINGS.index)]),
+    (SUBSTITUTE, LIST_SUBSTITUTE, [STRINGS, pd.Series(['a']), pd.Series(['XY'])]),
+    (SUBSTITUTE, LIST_SUBSTITUTE, [STRINGS, pd.Series(['a']), pd.Series(['']), pd.Series([1])]),
+    (SUBSTITUTE, LIST_SUBSTITUTE, [
+        STRINGS,
+        pd.Series(['a', ' ', '', 'y', 'l', 'aa', 'b'], index=STRINGS.index),
+        pd.Series(['1', '2', '3', '1', '2', '3', '1'], index=STRINGS.index),
+        pd.Series([-1, 1, 2, -1, 1, 1, 0], index=STRINGS.index),
+    ]),
+]
+
+
+@pytest.mark.parametrize("sheet_function,list_sheet_function,args", STRING_KERNEL_TESTS)
+def test_string_kernel_identical_to_list_sheet_function(sheet_function, list_sheet_function, args):
+    # We test the function without its decorators, so we see its exact output
+    kernel = inspect.unwrap(sheet_function)
+    pd.testing.assert_series_equal(kernel(*args), list_sheet_function(*args))
+
+
+STRING_KERNEL_ERROR_TESTS = [
+    (LEFT, LIST_LEFT, [STRINGS, pd.Series(['2', '1.5', '1', '1', '1', '1', '1'], index=STRINGS.index)]),
+    (LEFT, LIST_LEFT, [pd.Series([], dtype='object')]),
+    (FIND, LIST_FIND, [pd.Series(['a', 'b', 'c']), pd.Series(['a', 'b'])]),
+    (MID, LIST_MID, [STRINGS, pd.Series([1.0]), pd.Series([1])]),
+]
+
+
+@pytest.mark.parametrize("sheet_function,list_sheet_function,args", STRING_KERNEL_ERROR_TESTS)
+def test_string_kernel_errors_like_list_sheet_function(sheet_function, list_sheet_function, args):
+    kernel = inspect.unwrap(sheet_function)
+    with pytest.raises(Exception):
+        list_sheet_function(*args)
+    with pytest.raises(Exception):
+        kernel(*args)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for utilities used in multiple sheet functions.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions.number_functions import MAX, MIN
+from mitosheet.sheet_functions.sheet_function_utils import (
+    reduce_series_with_shared_index, try_extend_series_to_index)
+
+
+CONSTANT_SERIES = [
+    pd.Series([1]),
+    pd.Series([1.5]),
+    pd.Series([1], dtype='int32'),
+    pd.Series([True]),
+    pd.Series(['abc']),
+    pd.Series([1], dtype='object'),
+    pd.Series(pd.to_datetime(['2021-01-01'])),
+    pd.Series(pd.to_datetime(['2021-01-01']).tz_localize('UTC')),
+    pd.Series([pd.Timedelta(days=1)]),
+    pd.Series([1], dtype='Int64'),
+]
+
+@pytest.mark.parametrize("series", CONSTANT_SERIES)
+def test_try_extend_series_to_index_same_as_repeating_value(series):
+    index = pd.Index([5, 3, 1, 2])
+    extended = try_extend_series_to_index(series, index)
+    pd.testing.assert_series_equal(extended, pd.Series([series.iloc[0]] * len(index), index=index))
+
+
+def test_try_extend_series_to_index_does_not_store_value_per_row():
+    extended = try_extend_series_to_index(pd.Series([1.5]), pd.RangeIndex(1_000_000))
+    assert extended.to_numpy().strides == (0,)
+    assert (extended + 1).tolist()[:2] == [2.5, 2.5]
+
+
+def test_try_extend_series_to_index_leaves_full_series():
+    series = pd.Series([1, 2, 3])
+    assert try_extend_series_to_index(series, pd.RangeIndex(3)) is series
+
+
+REDUCE_TESTS = [
+    [pd.Series([1, 5, 3]), pd.Series([4, 2, 6])],
+    [pd.Series([1, 5, 3]), pd.Series([4.5, np.NaN, 6])],
+    [pd.Series([np.NaN, 5.0, 3]), pd.Series([np.NaN, 2.0, 6]), pd.Series([1.0, 2.0, np.NaN])],
+    [pd.Series([1.0, 2.0], index=['a', 'b'])],
+    [pd.Series([float('inf'), 2.0]), pd.Series([float('-inf'), -2.0])],
+]
+
+@pytest.mark.parametrize("series_list", REDUCE_TESTS)
+def test_reduce_series_with_shared_index_same_as_dataframe(series_list):
+    pd.testing.assert_series_equal(reduce_series_with_shared_index(series_list, np.fmax), pd.DataFrame(series_list).max())
+    pd.testing.assert_series_equal(reduce_series_with_shared_index(series_list, np.fmin), pd.DataFrame(series_list).min())
+
+
+@pytest.mark.parametrize("series_list", [
+    [pd.Series([1, 2]), pd.Series([1, 2], index=[1, 0])],
+    [pd.Series([1, 2], index=[0, 0]), pd.Series([1, 2], index=[0, 0])],
+    [pd.Series([1, 2], dtype='int32'), pd.Series([1, 2])],
+])
+def test_reduce_series_with_shared_index_only_when_identical(series_list):
+    assert reduce_series_with_shared_index(series_list, np.fmax) is None
+
+
+def test_reduce_series_with_shared_index_does_not_share_memory():
+    series = pd.Series([1.0, 2.0])
+    result = reduce_series_with_shared_index([series], np.fmax)
+    assert not np.shares_memory(result.to_numpy(), series.to_numpy())
+
+
+def test_max_and_min_with_constants():
+    series = pd.Series([1.0, 5.0, np.NaN, 3.0], index=[3, 2, 1, 0])
+    pd.testing.assert_series_equal(MAX(series, 2, pd.Series([0, 10, 0, 0], index=[3, 2, 1, 0])), pd.Series([2.0, 10.0, np.NaN, 3.0], index=[3, 2, 1, 0]))
+    pd.testing.assert_series_equal(MIN(series, 2), pd.Series([1.0, 2.0, np.NaN, 2.0], index=[3, 2, 1, 0]))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests that every vectorized sheet function kernel is identical to
+its reference implementation.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.sheet_functions.sheet_function_utils import VECTORIZED_SHEET_FUNCTIONS
+
+NUM_ROWS = 500
+
+
+def _get_decorator_layers(sheet_function):
+    """
+    Returns the type and parameters of each decorator on the sheet function.
+    """
+    decorator_layers = []
+    while hasattr(sheet_function, 'mito_decorator') and hasattr(sheet_function, '__wrapped__'):
+        decorator_layers.append((sheet_function.mito_decorator_type, sheet_function.mito_decorator_params))
+        sheet_function = sheet_function.__wrapped__
+    return decorator_layers
+
+
+def _get_possible_args(series_type, index, include_nans):
+    """
+    Returns a variety of arguments of the given series type, as they are after 
+    being converted to this type by the decorators.
+    """
+    random = np.random.default_rng(0)
+    if series_type in ('float', 'int'):
+        possible_args = [
+            pd.Series(random.normal(0, 1000, NUM_ROWS), index=index),
+            # Values halfway between two numbers with few decimals
+            pd.Series(random.integers(-10 ** 6, 10 ** 6, NUM_ROWS) / 2 / 10.0 ** random.integers(0, 6, NUM_ROWS), index=index),
+            pd.Series(random.integers(-3, 8, NUM_ROWS).astype('float64'), index=index),
+            pd.Series(random.integers(-50, 50, NUM_ROWS), index=index),
+            pd.Series([2]),
+            pd.Series([1.5]),
+        ]
+    elif series_type == 'bool':
+        possible_args = [pd.Series(random.choice([True, False], NUM_ROWS), index=index), pd.Series([True])]
+    elif series_type == 'datetime':
+        possible_args = [pd.Series(pd.to_datetime(random.integers(0, 10 ** 9, NUM_ROWS), unit='s'), index=index)]
+    elif series_type == 'timedelta':
+        possible_args = [pd.Series(pd.to_timedelta(random.integers(0, 10 ** 6, NUM_ROWS), unit='s'), index=index)]
+    else:
+        possible_args = [
+            pd.Series(random.choice(['abc', ' Def ', 'x', '', 'ghi jkl'], NUM_ROWS), index=index),
+            pd.Series(['abc'])
+        ]
+
+    if include_nans:
+        for possible_arg in list(possible_args):
+            if possible_arg.size > 1 and possible_arg.dtype != 'bool':
+                possible_args.append(possible_arg.where(random.random(NUM_ROWS) > .1))
+    return possible_args
+
+
+def _get_arg_lists(sheet_function):
+    """
+    Returns a variety of lists of arguments to call the kernel of the sheet function 
+    with, which all share one shuffled index.
+    """
+    decorator_layers = _get_decorator_layers(sheet_function)
+    include_nans = all(decorator_type != 'filter_nans' for decorator_type, _ in decorator_layers)
+    index = pd.Index(np.random.default_rng(0).permutation(NUM_ROWS))
+
+    arg_params = sorted(
+        [params for decorator_type, params in decorator_layers if decorator_type == 'convert_arg_to_series_type'],
+        key=lambda params: params['arg_index']
+    )
+    possible_args = [
+        _get_possible_args(params['arg_target_series_type'], index, include_nans) for params in arg_params
+    ]
+
+    arg_lists = []
+    for num_args in range(len(arg_params) + 1):
+        # Optional arguments are the only ones that can be left out
+        if any(not params['optional'] for params in arg_params[num_args:]):
+            continue
+        arg_lists.extend(list(arg_list) for arg_list in itertools.product(*possible_args[:num_args]))
+    return arg_lists
+
+
+def test_vectorized_sheet_functions_are_registered():
+    assert 'ROUND' in VECTORIZED_SHEET_FUNCTIONS
+    for function_name, (kernel, _) in VECTORIZED_SHEET_FUNCTIONS.items():
+        # The kernel must be the innermost function of the sheet function
+        sheet_function = FUNCTIONS[function_name]
+        while hasattr(sheet_function, '__wrapped__'):
+            sheet_function = sheet_function.__wrapped__
+        assert sheet_function is kernel
+
+
+@pytest.mark.parametrize("function_name", VECTORIZED_SHEET_FUNCTIONS.keys())
+def test_vectorized_kernel_identical_to_reference_function(function_name):
+    kernel, reference_function = VECTORIZED_SHEET_FUNCTIONS[function_name]
+    arg_lists = _get_arg_lists(FUNCTIONS[function_name])
+    assert len(arg_lists) > 0
+
+    num_compared = 0
+    for arg_list in arg_lists:
+        try:
+            expected = reference_function(*arg_list)
+        except Exception:
+            with pytest.raises(Exception):
+                kernel(*arg_list)
+            continue
+
+        pd.testing.assert_series_equal(kernel(*arg_list), expected)
+        num_compared += 1
+
+    assert num_compared > 0
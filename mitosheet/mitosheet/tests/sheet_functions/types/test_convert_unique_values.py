@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for converting only the unique values of low cardinality series.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions.types import utils
+from mitosheet.sheet_functions.types.to_boolean_series import to_boolean_series
+from mitosheet.sheet_functions.types.to_datetime_series import (
+    to_datetime_series, to_datetime_series_from_string_series)
+from mitosheet.sheet_functions.types.to_float_series import (
+    to_float_series, to_float_series_from_string_series)
+from mitosheet.sheet_functions.types.to_int_series import to_int_series
+from mitosheet.sheet_functions.types.to_timedelta_series import to_timedelta_series
+from mitosheet.sheet_functions.types.utils import (
+    UNIQUE_VALUE_CONVERSION_MIN_LENGTH, convert_unique_values,
+    get_datetime_format, has_low_cardinality)
+
+
+def _repeat(values, num_rows=UNIQUE_VALUE_CONVERSION_MIN_LENGTH * 3):
+    """
+    Returns a low cardinality series with the given values repeated, and a
+    shuffled, duplicated index.
+    """
+    random = np.random.default_rng(0)
+    return pd.Series(
+        random.choice(np.array(values, dtype='object'), num_rows), 
+        index=random.integers(0, num_rows // 2, num_rows),
+        name='A'
+    )
+
+
+def test_has_low_cardinality():
+    assert has_low_cardinality(_repeat(['a', 'b', 'c']))
+    assert not has_low_cardinality(pd.Series(['a', 'b', 'c'] * 10))
+    assert not has_low_cardinality(pd.Series([str(i) for i in range(UNIQUE_VALUE_CONVERSION_MIN_LENGTH * 3)]))
+    assert not has_low_cardinality(pd.Series([[1]] * UNIQUE_VALUE_CONVERSION_MIN_LENGTH * 3))
+
+
+CONVERSION_TESTS = [
+    (lambda s: to_float_series_from_string_series(s, ('default', np.NaN)), ['1', '$1,000', '(5)', 'abc', '1.5M', np.NaN, 2]),
+    (lambda s: to_float_series_from_string_series(s, ('default', 0)), ['1', 'abc', np.NaN]),
+    (lambda s: s.map({'1': True, 'true': True, 'F': False}).fillna(False), ['1', 'true', 'F', 'x', None, np.NaN]),
+    (to_datetime_series_from_string_series, ['2021-01-01', '2021-02-03 10:00', 'abc', None]),
+    (to_datetime_series_from_string_series, ['12-31-2021', '01-05-2021', np.NaN]),
+    (to_datetime_series_from_string_series, ['12/31/2021', '01/05/2021']),
+    (lambda s: pd.to_timedelta(s, unit='s', errors='coerce'), ['1', '2.5', 'abc', np.NaN]),
+]
+
+
+@pytest.mark.parametrize("conversion_function,values", CONVERSION_TESTS)
+def test_convert_unique_values_same_as_converting_every_row(conversion_function, values):
+    series = _repeat(values)
+    assert has_low_cardinality(series)
+    pd.testing.assert_series_equal(
+        convert_unique_values(series, conversion_function),
+        conversion_function(series)
+    )
+
+
+def test_convert_unique_values_converts_each_unique_value_once():
+    converted_lengths = []
+    def conversion_function(series):
+        converted_lengths.append(len(series))
+        return series.str.len()
+    
+    series = _repeat(['a', 'bb', 'ccc'])
+    assert convert_unique_values(series, conversion_function).tolist() == series.str.len().tolist()
+    assert converted_lengths == [3]
+
+
+def test_convert_unique_values_does_not_merge_equal_values_of_different_types():
+    series = _repeat([True, 1, 1.0, '1'])
+    pd.testing.assert_series_equal(
+        convert_unique_values(series, lambda s: s.apply(type).astype('str')),
+        series.apply(type).astype('str')
+    )
+
+
+def test_convert_unique_values_converts_every_missing_value():
+    series = _repeat(['1', None])
+    with pytest.raises(Exception):
+        convert_unique_values(series, lambda s: to_float_series_from_string_series(s, ('default', np.NaN)))
+
+
+def test_convert_unique_values_errors_the_same():
+    series = _repeat(['1', 'abc'])
+    with pytest.raises(Exception):
+        convert_unique_values(series, lambda s: to_float_series_from_string_series(s, 'error'))
+
+
+@pytest.mark.parametrize("values", [
+    ['2021-01-01', '2021-02-03'],
+    ['12-31-2021', '01-05-2021', np.NaN],
+    ['12/31/2021', '01/05/2021'],
+    [np.NaN, None],
+])
+def test_get_datetime_format_same_on_unique_values(values):
+    series = _repeat(values)
+    assert get_datetime_format(series) == get_datetime_format(pd.Series(values))
+
+
+@pytest.mark.parametrize("conversion_function,values", [
+    (to_float_series, ['1', '$1,000', 'abc', np.NaN]),
+    (to_int_series, ['1', '$1,000', '-5']),
+    (to_boolean_series, ['1', 'true', 'F', 'x', np.NaN]),
+    (to_datetime_series, ['12-31-2021', '01-05-2021', np.NaN]),
+    (to_timedelta_series, ['1', '2.5', 'abc', np.NaN]),
+])
+def test_conversion_functions_same_when_converting_unique_values(monkeypatch, conversion_function, values):
+    series = _repeat(values)
+    unique_value_result = conversion_function(series)
+    # Turn off converting the unique values only
+    monkeypatch.setattr(utils, 'UNIQUE_VALUE_CONVERSION_MIN_LENGTH', len(series) + 1)
+    assert not has_low_cardinality(series)
+    pd.testing.assert_series_equal(unique_value_result, conversion_function(series))
@@ -54,3 +54,68 @@ def test_filter_nan(args, filtered_args):
     filter_function(*args)
 
 
+
+
+def _old_filter_nans(sheet_function):
+    """
+    The label based filter_nans, which the mask based one must be identical to.
+    """
+    from mitosheet.sheet_functions.sheet_function_utils import is_series_of_constant
+    from mitosheet.sheet_functions.types.utils import get_nan_indexes_metadata, put_nan_indexes_back
+
+    def wrapped_f(*args):
+        original_index, non_nan_index = get_nan_indexes_metadata(*args)
+        new_args = [
+            arg[non_nan_index] if isinstance(arg, pd.Series) and not is_series_of_constant(arg) else arg
+            for arg in args
+        ]
+        return put_nan_indexes_back(sheet_function(*new_args), original_index)
+    return wrapped_f
+
+
+def _return_first_arg(*args):
+    return args[0]
+
+def _return_sum(*args):
+    return args[0] + args[1]
+
+
+FILTER_NAN_IDENTICAL_TESTS = [
+    [pd.Series([1, 2, 3])],
+    [pd.Series([1, 2, 3], index=[2, 0, 1]), pd.Series([1.0, np.NaN, 3.0], index=[2, 0, 1])],
+    [pd.Series([True, False, True]), pd.Series([1.0, np.NaN, 3.0])],
+    [pd.Series(['a', 'b', None], index=['x', 'y', 'z']), 'ABC'],
+    [pd.Series(pd.to_datetime(['2021-01-01', None, '2021-01-03'])), pd.Series([1, 2, 3])],
+    [pd.Series([1, 2, 3]), pd.Series([np.NaN], index=[0])],
+    [pd.Series([1, 2, 3], index=[3, 4, 5]), pd.Series([1.0, np.NaN, 3.0], index=[5, 4, 3])],
+    [pd.Series([1.0, np.NaN]), pd.Series([np.NaN, 2.0])],
+    [pd.Series([1, 2, 3], dtype='Int64'), pd.Series([1.0, np.NaN, 3.0])],
+    [pd.Series(['a', 'b', 'c'], dtype='category'), pd.Series([1.0, np.NaN, 3.0])],
+]
+
+@pytest.mark.parametrize("args", FILTER_NAN_IDENTICAL_TESTS)
+def test_filter_nan_identical_to_label_filter_nans(args):
+    pd.testing.assert_series_equal(
+        filter_nans(_return_first_arg)(*args),
+        _old_filter_nans(_return_first_arg)(*args)
+    )
+
+
+def test_filter_nan_duplicate_index():
+    series = pd.Series([1.0, np.NaN, 3.0, 4.0], index=[0, 0, 1, 1])
+    other_series = pd.Series([1.0, 2.0, np.NaN, 4.0], index=[0, 0, 1, 1])
+
+    result = filter_nans(_return_sum)(series, other_series)
+    pd.testing.assert_series_equal(result, pd.Series([2.0, np.NaN, np.NaN, 8.0], index=[0, 0, 1, 1]))
+
+
+def test_filter_nan_keeps_order_of_filtered_rows():
+    series = pd.Series([4.0, np.NaN, 2.0, 1.0], index=[9, 3, 7, 1])
+
+    @filter_nans
+    def filter_function(series):
+        assert series.index.tolist() == [9, 7, 1]
+        return series * 2
+
+    result = filter_function(series)
+    pd.testing.assert_series_equal(result, pd.Series([8.0, np.NaN, 4.0, 2.0], index=[9, 3, 7, 1]))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for specializing sheet functions to the types of their arguments.
+"""
+import pandas as pd
+import pytest
+
+import mitosheet.sheet_functions.types.decorators as decorators
+from mitosheet.formula_compiler import SubexpressionCache, compile_formula
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.sheet_functions.types.specialize import (
+    SERIES_TYPE_BOOL, SERIES_TYPE_DATETIME, SERIES_TYPE_NUMBER,
+    SERIES_TYPE_STRING, SERIES_TYPE_TIMEDELTA, get_series_type,
+    specialize_sheet_function)
+from mitosheet.tests.test_utils import create_mito_wrapper_dfs
+
+
+@pytest.fixture
+def conversion_calls(monkeypatch):
+    """
+    Records the series type of every conversion done by the sheet function decorators.
+    """
+    calls = []
+    get_function_to_convert_to_series = decorators.get_function_to_convert_to_series
+    def counting_get_function_to_convert_to_series(arg_target_series_type):
+        calls.append(arg_target_series_type)
+        return get_function_to_convert_to_series(arg_target_series_type)
+
+    monkeypatch.setattr(decorators, 'get_function_to_convert_to_series', counting_get_function_to_convert_to_series)
+    return calls
+
+
+GET_SERIES_TYPE_TESTS = [
+    ('bool', SERIES_TYPE_BOOL),
+    ('datetime64[ns]', SERIES_TYPE_DATETIME),
+    ('timedelta64[ns]', SERIES_TYPE_TIMEDELTA),
+    ('int64', SERIES_TYPE_NUMBER),
+    ('float64', SERIES_TYPE_NUMBER),
+    ('object', SERIES_TYPE_STRING),
+]
+@pytest.mark.parametrize("dtype, series_type", GET_SERIES_TYPE_TESTS)
+def test_get_series_type(dtype, series_type):
+    assert get_series_type(dtype) == series_type
+
+
+def test_specialized_sum_skips_conversions(conversion_calls):
+    specialized_sum = specialize_sheet_function(FUNCTIONS['SUM'], [SERIES_TYPE_NUMBER, SERIES_TYPE_NUMBER])
+    assert specialized_sum is not FUNCTIONS['SUM']
+
+    result = specialized_sum(pd.Series([1, 2, 3]), pd.Series([1.5, 2.5, 3.5]))
+    assert conversion_calls == []
+
+    expected = FUNCTIONS['SUM'](pd.Series([1, 2, 3]), pd.Series([1.5, 2.5, 3.5]))
+    assert len(conversion_calls) > 0
+    assert result.equals(expected)
+
+
+def test_specialize_is_memoized():
+    assert specialize_sheet_function(FUNCTIONS['SUM'], [SERIES_TYPE_NUMBER]) is \
+        specialize_sheet_function(FUNCTIONS['SUM'], [SERIES_TYPE_NUMBER])
+
+
+@pytest.mark.parametrize("arg_series_types", [
+    [SERIES_TYPE_STRING, SERIES_TYPE_NUMBER],
+    [None, SERIES_TYPE_NUMBER],
+    [],
+])
+def test_does_not_specialize_when_conversion_needed(arg_series_types):
+    assert specialize_sheet_function(FUNCTIONS['SUM'], arg_series_types) is FUNCTIONS['SUM']
+
+
+def test_specialized_function_keeps_later_conversions(conversion_calls):
+    # The first argument to LEFT is converted to a string, which is not a no-op for a number
+    specialized_left = specialize_sheet_function(FUNCTIONS['LEFT'], [SERIES_TYPE_NUMBER, SERIES_TYPE_NUMBER])
+    result = specialized_left(pd.Series([123, 456]), pd.Series([1, 2]))
+    assert 'string' in conversion_calls
+    assert result.equals(FUNCTIONS['LEFT'](pd.Series([123, 456]), pd.Series([1, 2])))
+
+
+def test_compile_formula_specializes_number_columns():
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [1.0, 2.0, 3.0], 'C': ['1', '2', '3']})
+    compiled_formula = compile_formula("df['D'] = SUM(df['A'], df['B'] * 2)", df, SubexpressionCache())
+    assert len(compiled_formula.namespace) == 1
+
+    compiled_formula = compile_formula("df['D'] = SUM(df['A'], df['C'])", df, SubexpressionCache())
+    assert len(compiled_formula.namespace) == 0
+
+
+def test_formulas_on_number_columns_skip_conversions(conversion_calls):
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1, 2, 3], 'B': [1.5, 2.5, 3.5]}))
+    mito.set_formula('=SUM(A, B)', 0, 'C', add_column=True)
+    assert mito.get_column(0, 'C', as_list=True) == [2.5, 4.5, 6.5]
+    assert 'number' not in conversion_calls
+
+
+def test_formulas_on_string_columns_still_convert():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': ['1', '2', '3'], 'B': [1, 2, 3]}))
+    mito.set_formula('=SUM(A, B)', 0, 'C', add_column=True)
+    assert mito.get_column(0, 'C', as_list=True) == [2, 4, 6]
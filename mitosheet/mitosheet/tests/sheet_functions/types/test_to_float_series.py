@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for converting string series to float series.
+"""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions.types.to_float_series import (
+    convert_string_to_float, to_float_series_from_string_series)
+
+
+def _to_float_series_elementwise(string_series, on_uncastable_arg_element):
+    """
+    Converts the string series one element at a time, which is what
+    to_float_series_from_string_series must be identical to.
+    """
+    return string_series.apply(convert_string_to_float, on_uncastable_arg_element=on_uncastable_arg_element).astype('float64')
+
+
+STRING_SERIES_TESTS = [
+    ['1', '2', '3'],
+    ['1.5', ' 2 ', '-3', '+4', '1e5', '1_000', '-0', '.5', '5.'],
+    ['inf', '-inf', 'Infinity', 'nan', '-nan', ' NaN '],
+    ['$1', '-$1', '$-1', '(1)', '$(1)', '-(1)', '(-1)'],
+    ['123,12', '123,1245', '123,123', '123,123.00', '1,2,3', ',123'],
+    ['1 M', '1m', '1 Mil', '1 million', '1 B', '1 bil', '1 Billion', '1 Mb', 'mb'],
+    ['abc', '- $123', '123 456', '900-900-9000', '', ' ', '-', '$', '()'],
+    ['1', np.NaN, '2'],
+    ['1', 2, 3.5, True, '4'],
+    ['١٢٣', '1.5\n', '\t-2.5'],
+    ['0x10', '1e', 'e1', '1..2', '--1', '$$1', 'nanm'],
+]
+
+
+@pytest.mark.parametrize("data", STRING_SERIES_TESTS)
+@pytest.mark.parametrize("on_uncastable_arg_element", [('default', np.NaN), ('default', 0)])
+def test_to_float_series_from_string_series_same_as_elementwise(data, on_uncastable_arg_element):
+    string_series = pd.Series(data, name='A', index=[i * 2 for i in range(len(data))])
+    pd.testing.assert_series_equal(
+        to_float_series_from_string_series(string_series, on_uncastable_arg_element),
+        _to_float_series_elementwise(string_series, on_uncastable_arg_element)
+    )
+
+
+def test_to_float_series_from_string_series_random_strings_same_as_elementwise():
+    random.seed(0)
+    alphabet = '0123456789 .,-+$()eEMmBbilnafIN_'
+    data = [''.join(random.choice(alphabet) for _ in range(random.randint(0, 8))) for _ in range(5000)]
+    string_series = pd.Series(data, index=[0] * len(data))
+    pd.testing.assert_series_equal(
+        to_float_series_from_string_series(string_series, ('default', np.NaN)),
+        _to_float_series_elementwise(string_series, ('default', np.NaN))
+    )
+
+
+@pytest.mark.parametrize("data", [['1', 'abc'], ['$1', '1,2,3']])
+def test_to_float_series_from_string_series_errors_same_as_elementwise(data):
+    string_series = pd.Series(data)
+    with pytest.raises(Exception):
+        _to_float_series_elementwise(string_series, 'error')
+    with pytest.raises(Exception):
+        to_float_series_from_string_series(string_series, 'error')
+
+
+def test_to_float_series_from_string_series_none_raises_as_before():
+    string_series = pd.Series(['1', None])
+    with pytest.raises(Exception):
+        _to_float_series_elementwise(string_series, ('default', np.NaN))
+    with pytest.raises(Exception):
+        to_float_series_from_string_series(string_series, ('default', np.NaN))
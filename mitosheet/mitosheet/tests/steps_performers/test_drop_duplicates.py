@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from mitosheet.tests.test_utils import create_mito_wrapper_dfs, make_multi_index_header_df
@@ -50,4 +51,22 @@ def test_drop_duplicates_keeps_last():
     assert mito.dfs[0].equals(pd.DataFrame({0: [2, 1], 'B': [5, 3]}, index=[1, 2]))
     assert mito.transpiled_code == [
         'df1 = df1.drop_duplicates(subset=[0], keep=\'last\')'
-    ]
\ No newline at end of file
+    ]
+def test_drop_duplicates_with_changing_subset():
+    df = pd.DataFrame({'A': [1, 2, 1, 1], 'B': [4, 5, 4, 5], 'C': [None, 1.0, None, 1.0]})
+    mito = create_mito_wrapper_dfs(df)
+    for column_headers, keep in [(['A'], 'first'), (['A', 'B'], 'first'), (['A', 'B', 'C'], 'last'), (['B', 'C'], False)]:
+        mito.drop_duplicates(0, column_headers, keep, step_id='drop_duplicates_step')
+        assert mito.dfs[0].equals(df.drop_duplicates(subset=column_headers, keep=keep))
+
+def test_drop_duplicates_with_unhashable_values():
+    df = pd.DataFrame({'A': [[1], [1], [2]], 'B': [1, 1, 2]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.drop_duplicates(0, ['B'], 'first')
+    assert mito.dfs[0].equals(df.drop_duplicates(subset=['B']))
+
+def test_drop_duplicates_with_different_missing_values():
+    df = pd.DataFrame({'A': ['a', None, np.nan, None, 'a'], 'B': [1, 2, 3, 4, 5]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.drop_duplicates(0, ['A'], 'first')
+    assert mito.dfs[0].equals(df.drop_duplicates(subset=['A'], keep='first'))
@@ -33,6 +33,8 @@ from mitosheet.step_performers.filter import (
     FC_STRING_DOES_NOT_CONTAIN,
     FC_STRING_EXACTLY,
     FC_STRING_NOT_EXACTLY,
+    FilteredDataFrameView,
+    execute_filter_on_base,
 )
 from mitosheet.tests.test_utils import create_mito_wrapper, create_mito_wrapper_dfs
 
@@ -489,7 +491,7 @@ def test_transpile_triple_filter():
     )
 
     assert mito.transpiled_code == [
-        "df1 = df1[(df1['name'].apply(lambda val: any(s in str(val) for s in ['e', 'a']))) | (df1['name'] == 'Nate')]"
+        "df1 = df1[(df1['name'].str.contains('e|a', na=False)) | (df1['name'] == 'Nate')]"
     ]
 
 
@@ -667,7 +669,7 @@ def test_wrap_lines_on_single_filters():
     assert mito.dfs[0].equals(pd.DataFrame({"name": ["Aaron"]}, index=[2]))
 
     assert mito.transpiled_code == [
-        "df1 = df1[df1['name'].apply(lambda val: any(s in str(val) for s in ['A', 'A', 'A', 'A', 'A', 'A', 'A', 'A']))]"
+        "df1 = df1[df1['name'].str.contains('A', na=False)]"
     ]
 
 
@@ -755,7 +757,7 @@ def test_not_exactly_collapses_to_one_clause():
 
     assert mito.transpiled_code == [
         "df1 = df1[~df1['A'].isin([1, 2])]",
-        "df1 = df1[df1['B'].apply(lambda val: all(val != s for s in ['C', 'D']))]",
+        "df1 = df1[~df1['B'].isin(['C', 'D'])]",
         "df1 = df1[~df1['C'].isin(pd.to_datetime(['11-13-2021', '11-14-2021']))]",
     ]
 
@@ -800,7 +802,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: all(val > n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] > 2]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -808,7 +810,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: any(val > n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] > 1]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -816,7 +818,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: all(val >= n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] >= 2]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -824,7 +826,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: any(val >= n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] >= 1]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -832,7 +834,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: all(val == n for n in [1, 2]))]",
+        "df1 = df1[(df1['A'] == 1) & (df1['A'] == 2)]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -848,7 +850,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: all(val < n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] < 1]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -856,7 +858,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: any(val < n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] < 2]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -864,7 +866,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: all(val <= n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] <= 1]",
     ),
     (
         pd.DataFrame({"A": [1, 2, 3, 4, 5, 6, 7, 8, 9]}),
@@ -872,7 +874,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         1,
         2,
-        "df1 = df1[df1['A'].apply(lambda val: any(val <= n for n in [1, 2]))]",
+        "df1 = df1[df1['A'] <= 2]",
     ),
     (
         pd.DataFrame(
@@ -896,7 +898,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: all(val > d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] > pd.to_datetime('11-14-2021')]",
     ),
     (
         pd.DataFrame(
@@ -920,7 +922,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: any(val > d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] > pd.to_datetime('11-13-2021')]",
     ),
     (
         pd.DataFrame(
@@ -944,7 +946,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: all(val >= d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] >= pd.to_datetime('11-14-2021')]",
     ),
     (
         pd.DataFrame(
@@ -968,7 +970,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: any(val >= d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] >= pd.to_datetime('11-13-2021')]",
     ),
     (
         pd.DataFrame(
@@ -992,7 +994,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: all(val == d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[(df1['A'] == pd.to_datetime('11-13-2021')) & (df1['A'] == pd.to_datetime('11-14-2021'))]",
     ),
     (
         pd.DataFrame(
@@ -1040,7 +1042,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: all(val < d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] < pd.to_datetime('11-13-2021')]",
     ),
     (
         pd.DataFrame(
@@ -1064,7 +1066,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: any(val < d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] < pd.to_datetime('11-14-2021')]",
     ),
     (
         pd.DataFrame(
@@ -1088,7 +1090,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "And",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: all(val <= d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] <= pd.to_datetime('11-13-2021')]",
     ),
     (
         pd.DataFrame(
@@ -1112,7 +1114,7 @@ FILTER_TESTS_MULTIPLE_VALUES_PER_CONDITION = [
         "Or",
         "11-13-2021",
         "11-14-2021",
-        "df1 = df1[df1['A'].apply(lambda val: any(val <= d for d in pd.to_datetime(['11-13-2021', '11-14-2021'])))]",
+        "df1 = df1[df1['A'] <= pd.to_datetime('11-14-2021')]",
     ),
 ]
 
@@ -1136,3 +1138,284 @@ def test_filter_multiple_values_per_clause(
     )
 
     assert mito.transpiled_code == [transpiled_code]
+
+
+REDUCED_FILTER_TESTS = [
+    (
+        pd.Series([1, 2, 3, np.NaN, 5, 6]),
+        [FC_NUMBER_GREATER, FC_NUMBER_GREATER_THAN_OR_EQUAL, FC_NUMBER_LESS, FC_NUMBER_LESS_THAN_OR_EQUAL, FC_NUMBER_EXACTLY, FC_NUMBER_NOT_EXACTLY],
+        [[2, 4], [3, 3, 1], [5, 1, 2, 6], [7]],
+    ),
+    (
+        pd.Series(["abc", "bcd", np.NaN, "a.c", "a|c", 1, "ABC", "(a)"]),
+        [FC_STRING_CONTAINS, FC_STRING_DOES_NOT_CONTAIN, FC_STRING_EXACTLY, FC_STRING_NOT_EXACTLY],
+        [["a", "d"], ["b", "b"], ["a.c", "c"], ["a|c", "x"], ["(a)", "b"], ["abc", "bcd", "abc"]],
+    ),
+    (
+        pd.Series(pd.to_datetime(["11-12-2021", "11-13-2021", None, "11-14-2021"])),
+        [FC_DATETIME_GREATER, FC_DATETIME_GREATER_THAN_OR_EQUAL, FC_DATETIME_LESS, FC_DATETIME_LESS_THAN_OR_EQUAL, FC_DATETIME_EXACTLY, FC_DATETIME_NOT_EXACTLY],
+        [["11-12-2021", "11-13-2021"], ["11-14-2021", "11-12-2021", "11-13-2021"], ["11-13-2021", "11-13-2021"], ["11-13-2021", "11-1"]],
+    ),
+]
+
+
+@pytest.mark.parametrize("series,conditions,values_lists", REDUCED_FILTER_TESTS)
+@pytest.mark.parametrize("operator", ["And", "Or"])
+def test_filters_with_same_condition_identical_to_applying_each_filter(series, conditions, values_lists, operator):
+    from mitosheet.step_performers.filter import (
+        combine_filters, get_applied_filter, get_applied_filters_with_condition)
+
+    df = pd.DataFrame({"A": series})
+    for condition in conditions:
+        for values in values_lists:
+            filters = [{"condition": condition, "value": value} for value in values]
+            try:
+                expected = combine_filters(
+                    operator, [get_applied_filter(df, "A", filter_) for filter_ in filters]
+                )
+            except TypeError:
+                with pytest.raises(TypeError):
+                    get_applied_filters_with_condition(df, "A", operator, condition, filters)
+                continue
+            applied_filter = get_applied_filters_with_condition(df, "A", operator, condition, filters)
+            assert applied_filter.tolist() == expected.tolist()
+
+
+def test_transpile_multiple_does_not_contain_filters():
+    df1 = pd.DataFrame(data={"name": ["Nate", "Jake", "Aaron"]})
+    mito = create_mito_wrapper_dfs(df1)
+    mito.filters(
+        0,
+        "name",
+        "And",
+        [
+            {"condition": FC_STRING_DOES_NOT_CONTAIN, "value": "e"},
+            {"condition": FC_STRING_DOES_NOT_CONTAIN, "value": "J"},
+        ],
+    )
+
+    assert mito.dfs[0].equals(pd.DataFrame({"name": ["Aaron"]}, index=[2]))
+    assert mito.transpiled_code == [
+        "df1 = df1[~df1['name'].str.contains('e|J', na=False)]",
+    ]
+
+
+def test_transpile_multiple_contains_filters_with_groups_not_combined():
+    df1 = pd.DataFrame(data={"name": ["Nate", "Jake", "Aaron"]})
+    mito = create_mito_wrapper_dfs(df1)
+    mito.filters(
+        0,
+        "name",
+        "Or",
+        [
+            {"condition": FC_STRING_CONTAINS, "value": "(a)t"},
+            {"condition": FC_STRING_CONTAINS, "value": "J"},
+        ],
+    )
+
+    assert mito.dfs[0].equals(pd.DataFrame({"name": ["Nate", "Jake"]}))
+    assert mito.transpiled_code == [
+        "df1 = df1[(df1['name'].str.contains('(a)t', na=False)) | (df1['name'].str.contains('J', na=False))]",
+    ]
+
+
+def test_transpile_multiple_string_exactly_filters():
+    df1 = pd.DataFrame(data={"name": ["Nate", "Jake", "Aaron"]})
+    mito = create_mito_wrapper_dfs(df1)
+    mito.filters(
+        0,
+        "name",
+        "Or",
+        [
+            {"condition": FC_STRING_EXACTLY, "value": "Nate"},
+            {"condition": FC_STRING_EXACTLY, "value": "Aaron"},
+        ],
+    )
+
+    assert mito.dfs[0].equals(pd.DataFrame({"name": ["Nate", "Aaron"]}, index=[0, 2]))
+    assert mito.transpiled_code == [
+        "df1 = df1[df1['name'].isin(['Nate', 'Aaron'])]",
+    ]
+
+
+def _count_filter_computations(monkeypatch):
+    from mitosheet.step_performers import filter as filter_module
+
+    calls = []
+    get_filter_indexes = filter_module.get_filter_indexes
+    def counted_get_filter_indexes(*args):
+        calls.append(args[1])
+        return get_filter_indexes(*args)
+
+    monkeypatch.setattr(filter_module, "get_filter_indexes", counted_get_filter_indexes)
+    return calls
+
+
+def test_editing_filter_only_recomputes_edited_column(monkeypatch):
+    df = pd.DataFrame({"A": [1, 2, 3, 4, 5, 6], "B": [1, 1, 1, 0, 1, 1], "C": ["a", "b", "a", "a", "a", "a"]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 1)
+    mito.filter(0, "B", "And", FC_NUMBER_EXACTLY, 1)
+    mito.filter(0, "C", "And", FC_STRING_EXACTLY, "a")
+
+    calls = _count_filter_computations(monkeypatch)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 2)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 0)
+
+    assert calls == ["A", "A"]
+    assert mito.dfs[0].equals(df.iloc[[0, 2, 4, 5]])
+
+    mito.filter(0, "B", "And", FC_NUMBER_EXACTLY, 0)
+    assert calls == ["A", "A", "B"]
+    assert mito.dfs[0].equals(df.iloc[[3]])
+
+
+def test_filter_after_other_step_filters_new_dataframe():
+    df = pd.DataFrame({"A": [1, 2, 3, 4], "B": [1, 1, 0, 1]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 1)
+    mito.set_formula("=A * 10", 0, "C", add_column=True)
+    mito.filter(0, "B", "And", FC_NUMBER_EXACTLY, 1)
+    mito.filter(0, "C", "And", FC_NUMBER_LESS, 40)
+
+    assert mito.dfs[0].equals(pd.DataFrame({"A": [2], "B": [1], "C": [20]}, index=[1]))
+
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 0)
+    assert mito.dfs[0].equals(pd.DataFrame({"A": [1, 2], "B": [1, 1], "C": [10, 20]}, index=[0, 1]))
+
+
+def test_removing_filter_on_column_keeps_other_filters():
+    df = pd.DataFrame({"A": [1, 2, 3, 4], "B": [1, 1, 0, 1]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 1)
+    mito.filter(0, "B", "And", FC_NUMBER_EXACTLY, 1)
+    mito.filters(0, "A", "And", [])
+
+    assert mito.dfs[0].equals(df.iloc[[0, 1, 3]])
+
+    mito.filters(0, "B", "And", [{"filters": [], "operator": "Or"}])
+    assert mito.dfs[0].equals(df)
+
+
+def test_filter_steps_store_views_of_base_dataframe():
+    df = pd.DataFrame({"A": list(range(100)), "B": [i % 2 for i in range(100)], "C": ["a"] * 100})
+    mito = create_mito_wrapper_dfs(df)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER_THAN_OR_EQUAL, 10)
+    mito.filter(0, "B", "And", FC_NUMBER_EXACTLY, 0)
+    mito.filter(0, "C", "And", FC_STRING_EXACTLY, "a")
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER_THAN_OR_EQUAL, 20)
+
+    # Editing the filter on A reexecutes the filters after it, and as only the
+    # dataframe of the last step is read, these filter steps store views
+    steps = mito.mito_widget.steps_manager.steps
+    views = [steps[-3].post_state.dfs.get_unmaterialized(0), steps[-2].post_state.dfs.get_unmaterialized(0)]
+    assert all(isinstance(view, FilteredDataFrameView) for view in views)
+    assert all(view.base_df is steps[0].post_state.dfs[0] for view in views)
+    assert [len(view) for view in views] == [50, 50]
+
+    assert mito.dfs[0].equals(df[(df["A"] >= 20) & (df["B"] == 0)])
+
+
+def test_filter_keeping_few_rows_copies_them():
+    df = pd.DataFrame({"A": list(range(100))})
+    filtered_df = execute_filter_on_base(df, "A", "A", "And", [{"condition": FC_NUMBER_GREATER, "value": 95}])
+    assert isinstance(filtered_df, pd.DataFrame)
+    assert filtered_df.equals(df.iloc[96:])
+
+    # Filtering it again still filters the base dataframe
+    filtered_df = execute_filter_on_base(filtered_df, "A", "A", "And", [{"condition": FC_NUMBER_GREATER, "value": 50}])
+    assert isinstance(filtered_df, FilteredDataFrameView)
+    assert filtered_df.base_df is df
+    assert filtered_df.materialize().equals(df.iloc[51:])
+
+
+def test_filter_view_is_materialized_for_other_steps():
+    df = pd.DataFrame({"A": [1, 2, 3, 4], "B": [1, 1, 0, 1]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.filter(0, "A", "And", FC_NUMBER_GREATER, 1)
+    mito.set_formula("=A * 10", 0, "C", add_column=True)
+    mito.pivot_sheet(0, ["B"], [], {"A": ["sum"]})
+
+    assert mito.dfs[0].equals(pd.DataFrame({"A": [2, 3, 4], "B": [1, 0, 1], "C": [20, 30, 40]}, index=[1, 2, 3]))
+    assert mito.dfs[1].equals(pd.DataFrame({"B": [0, 1], "A sum": [3, 6]}))
+
+
+RANGE_FILTER_VALUES = {
+    FC_NUMBER_GREATER: [-1, 0, 2, 2.5, 9, 100, float("inf"), "2"],
+    FC_NUMBER_GREATER_THAN_OR_EQUAL: [-1, 0, 2, 2.5, 9, 100, float("inf"), "2"],
+    FC_NUMBER_LESS: [-1, 0, 2, 2.5, 9, 100, float("-inf"), "2"],
+    FC_NUMBER_LESS_THAN_OR_EQUAL: [-1, 0, 2, 2.5, 9, 100, float("-inf"), "2"],
+    FC_DATETIME_GREATER: ["2020-12-31", "2021-01-03", "2021-01-03 12:00", "2022-01-01", "2021-0"],
+    FC_DATETIME_GREATER_THAN_OR_EQUAL: ["2020-12-31", "2021-01-03", "2021-01-03 12:00", "2022-01-01", "2021-0"],
+    FC_DATETIME_LESS: ["2020-12-31", "2021-01-03", "2021-01-03 12:00", "2022-01-01", "2021-0"],
+    FC_DATETIME_LESS_THAN_OR_EQUAL: ["2020-12-31", "2021-01-03", "2021-01-03 12:00", "2022-01-01", "2021-0"],
+}
+
+RANGE_FILTER_COLUMNS = [
+    pd.Series([3, 0, 2, 9, 2, 5, 1, 2], index=[7, 6, 5, 4, 3, 2, 1, 0]),
+    pd.Series([3.0, np.NaN, 2.0, 9.5, 2.0, np.NaN, -1.0, 2.5]),
+    pd.Series(pd.to_datetime(["2021-01-03", None, "2021-01-01", "2021-01-05", "2021-01-03", "2021-01-02"])),
+]
+
+
+@pytest.mark.parametrize("series", RANGE_FILTER_COLUMNS)
+@pytest.mark.parametrize("condition", list(RANGE_FILTER_VALUES.keys()))
+def test_range_filters_with_sorted_index_same_as_scanning_column(monkeypatch, series, condition):
+    from mitosheet.step_performers import filter as filter_module
+    from mitosheet.step_performers.filter import get_applied_filter
+    from mitosheet.sorted_index_utils import get_sorted_index
+
+    df = pd.DataFrame({"A": series})
+    for value in RANGE_FILTER_VALUES[condition]:
+        filter_ = {"condition": condition, "value": value}
+        try:
+            expected_filter_indexes = get_applied_filter(df, "A", filter_)
+        except TypeError:
+            expected_filter_indexes = None
+
+        # We use the sorted index for every filter, no matter how many rows it keeps
+        monkeypatch.setattr(filter_module, "MAX_SORTED_INDEX_FILTER_FRACTION", 1)
+        get_sorted_index(df, "A", build_on_first_use=True)
+        if expected_filter_indexes is None:
+            with pytest.raises(TypeError):
+                get_applied_filter(df, "A", filter_)
+        else:
+            pd.testing.assert_series_equal(get_applied_filter(df, "A", filter_), expected_filter_indexes)
+        monkeypatch.undo()
+
+
+def test_repeated_range_filters_on_large_column():
+    df = pd.DataFrame({"A": np.random.default_rng(0).normal(0, 1000, 100000)})
+    for value in [3000, 2500, 2000, -2500, 0]:
+        for condition in [FC_NUMBER_GREATER, FC_NUMBER_LESS_THAN_OR_EQUAL]:
+            filtered_df = execute_filter_on_base(df, "A", "A", "And", [{"condition": condition, "value": value}])
+            expected_df = df[df["A"] > value] if condition == FC_NUMBER_GREATER else df[df["A"] <= value]
+            if isinstance(filtered_df, FilteredDataFrameView):
+                filtered_df = filtered_df.materialize()
+            assert filtered_df.equals(expected_df)
+
+
+CONTAINS_FILTER_COLUMNS = [
+    pd.Series(["abcd", "bcde", np.NaN, "abcd", "", "x a.c x", "ab", None, "ABCD"]),
+    pd.Series(["abc", 1, 2.5, True, "1"]),
+    pd.Series([np.NaN, None], dtype=object),
+]
+
+CONTAINS_FILTER_VALUES = ["abc", "bcd", "ab", "a", "", "zzz", "abc|bcde", "ab|", "a.c", "^ab", "1", "a c"]
+
+
+@pytest.mark.parametrize("series", CONTAINS_FILTER_COLUMNS)
+@pytest.mark.parametrize("condition", [FC_STRING_CONTAINS, FC_STRING_DOES_NOT_CONTAIN])
+def test_contains_filters_with_string_index_same_as_checking_every_row(monkeypatch, series, condition):
+    from mitosheet import string_index_utils
+    from mitosheet.step_performers.filter import get_applied_filter
+
+    df = pd.DataFrame({"A": series})
+    expected_filter_indexes = [df["A"].str.contains(value, na=False) for value in CONTAINS_FILTER_VALUES]
+    if condition == FC_STRING_DOES_NOT_CONTAIN:
+        expected_filter_indexes = [~expected for expected in expected_filter_indexes]
+
+    monkeypatch.setattr(string_index_utils, "THREADED", False)
+    assert string_index_utils.get_string_index(df, "A") is not None
+    for value, expected in zip(CONTAINS_FILTER_VALUES, expected_filter_indexes):
+        pd.testing.assert_series_equal(get_applied_filter(df, "A", {"condition": condition, "value": value}), expected)
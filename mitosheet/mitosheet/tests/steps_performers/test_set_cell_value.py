@@ -223,4 +223,55 @@ def test_set_cell_value_convert_datetime_to_none():
     mito.set_cell_value(0, 'A', 0, "NaT")
     assert mito.transpiled_code == [
         'df1.at[0, \'A\'] = None'
-    ]
\ No newline at end of file
+    ]
+
+@pytest.fixture
+def full_refreshes(monkeypatch):
+    """
+    Records each time the dependant columns of a set cell value are refreshed entirely.
+    """
+    import mitosheet.step_performers.set_cell_value as set_cell_value
+    calls = []
+    refresh_dependant_columns = set_cell_value.refresh_dependant_columns
+    def counting_refresh_dependant_columns(*args):
+        calls.append(1)
+        return refresh_dependant_columns(*args)
+    monkeypatch.setattr(set_cell_value, 'refresh_dependant_columns', counting_refresh_dependant_columns)
+    return calls
+
+def test_set_cell_value_row_wise_formulas_refresh_row(full_refreshes):
+    mito = create_mito_wrapper_dfs(pd.DataFrame(data={'A': [1, 2, 3]}, index=[10, 11, 12]))
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=IF(B > 3, "big", "small")', 0, 'C', add_column=True)
+    mito.set_formula('=SUM(A, B)', 0, 'D', add_column=True)
+    mito.set_cell_value(0, 'A', 11, 5)
+
+    assert len(full_refreshes) == 0
+    assert mito.get_column(0, 'B', as_list=True) == [2, 6, 4]
+    assert mito.get_column(0, 'C', as_list=True) == ['small', 'big', 'big']
+    assert mito.get_column(0, 'D', as_list=True) == [3, 11, 7]
+
+def test_set_cell_value_aggregate_formulas_refresh_column(full_refreshes):
+    mito = create_mito_wrapper_dfs(pd.DataFrame(data={'A': [1.0, 2.0, 3.0]}))
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=STDEV(B)', 0, 'C', add_column=True)
+    mito.set_cell_value(0, 'A', 0, 3)
+
+    assert len(full_refreshes) == 1
+    assert mito.get_column(0, 'C', as_list=True) == [pytest.approx(0.57735, 0.001)] * 3
+
+def test_set_cell_value_row_changing_dtype_refreshes_column(full_refreshes):
+    mito = create_mito_wrapper_dfs(pd.DataFrame(data={'A': [1, 2, 3]}))
+    mito.set_formula('=A', 0, 'B', add_column=True)
+    mito.set_cell_value(0, 'A', 0, 'NaN')
+
+    assert len(full_refreshes) == 1
+    assert mito.get_column(0, 'B', as_list=True)[1:] == [2, 3]
+
+def test_set_cell_value_string_to_datetime_refreshes_column(full_refreshes):
+    mito = create_mito_wrapper_dfs(pd.DataFrame(data={'A': ['2020-12-01', '2020-12-02']}))
+    mito.set_formula('=YEAR(A)', 0, 'B', add_column=True)
+    mito.set_cell_value(0, 'A', 0, '2021-12-01')
+
+    assert len(full_refreshes) == 1
+    assert mito.get_column(0, 'B', as_list=True) == [2021, 2020]
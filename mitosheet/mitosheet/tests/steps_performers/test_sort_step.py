@@ -6,9 +6,11 @@
 """
 Contains tests for sort edit events.
 """
+import numpy as np
 import pytest
 import pandas as pd
 
+from mitosheet.step_performers.sort import _sort_permutations
 from mitosheet.tests.test_utils import create_mito_wrapper_dfs
 
 SORT_TESTS = [
@@ -212,4 +214,70 @@ def test_transpile_sort_ascending_then_descending_valid():
     assert mito.transpiled_code == [
         'df1 = df1.sort_values(by=\'A\', ascending=True, na_position=\'first\')',
         'df1 = df1.sort_values(by=\'A\', ascending=False, na_position=\'last\')',
-    ]
\ No newline at end of file
+    ]
+def test_sort_by_multiple_columns():
+    df = pd.DataFrame(data={'A': [2, 1, 2, 1, None], 'B': ['a', 'b', 'b', 'a', 'c'], 'C': [1, 2, 3, 4, 5]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.sort(0, 'A', 'ascending', secondary_sort_keys=[('B', 'descending')])
+
+    assert mito.dfs[0]['C'].tolist() == [5, 2, 4, 3, 1]
+    assert mito.dfs[0].equals(df.sort_values(by=['A', 'B'], ascending=[True, False], na_position='first'))
+    assert mito.transpiled_code == [
+        'df1 = df1.sort_values(by=[\'A\', \'B\'], ascending=[True, False], na_position=\'first\')',
+    ]
+
+def test_sort_by_multiple_columns_keeps_order_of_ties():
+    df = pd.DataFrame(data={'A': [1, 1, 0, 0, 1, 0], 'B': [1, 0, 1, 0, 1, 0], 'C': [1, 2, 3, 4, 5, 6]})
+    mito = create_mito_wrapper_dfs(df)
+    mito.sort(0, 'A', 'descending', secondary_sort_keys=[('B', 'ascending')])
+
+    assert mito.dfs[0]['C'].tolist() == [2, 1, 5, 4, 6, 3]
+
+@pytest.mark.parametrize("data", [
+    [3, 1, 2, 5, 4],
+    [3, 1, None, 2, None, 5, 4],
+    [1, 2, 2, 3, 1, None],
+    [1, 2, 3, 4, None],
+    [None, 4, 3, 2, 1],
+    ['b', 'a', 'c', None],
+    ['a', 'b', 'b', 'c'],
+    pd.to_datetime(['2021-01-03', '2021-01-01', None, '2021-01-02']),
+])
+def test_toggle_sort_matches_sort_values(data):
+    df = pd.DataFrame(data={'A': data, 'B': range(len(data))})
+    mito = create_mito_wrapper_dfs(df)
+
+    # Toggling the sort skips the previous sort, so each direction sorts the original dataframe
+    for sort_direction in ['ascending', 'descending', 'ascending', 'descending']:
+        mito.sort(0, 'A', sort_direction, step_id='sort_step')
+        assert mito.dfs[0].equals(df.sort_values(
+            by='A', ascending=sort_direction == 'ascending', na_position='first' if sort_direction == 'ascending' else 'last'
+        ))
+
+def test_sort_random_data_matches_sort_values():
+    df = pd.DataFrame(data={
+        'A': np.random.randint(0, 10, size=1000).astype(float), 
+        'B': np.random.choice(['a', 'b', 'c'], size=1000), 
+        'C': np.random.permutation(1000)
+    })
+    df.loc[df.sample(n=100).index, 'A'] = None
+    mito = create_mito_wrapper_dfs(df)
+
+    for sort_keys in [[('A', 'ascending')], [('C', 'descending')], [('A', 'descending'), ('B', 'ascending')], [('B', 'ascending'), ('A', 'descending'), ('C', 'ascending')]]:
+        (column_header, sort_direction), secondary_sort_keys = sort_keys[0], sort_keys[1:]
+        mito.sort(0, column_header, sort_direction, secondary_sort_keys=secondary_sort_keys, step_id='sort_step')
+        assert mito.dfs[0].equals(df.sort_values(
+            by=[column_header for column_header, _ in sort_keys], 
+            ascending=[sort_direction == 'ascending' for _, sort_direction in sort_keys], 
+            na_position='first' if sort_direction == 'ascending' else 'last'
+        ))
+
+def test_toggle_sort_uses_cached_permutation():
+    df = pd.DataFrame(data={'A': np.random.permutation(100)})
+    mito = create_mito_wrapper_dfs(df)
+    mito.sort(0, 'A', 'ascending', step_id='sort_step')
+    mito.sort(0, 'A', 'descending', step_id='sort_step')
+
+    sort_permutations = _sort_permutations[id(mito.mito_widget.steps_manager.steps[0].final_defined_state.dfs[0])]
+    assert set(sort_permutations.keys()) == {(('A', 'ascending'),), (('A', 'descending'),)}
+    assert (sort_permutations[(('A', 'descending'),)][0] == sort_permutations[(('A', 'ascending'),)][0][::-1]).all()
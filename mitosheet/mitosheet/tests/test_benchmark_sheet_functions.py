@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the sheet function benchmarks and the data they run on.
+"""
+import pandas as pd
+import pytest
+
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.tests.benchmark_sheet_functions import (
+    DEFAULT_SIZES, benchmark_reference, compare_to_baselines,
+    get_arg_series_types, get_benchmark_cases, get_case_key, read_baselines,
+    run_benchmarks)
+from mitosheet.tests.data_generator import DTYPES, get_constant, get_series
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("with_nans", [False, True])
+def test_get_series(dtype, with_nans):
+    series = get_series(dtype, 1000, with_nans=with_nans)
+    assert len(series) == 1000
+    assert series.isna().any() == with_nans
+    assert series.equals(get_series(dtype, 1000, with_nans=with_nans))
+    assert not series.equals(get_series(dtype, 1000, with_nans=with_nans, seed=1))
+
+
+@pytest.mark.parametrize("dtype,expected_dtype", [
+    ('float', 'float64'),
+    ('int', 'int64'),
+    ('bool', 'bool'),
+    ('string', 'object'),
+    ('datetime', 'datetime64[ns]'),
+    ('timedelta', 'timedelta64[ns]'),
+])
+def test_get_series_dtype(dtype, expected_dtype):
+    assert str(get_series(dtype, 10).dtype) == expected_dtype
+    assert not isinstance(get_constant(dtype), pd.Series)
+
+
+@pytest.mark.parametrize("function_name,arg_series_types", [
+    ('ROUND', ['float']),
+    ('SUM', ['float', 'float']),
+    ('MID', ['string', 'int', 'int']),
+    ('IF', ['bool', 'series', 'series']),
+])
+def test_get_arg_series_types(function_name, arg_series_types):
+    assert get_arg_series_types(FUNCTIONS[function_name]) == arg_series_types
+
+
+def test_only_functions_with_many_args_take_constants():
+    assert len(get_benchmark_cases(['ROUND'])) == len(DTYPES) * 2
+    assert len(get_benchmark_cases(['SUM'])) == len(DTYPES) * 2 * 2
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(['SUM', 'DAY'], [100])
+    assert len(results) == len(get_benchmark_cases(['SUM', 'DAY']))
+
+    result = results[get_case_key('SUM', 'float', True, 'constant', 100)]
+    assert result is not None
+    assert result['rows_per_second'] > 0
+    assert result['relative_throughput'] > 0
+    assert result['peak_memory_bytes'] > 0
+
+    # DAY cannot convert numbers to dates
+    assert results[get_case_key('DAY', 'float', False, 'series', 100)] is None
+
+
+def test_compare_to_baselines():
+    # Rows per second are not compared, as they depend on the machine
+    baselines = {
+        'A': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+        'B': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+        'C': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+        'D': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+        'E': None,
+        'G': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+    }
+    results = {
+        'A': {'rows_per_second': 80, 'relative_throughput': .8, 'peak_memory_bytes': 120},
+        'B': {'rows_per_second': 100, 'relative_throughput': .7, 'peak_memory_bytes': 100},
+        'C': {'rows_per_second': 100, 'relative_throughput': 1, 'peak_memory_bytes': 130},
+        'D': None,
+        'E': None,
+        'F': {'rows_per_second': 1, 'relative_throughput': 1, 'peak_memory_bytes': 1},
+        'G': {'rows_per_second': 10, 'relative_throughput': 1, 'peak_memory_bytes': 100},
+    }
+    regressions = compare_to_baselines(results, baselines, .25)
+    assert len(regressions) == 3
+    assert [regression[0] for regression in regressions] == ['B', 'C', 'D']
+
+
+def test_benchmark_reference():
+    assert benchmark_reference(100) > 0
+
+
+def test_every_sheet_function_has_baselines_at_every_default_size():
+    baselines = read_baselines()
+    for num_rows in DEFAULT_SIZES:
+        for function_name, dtype, with_nans, arg_kind in get_benchmark_cases(list(FUNCTIONS.keys())):
+            case_key = get_case_key(function_name, dtype, with_nans, arg_kind, num_rows)
+            assert case_key in baselines
+            assert baselines[case_key] is None or 'relative_throughput' in baselines[case_key]
@@ -3,12 +3,14 @@
 
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
+import random
 import pytest
 from copy import deepcopy
 
 import pandas as pd
 from mitosheet.errors import MitoError
-from mitosheet.evaluation_graph_utils import create_column_evaluation_graph, topological_sort_columns, creates_circularity
+from mitosheet.evaluation_graph_utils import (add_column_dependency, create_column_evaluation_graph, create_column_evaluation_order, creates_circularity,
+                                              topological_levels_of_columns, topological_sort_columns)
 from mitosheet.tests.test_utils import create_mito_wrapper_dfs
 
 def test_create_column_evaluation_graph():
@@ -117,3 +119,151 @@ def test_simple_nested_cycle_is_cycle_error():
     with pytest.raises(MitoError) as edit_error_info:
         sort = topological_sort_columns(column_evaluation_graph)
     assert edit_error_info.value.type_ == 'circular_reference_error'
+
+
+# Test topological levels
+
+def test_topological_levels_linear():
+    column_evaluation_graph = {'A': set(['B']), 'B': set(['C']), 'C': set([])}
+    assert topological_levels_of_columns(column_evaluation_graph) == [['A'], ['B'], ['C']]
+
+def test_topological_levels_fan_out():
+    column_evaluation_graph = {'A': set(['B', 'C', 'D']), 'B': set([]), 'C': set([]), 'D': set([])}
+    levels = topological_levels_of_columns(column_evaluation_graph)
+    assert levels[0] == ['A']
+    assert sorted(levels[1]) == ['B', 'C', 'D']
+    assert len(levels) == 2
+
+def test_topological_levels_uses_longest_path():
+    column_evaluation_graph = {'A': set(['B', 'C']), 'B': set(['C']), 'C': set([])}
+    assert topological_levels_of_columns(column_evaluation_graph) == [['A'], ['B'], ['C']]
+
+def test_topological_levels_circular_errors():
+    column_evaluation_graph = {'A': set(['B']), 'B': set(['A'])}
+    with pytest.raises(MitoError):
+        topological_levels_of_columns(column_evaluation_graph)
+
+def test_refresh_fan_out_evaluates_all_levels():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1, 2, 3]}))
+    for i in range(10):
+        mito.set_formula(f'=A + {i}', 0, f'B{i}', add_column=True)
+    mito.set_formula('=' + ' + '.join(f'B{i}' for i in range(10)), 0, 'C', add_column=True)
+    mito.set_formula('=10', 0, 'A')
+
+    for i in range(10):
+        assert mito.get_column(0, f'B{i}', as_list=True) == [10 + i] * 3
+    assert mito.get_column(0, 'C', as_list=True) == [145] * 3
+
+def test_refresh_fan_out_reports_error():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=A + 2', 0, 'C', add_column=True)
+    mito.set_formula('="abc"', 0, 'A')
+
+    assert mito.get_column(0, 'A', as_list=True) == [1, 2, 3]
+    assert mito.get_column(0, 'B', as_list=True) == [2, 3, 4]
+
+
+# Test the column evaluation graph stored in the state is kept up to date
+
+def _assert_state_graph_matches_rebuilt_graph(mito):
+    post_state = mito.curr_step.post_state
+    for sheet_index in range(len(post_state.dfs)):
+        assert post_state.column_evaluation_graph[sheet_index] == create_column_evaluation_graph(post_state, sheet_index)
+
+def test_state_graph_updated_on_set_formula():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1], 'B': [2]}))
+    mito.set_formula('=A', 0, 'C', add_column=True)
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    mito.set_formula('=A + B', 0, 'C')
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    mito.set_formula('=B', 0, 'C')
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    assert mito.curr_step.column_evaluation_graph[0] == {'A': set(), 'B': {'C'}, 'C': set()}
+
+def test_state_graph_not_updated_on_circular_formula():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1]}))
+    mito.set_formula('=A', 0, 'B', add_column=True)
+    mito.set_formula('=B', 0, 'A')
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    assert mito.curr_step.column_evaluation_graph[0] == {'A': {'B'}, 'B': set()}
+
+def test_state_graph_updated_on_rename_and_delete():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1]}))
+    mito.set_formula('=A', 0, 'B', add_column=True)
+    mito.set_formula('=B', 0, 'C', add_column=True)
+    mito.rename_column(0, 'A', 'D')
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    mito.delete_columns(0, ['C'])
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    assert mito.curr_step.column_evaluation_graph[0] == {'A': {'B'}, 'B': set()}
+
+def test_state_graph_updated_on_sheet_add_and_delete():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1]}), pd.DataFrame({'A': [1]}))
+    mito.set_formula('=A', 0, 'B', add_column=True)
+    mito.set_formula('=A', 1, 'C', add_column=True)
+    mito.duplicate_dataframe(1)
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    mito.delete_dataframe(0)
+    _assert_state_graph_matches_rebuilt_graph(mito)
+    assert mito.curr_step.column_evaluation_graph[0] == {'A': {'C'}, 'C': set()}
+
+
+
+# Test the dynamic topological order
+
+def _assert_valid_evaluation_order(column_evaluation_graph, column_evaluation_order):
+    for column_id, dependents in column_evaluation_graph.items():
+        for dependent in dependents:
+            assert column_evaluation_order[column_id] < column_evaluation_order[dependent]
+
+def test_add_column_dependency_repairs_order():
+    column_evaluation_graph = {'A': set(), 'B': set(), 'C': set()}
+    column_evaluation_order = {'A': 0, 'B': 1, 'C': 2}
+    # C depends on nothing, but A now depends on C
+    add_column_dependency(column_evaluation_graph, column_evaluation_order, 'A', 'C')
+    assert column_evaluation_graph == {'A': set(), 'B': set(), 'C': {'A'}}
+    _assert_valid_evaluation_order(column_evaluation_graph, column_evaluation_order)
+
+def test_add_column_dependency_circular_errors_without_modifying():
+    column_evaluation_graph = {'A': {'B'}, 'B': {'C'}, 'C': set()}
+    column_evaluation_order = create_column_evaluation_order(column_evaluation_graph)
+    should_not_modify = deepcopy((column_evaluation_graph, column_evaluation_order))
+    with pytest.raises(MitoError):
+        add_column_dependency(column_evaluation_graph, column_evaluation_order, 'A', 'C')
+    assert (column_evaluation_graph, column_evaluation_order) == should_not_modify
+
+def test_add_column_dependency_random_graphs_match_full_sort():
+    random.seed(0)
+    for _ in range(20):
+        column_ids = [str(i) for i in range(15)]
+        column_evaluation_graph = {column_id: set() for column_id in column_ids}
+        column_evaluation_order = create_column_evaluation_order(column_evaluation_graph)
+        for _ in range(40):
+            column_id, dependency = random.sample(column_ids, 2)
+            circular = creates_circularity(column_evaluation_graph, column_id, [], [dependency], column_evaluation_order=column_evaluation_order)
+            assert circular == creates_circularity(column_evaluation_graph, column_id, [], [dependency])
+            if circular:
+                with pytest.raises(MitoError):
+                    add_column_dependency(column_evaluation_graph, column_evaluation_order, column_id, dependency)
+            else:
+                add_column_dependency(column_evaluation_graph, column_evaluation_order, column_id, dependency)
+            _assert_valid_evaluation_order(column_evaluation_graph, column_evaluation_order)
+
+def test_long_chain_does_not_hit_recursion_limit():
+    column_evaluation_graph = {str(i): {str(i + 1)} for i in range(5000)}
+    column_evaluation_graph['5000'] = set()
+    column_evaluation_order = create_column_evaluation_order(column_evaluation_graph)
+    _assert_valid_evaluation_order(column_evaluation_graph, column_evaluation_order)
+    assert creates_circularity(column_evaluation_graph, '0', [], ['5000'], column_evaluation_order=column_evaluation_order)
+
+def test_state_evaluation_order_repaired_on_set_formula():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1], 'B': [2], 'C': [3]}))
+    mito.set_formula('=C + 1', 0, 'A')
+    mito.set_formula('=A + 1', 0, 'B')
+    post_state = mito.curr_step.post_state
+    _assert_valid_evaluation_order(post_state.column_evaluation_graph[0], post_state.column_evaluation_order[0])
+
+    mito.set_formula('=10', 0, 'C')
+    assert mito.get_column(0, 'A', as_list=True) == [11]
+    assert mito.get_column(0, 'B', as_list=True) == [12]
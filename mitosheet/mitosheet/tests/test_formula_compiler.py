@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for compiling formulas with shared subexpressions.
+"""
+import pandas as pd
+
+from mitosheet.formula_compiler import SubexpressionCache, compile_formula
+from mitosheet.sheet_functions import FUNCTIONS
+from mitosheet.tests.test_utils import create_mito_wrapper_dfs
+
+
+def _exec_with_counting_function(python_codes, df):
+    """
+    Executes the given formula code with a shared cache, where the function
+    COUNTED records how many times it is called.
+    """
+    calls = []
+    def COUNTED(series):
+        calls.append(1)
+        return series * 2
+
+    subexpression_cache = SubexpressionCache()
+    for python_code in python_codes:
+        compiled_formula = compile_formula(python_code, df, subexpression_cache)
+        value = eval(compiled_formula.value_code, {**FUNCTIONS, 'COUNTED': COUNTED, 'df': df, **subexpression_cache.namespace, **compiled_formula.namespace})
+        compiled_formula.assign(df, value)
+        subexpression_cache.invalidate_column(compiled_formula.written_column_key)
+
+    return len(calls)
+
+
+def test_shared_subexpression_computed_once():
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    num_calls = _exec_with_counting_function([
+        "df['B'] = COUNTED(df['A']) + 1",
+        "df['C'] = COUNTED(df['A']) + 2",
+        "df['D'] = SUM(COUNTED(df['A']), df['C'])",
+    ], df)
+
+    assert num_calls == 1
+    assert df['B'].tolist() == [3, 5, 7]
+    assert df['C'].tolist() == [4, 6, 8]
+    assert df['D'].tolist() == [6, 10, 14]
+
+
+def test_different_subexpressions_not_shared():
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
+    num_calls = _exec_with_counting_function([
+        "df['C'] = COUNTED(df['A'])",
+        "df['D'] = COUNTED(df['B'])",
+    ], df)
+
+    assert num_calls == 2
+    assert df['C'].tolist() == [2, 4, 6]
+    assert df['D'].tolist() == [8, 10, 12]
+
+
+def test_subexpression_invalidated_when_column_rewritten():
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [0, 0, 0]})
+    num_calls = _exec_with_counting_function([
+        "df['C'] = COUNTED(df['B'])",
+        "df['B'] = df['A'] + 1",
+        "df['D'] = COUNTED(df['B'])",
+    ], df)
+
+    assert num_calls == 2
+    assert df['C'].tolist() == [0, 0, 0]
+    assert df['D'].tolist() == [4, 6, 8]
+
+
+def test_constant_subexpressions_not_cached():
+    subexpression_cache = SubexpressionCache()
+    compile_formula("df['B'] = SUM(1, 2)", pd.DataFrame(), subexpression_cache)
+    assert subexpression_cache.column_dependencies == {}
+
+
+def test_refresh_with_shared_subexpressions():
+    mito = create_mito_wrapper_dfs(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=SUM(A, 1) * 2', 0, 'B', add_column=True)
+    mito.set_formula('=SUM(A, 1) * 3', 0, 'C', add_column=True)
+    mito.set_formula('=SUM(A, 1) + B', 0, 'D', add_column=True)
+    mito.set_formula('=10', 0, 'A')
+
+    assert mito.get_column(0, 'B', as_list=True) == [22, 22, 22]
+    assert mito.get_column(0, 'C', as_list=True) == [33, 33, 33]
+    assert mito.get_column(0, 'D', as_list=True) == [33, 33, 33]
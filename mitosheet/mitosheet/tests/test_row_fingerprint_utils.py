@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for finding duplicate rows from row fingerprints.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.row_fingerprint_utils import (_column_codes, get_column_codes,
+                                             get_duplicated,
+                                             get_row_fingerprints,
+                                             has_different_missing_values)
+
+
+@pytest.mark.parametrize("data", [
+    [1, 2, 1, 3, 2],
+    [1.0, -0.0, 0.0, None, np.nan, 1.0],
+    [True, False, True],
+    ['a', 'b', None, 'a', np.nan, None],
+    [1, '1', 1.0, True, 'a'],
+    pd.to_datetime(['2021-01-01', None, '2021-01-01', '2021-01-02']),
+    pd.Categorical(['a', 'b', 'a', None]),
+    pd.Series([1, None, 1], dtype='Int64'),
+])
+@pytest.mark.parametrize("keep", ['first', 'last', False])
+def test_get_duplicated_matches_pandas(data, keep):
+    df = pd.DataFrame({'A': data, 'B': 1})
+    for column_headers in [['A'], ['A', 'B'], ['B', 'A']]:
+        duplicated = get_duplicated(df, column_headers, keep)
+        if has_different_missing_values(df['A']):
+            # Only columns with different kinds of missing values fall back to pandas
+            assert duplicated is None
+        else:
+            assert (duplicated == df.duplicated(subset=column_headers, keep=keep).to_numpy()).all()
+
+
+@pytest.mark.parametrize("keep", ['first', 'last', False])
+def test_get_duplicated_random_data_matches_pandas(keep):
+    df = pd.DataFrame({
+        'A': np.random.randint(0, 5, size=1000), 
+        'B': np.random.choice(['a', 'b', None], size=1000), 
+        'C': np.random.choice([1.5, np.nan], size=1000)
+    })
+    for column_headers in [['A'], ['B'], ['A', 'C'], ['A', 'B', 'C']]:
+        assert (get_duplicated(df, column_headers, keep) == df.duplicated(subset=column_headers, keep=keep).to_numpy()).all()
+
+
+def test_row_fingerprints_do_not_overflow():
+    # Each column has 1000 distinct values, so combining all of them without
+    # renumbering would need 1000 ** 8 fingerprints
+    df = pd.DataFrame({column_header: np.random.permutation(1000) for column_header in range(8)})
+    df = pd.concat([df, df.iloc[::7]], ignore_index=True)
+    column_headers = list(range(8))
+
+    row_fingerprints = get_row_fingerprints(df, column_headers)
+    assert len(set(row_fingerprints)) == 1000
+    assert (get_duplicated(df, column_headers, 'first') == df.duplicated(keep='first').to_numpy()).all()
+
+
+def test_column_codes_are_cached():
+    df = pd.DataFrame({'A': [1, 2, 1], 'B': [1, 1, 1]})
+    codes, num_codes = get_column_codes(df, 'A')
+    assert codes.tolist() == [1, 2, 1]
+    assert num_codes == 3
+    assert get_column_codes(df, 'A')[0] is codes
+    assert set(_column_codes[id(df)].keys()) == {'A'}
+
+    get_duplicated(df, ['A', 'B'], 'first')
+    assert set(_column_codes[id(df)].keys()) == {'A', 'B'}
+    assert _column_codes[id(df)]['A'][0] is codes
+
+
+def test_column_codes_are_removed_with_dataframe():
+    df = pd.DataFrame({'A': [1, 2, 1]})
+    df_id = id(df)
+    get_column_codes(df, 'A')
+    assert df_id in _column_codes
+    del df
+    assert df_id not in _column_codes
+
+
+def test_missing_values_have_code_zero():
+    df = pd.DataFrame({'A': [None, 'a', None]})
+    assert get_column_codes(df, 'A')[0].tolist() == [0, 1, 0]
+    df = pd.DataFrame({'A': [np.nan, 'a', float('nan')]})
+    assert get_column_codes(df, 'A')[0].tolist() == [0, 1, 0]
+
+
+@pytest.mark.parametrize("data, has_different", [
+    (['a', None, None], False),
+    (['a', np.nan, float('nan')], False),
+    (['a', None, np.nan], True),
+    (['a', pd.NA, None], True),
+    ([1.0, np.nan, None], False),
+])
+def test_has_different_missing_values(data, has_different):
+    assert has_different_missing_values(pd.Series(data)) == has_different
+
+
+def test_different_missing_values_are_not_fingerprinted():
+    df = pd.DataFrame({'A': ['a', None, np.nan, 'a'], 'B': 1})
+    assert get_column_codes(df, 'A') is None
+    assert get_duplicated(df, ['A', 'B'], 'first') is None
+    # The column is only checked once
+    assert 'A' in _column_codes[id(df)]
+
+
+def test_unhashable_columns_are_not_fingerprinted():
+    df = pd.DataFrame({'A': [[1], [1], [2]]})
+    assert get_row_fingerprints(df, ['A']) is None
+    assert get_duplicated(df, ['A'], 'first') is None
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the sorted indexes of columns.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet.sorted_index_utils import SortedIndex, get_sorted_index
+
+
+def test_sorted_index_orders_values_and_skips_missing():
+    sorted_index = SortedIndex(pd.Series([3.0, np.NaN, 1.0, 3.0, 2.0], index=[10, 11, 12, 13, 14]))
+    assert sorted_index.positions.tolist() == [2, 4, 0, 3]
+    assert sorted_index.sorted_values.tolist() == [1.0, 2.0, 3.0, 3.0]
+    assert sorted_index.missing_positions.tolist() == [1]
+    assert len(sorted_index) == 5
+
+    assert sorted_index.searchsorted(3, 'left') == 2
+    assert sorted_index.searchsorted(3, 'right') == 4
+    assert sorted_index.searchsorted(0, 'left') == 0
+
+
+def test_sorted_index_of_datetimes_skips_missing():
+    sorted_index = SortedIndex(pd.Series(pd.to_datetime(['2021-01-02', None, '2021-01-01'])))
+    assert sorted_index.positions.tolist() == [2, 0]
+    assert sorted_index.missing_positions.tolist() == [1]
+    assert sorted_index.searchsorted(pd.Timestamp('2021-01-02').to_datetime64(), 'left') == 1
+
+
+def test_get_sorted_index_builds_on_second_use():
+    df = pd.DataFrame({'A': [2, 1, 3]})
+    assert get_sorted_index(df, 'A') is None
+    sorted_index = get_sorted_index(df, 'A')
+    assert sorted_index is not None
+    assert sorted_index.positions.tolist() == [1, 0, 2]
+    assert get_sorted_index(df, 'A') is sorted_index
+
+    # Each dataframe has its own sorted indexes
+    assert get_sorted_index(df.copy(), 'A') is None
+    assert get_sorted_index(df.copy(), 'A', build_on_first_use=True) is not None
+
+
+@pytest.mark.parametrize("data", [
+    ['a', 'b'],
+    [True, False],
+    pd.to_datetime(['2021-01-01']).tz_localize('UTC'),
+    np.array([1, 2], dtype='int32'),
+])
+def test_get_sorted_index_only_for_exact_dtypes(data):
+    df = pd.DataFrame({'A': data})
+    assert get_sorted_index(df, 'A', build_on_first_use=True) is None
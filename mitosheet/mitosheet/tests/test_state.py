@@ -6,6 +6,9 @@
 """
 Contains tests for the state class
 """
+from copy import copy, deepcopy
+
+from mitosheet.column_headers import ColumnIDMap
 from mitosheet.state import DATAFRAME_SOURCE_IMPORTED, DATAFRAME_SOURCE_PASSED, State
 import pandas as pd
 
@@ -29,3 +32,50 @@ def test_state_can_add_df_to_middle():
     
     assert state.df_sources == [DATAFRAME_SOURCE_IMPORTED]
 
+class _DataFrameView():
+    def __init__(self, df):
+        self.df = df
+        self.num_materialized = 0
+
+    def materialize(self):
+        self.num_materialized += 1
+        return self.df.copy()
+
+def test_state_materializes_views_when_read():
+    df = pd.DataFrame({'A': [123]})
+    view = _DataFrameView(df)
+    state = State([df, view], column_ids=ColumnIDMap([df, df]))
+
+    assert state.dfs.get_unmaterialized(1) is view
+    assert view.num_materialized == 0
+
+    assert state.dfs[1].equals(df)
+    assert view.num_materialized == 1
+    assert isinstance(state.dfs.get_unmaterialized(1), pd.DataFrame)
+    assert [df.equals(other_df) for other_df in state.dfs] == [True, True]
+    assert view.num_materialized == 1
+
+def test_state_copies_do_not_materialize_views():
+    df = pd.DataFrame({'A': [123]})
+    view = _DataFrameView(df)
+    state = State([df, view], column_ids=ColumnIDMap([df, df]))
+
+    for state_copy in [copy(state), deepcopy(state)]:
+        assert state_copy.dfs.get_unmaterialized(1) is view
+        assert state_copy.dfs.get_unmaterialized(0) is not df
+    assert view.num_materialized == 0
+
+    # Each state materializes its own dataframe, so modifying one does not modify the other
+    state_copy = copy(state)
+    state_copy.dfs[1]['A'] = 0
+    assert state.dfs[1].equals(df)
+    assert view.num_materialized == 2
+
+def test_state_iterates_over_materialized_dataframes():
+    df = pd.DataFrame({'A': [123]})
+    state = State([_DataFrameView(df), _DataFrameView(df), _DataFrameView(df)], column_ids=ColumnIDMap([df, df, df]))
+
+    assert all(isinstance(other_df, pd.DataFrame) for other_df in state.dfs[1:])
+    assert all(isinstance(other_df, pd.DataFrame) for other_df in reversed(state.dfs))
+    assert isinstance(state.dfs.pop(0), pd.DataFrame)
+    assert len(state.dfs) == 2
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the string indexes of columns.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mitosheet import string_index_utils
+from mitosheet.string_index_utils import StringIndex, get_string_index, get_trigrams
+
+STRINGS = pd.Series(['abcd', 'bcde', np.NaN, 'abcd', '', 'xabcx', 1, 'ab', None, 'ABCD'])
+
+
+def test_get_trigrams():
+    assert get_trigrams('abcd') == ['abc', 'bcd']
+    assert get_trigrams('ab') == []
+
+
+@pytest.mark.parametrize("substring", ['abc', 'bcd', 'abcd', 'ab', 'a', '', 'abcde', 'zzz', 'ABC', 'cx'])
+@pytest.mark.parametrize("max_trigram_index_values", [0, 100])
+def test_string_index_contains_same_as_str_contains(monkeypatch, substring, max_trigram_index_values):
+    monkeypatch.setattr(string_index_utils, 'MAX_TRIGRAM_INDEX_VALUES', max_trigram_index_values)
+    string_index = StringIndex(STRINGS)
+    assert (string_index.trigram_codes is None) == (max_trigram_index_values == 0)
+    assert string_index.contains(substring).tolist() == STRINGS.str.contains(substring, regex=False, na=False).tolist()
+
+
+def test_string_index_stores_each_value_once():
+    string_index = StringIndex(STRINGS)
+    assert len(string_index.values) == 7
+    assert string_index.codes.tolist() == [0, 1, -1, 0, 2, 3, 4, 5, -1, 6]
+    assert string_index.get_candidate_codes('abc').tolist() == [0, 3]
+
+
+def test_get_string_index_only_for_string_columns(monkeypatch):
+    monkeypatch.setattr(string_index_utils, 'THREADED', False)
+    df = pd.DataFrame({'A': ['a', 'b'], 'B': [1, 2], 'C': [1.0, 'a'], 'D': [[1], [2]]})
+
+    string_index = get_string_index(df, 'A')
+    assert string_index is not None
+    assert get_string_index(df, 'A') is string_index
+    assert get_string_index(df, 'B') is None
+    assert get_string_index(df, 'C') is not None
+    assert get_string_index(df, 'D') is None
+
+
+def test_get_string_index_builds_in_background():
+    df = pd.DataFrame({'A': ['a', 'b']})
+    get_string_index(df, 'A')
+
+    # Wait for the background thread to finish building
+    start = time.perf_counter()
+    while get_string_index(df, 'A') is None and time.perf_counter() - start < 10:
+        time.sleep(.01)
+    assert get_string_index(df, 'A') is not None
@@ -9,7 +9,7 @@ This file contains helpful functions and classes for testing operations.
 
 import json
 from functools import wraps
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from mitosheet.mito_widget import MitoWidget, sheet
@@ -256,6 +256,7 @@ class MitoWidgetTestWrapper:
             sheet_index: int, 
             column_headers: List[ColumnHeader], 
             keep: str,
+            step_id: Optional[str]=None
         ) -> bool:
 
         column_ids = [
@@ -269,7 +270,7 @@ class MitoWidgetTestWrapper:
                 'event': 'edit_event',
                 'id': get_new_id(),
                 'type': 'drop_duplicates_edit',
-                'step_id': get_new_id(),
+                'step_id': get_new_id() if step_id is None else step_id,
                 'params': {
                     'sheet_index': sheet_index,
                     'column_ids': column_ids,
@@ -391,13 +392,27 @@ class MitoWidgetTestWrapper:
             self, 
             sheet_index: int, 
             column_header: ColumnHeader,
-            sort_direction: str
+            sort_direction: str,
+            secondary_sort_keys: Optional[List[Tuple[ColumnHeader, str]]]=None,
+            step_id: Optional[str]=None
         ) -> bool:
 
-        column_id = self.mito_widget.steps_manager.curr_step.column_ids.get_column_id_by_header(
-            sheet_index,
-            column_header
-        )
+        column_ids = self.mito_widget.steps_manager.curr_step.column_ids
+        column_id = column_ids.get_column_id_by_header(sheet_index, column_header)
+
+        params: Dict[str, Any] = {
+            'sheet_index': sheet_index,
+            'column_id': column_id,
+            'sort_direction': sort_direction
+        }
+        if secondary_sort_keys is not None:
+            params['secondary_sort_keys'] = [
+                {
+                    'column_id': column_ids.get_column_id_by_header(sheet_index, key_column_header),
+                    'sort_direction': key_sort_direction
+                }
+                for key_column_header, key_sort_direction in secondary_sort_keys
+            ]
 
         return self.mito_widget.receive_message(
             self.mito_widget,
@@ -405,12 +420,8 @@ class MitoWidgetTestWrapper:
                 'event': 'edit_event',
                 'id': get_new_id(),
                 'type': 'sort_edit',
-                'step_id': get_new_id(),
-                'params': {
-                    'sheet_index': sheet_index,
-                    'column_id': column_id,
-                    'sort_direction': sort_direction
-                }
+                'step_id': get_new_id() if step_id is None else step_id,
+                'params': params
             }
         )
 
@@ -6,7 +6,7 @@ import { GraphObject, GraphType } from "./components/taskpanes/Graph/GraphSideba
 import { FileElement } from "./components/taskpanes/Import/ImportTaskpane";
 import { MergeType } from "./components/taskpanes/Merge/MergeTaskpane";
 import { AggregationType, PivotParams } from "./components/taskpanes/PivotTable/PivotTaskpane";
-import { ColumnID, ExcelFileMetadata, FeedbackID, FilterGroupType, FilterType, FormatTypeObj, MitoError, SearchMatches, SheetData } from "./types";
+import { ColumnID, ExcelFileMetadata, DuplicateCounts, FeedbackID, FilterGroupType, FilterPreview, FilterType, FormatTypeObj, MitoError, SearchMatches, SheetData } from "./types";
 
 
 /*
@@ -508,6 +508,56 @@ export default class MitoAPI {
         return undefined;
     }
 
+    /*
+        Gets the number of rows that the passed filters on the column would keep
+        and remove, each on their own and combined, without applying them
+    */
+    async getFilterPreview(
+        sheetIndex: number,
+        columnID: ColumnID,
+        filters: (FilterType | FilterGroupType)[],
+        operator: 'And' | 'Or'
+    ): Promise<FilterPreview | undefined> {
+
+        const filterPreviewString = await this.send<string>({
+            'event': 'api_call',
+            'type': 'get_filter_preview',
+            'sheet_index': sheetIndex,
+            'column_id': columnID,
+            'filters': filters,
+            'operator': operator
+        }, {})
+
+        if (filterPreviewString !== undefined && filterPreviewString !== '') {
+            return JSON.parse(filterPreviewString);
+        }
+        return undefined;
+    }
+
+    /*
+        Gets the number of rows that dropping duplicates on the columns would
+        keep and drop, without dropping them
+    */
+    async getDuplicateCounts(
+        sheetIndex: number,
+        columnIDs: ColumnID[],
+        keep: 'first' | 'last' | false
+    ): Promise<DuplicateCounts | undefined> {
+
+        const duplicateCountsString = await this.send<string>({
+            'event': 'api_call',
+            'type': 'get_duplicate_counts',
+            'sheet_index': sheetIndex,
+            'column_ids': columnIDs,
+            'keep': keep
+        }, {})
+
+        if (duplicateCountsString !== undefined && duplicateCountsString !== '') {
+            return JSON.parse(duplicateCountsString);
+        }
+        return undefined;
+    }
+
     /*
         Adds a column with the passed parameters
     */
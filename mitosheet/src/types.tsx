@@ -505,6 +505,23 @@ export interface SearchMatches {
     cellIndexes: {rowIndex: number, columnIndex: number}[];
 }
 
+export interface FilterRowCounts {
+    keptRows: number;
+    removedRows: number;
+}
+
+export interface FilterPreview {
+    numRows: number;
+    filters: FilterRowCounts[];
+    combined: FilterRowCounts;
+}
+
+export interface DuplicateCounts {
+    numRows: number;
+    keptRows: number;
+    droppedRows: number;
+}
+
 /**
  * Used to identify the feedback that the user is prompted for. 
  * When we add new feedback options, add it here!